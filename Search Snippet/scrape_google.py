@@ -11,7 +11,7 @@ current_dir = Path(__file__).resolve().parent
 project_root = current_dir.parent
 sys.path.append(str(project_root))
 
-from linkedin_scraper.core.browser import BrowserManager
+from linkedin_scraper.core.browser import BrowserManager, BROWSER_ENDPOINT_ENV
 from playwright.async_api import Page
 
 async def search_google(page: Page, query: str):
@@ -130,7 +130,7 @@ async def main():
     print(f"🚀 Starting Google search for {len(df)} profiles...")
     
     # Use HEADLESS=FALSE to avoid simple bot detection
-    async with BrowserManager(headless=False) as browser:
+    async with BrowserManager(headless=False, endpoint=os.environ.get(BROWSER_ENDPOINT_ENV)) as browser:
         page = browser.page
         
         for index, row in df.iterrows():
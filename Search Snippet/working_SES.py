@@ -4,72 +4,110 @@ import sys
 import os
 from pathlib import Path
 import random
+import time
 import urllib.parse
-from playwright.async_api import async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 current_dir = Path(__file__).resolve().parent
 sys.path.append(str(current_dir.parent))
 
-async def search_worker(context, semaphore, idx, url, df, target_column):
+from linkedin_scraper import BrowserManager
+from linkedin_scraper.core.browser import BROWSER_ENDPOINT_ENV
+from linkedin_scraper.core.hedging import HedgePolicy
+from linkedin_scraper.core.latency import LATENCY_STATE_FILE, latency_tracker
+
+# Concurrent tabs (also the size of the pooled page set)
+CONCURRENCY = 15
+
+# Timeouts until enough searches are timed; then derived from observed latency
+NAVIGATION_TIMEOUT = 60000
+RESULTS_TIMEOUT = 20000
+
+# Opt-in: race a search load past its p95 on a spare tab, at most this many
+# extra loads per load (e.g. 0.05), so one stalled tab doesn't hold up the batch
+HEDGE_BUDGET = None
+hedge = HedgePolicy(budget=HEDGE_BUDGET) if HEDGE_BUDGET else None
+
+async def search_worker(browser, semaphore, idx, url, df, target_column):
     async with semaphore:
         # Stagger start
         await asyncio.sleep(random.uniform(0.1, 3.0))
         
-        page = await context.new_page()
+        # Reuse a pooled tab instead of opening/closing one per URL
+        async with browser.lease_page() as page:
+            await search_with_page(page, idx, url, df, target_column)
+
+async def search_with_page(page, idx, url, df, target_column):
+    """Run one DuckDuckGo search on a leased page and record the best LinkedIn hit."""
+    try:
+        encoded = urllib.parse.quote(str(url))
+        search_url = f"https://duckduckgo.com/?q={encoded}"
+        
+        # Adaptive timeout (60s until enough searches are timed)
+        timeout = latency_tracker.timeout_ms("search_result", NAVIGATION_TIMEOUT)
+        if hedge:
+            # Continues on the spare tab if the hedge wins (records the latency too)
+            page, _ = await hedge.goto(page, search_url, "search_result", wait_until="load", timeout=timeout)
+        else:
+            start = time.monotonic()
+            try:
+                await page.goto(search_url, timeout=timeout)
+            except PlaywrightTimeoutError:
+                latency_tracker.record_timeout("search_result")
+                raise
+            latency_tracker.record("search_result", (time.monotonic() - start) * 1000)
+        
+        # Time only the wait for results (not the human delay below)
+        result_selector = "article[data-testid='result']"
+        timeout = latency_tracker.timeout_ms("search_result.content", RESULTS_TIMEOUT)
+        start = time.monotonic()
         try:
-            encoded = urllib.parse.quote(str(url))
-            search_url = f"https://duckduckgo.com/?q={encoded}"
-            
-            # 60s timeout
-            await page.goto(search_url, timeout=60000)
+            await page.wait_for_selector(result_selector, timeout=timeout)
+            latency_tracker.record("search_result.content", (time.monotonic() - start) * 1000)
+        except PlaywrightTimeoutError:
+            latency_tracker.record_timeout("search_result.content")
+        
+        # Robust wait (Increased for safety)
+        await asyncio.sleep(random.uniform(6.0, 12.0))
+
+        count = await page.locator(result_selector).count()
+        if count == 0:
+            df.at[idx, target_column] = "No Result Found"
+            return
+
+        found = False
+        for i in range(min(count, 5)):
+            res = page.locator(result_selector).nth(i)
+            title = await res.locator("h2").inner_text()
             
-            # Robust wait (Increased for safety)
-            await asyncio.sleep(random.uniform(6.0, 12.0))
+            display_url = ""
+            try:
+                display_url = await res.locator("a[data-testid='result-extras-url-link']").inner_text()
+            except:
+                pass
             
-            result_selector = "article[data-testid='result']"
+            snippet = ""
             try:
-                await page.wait_for_selector(result_selector, timeout=20000)
+                snippet = await res.locator("div[data-testid='result-snippet']").inner_text()
             except:
                 pass
-
-            count = await page.locator(result_selector).count()
-            if count == 0:
-                df.at[idx, target_column] = "No Result Found"
-                await page.close()
-                return
-
-            found = False
-            for i in range(min(count, 5)):
-                res = page.locator(result_selector).nth(i)
-                title = await res.locator("h2").inner_text()
-                
-                display_url = ""
-                try:
-                    display_url = await res.locator("a[data-testid='result-extras-url-link']").inner_text()
-                except:
-                    pass
-                
-                snippet = ""
-                try:
-                    snippet = await res.locator("div[data-testid='result-snippet']").inner_text()
-                except:
-                    pass
-                
-                if "linkedin" in title.lower() or "linkedin" in display_url.lower() or "linkedin" in snippet.lower():
-                    combined = f"{title}\n{display_url}\n{snippet}"
-                    df.at[idx, target_column] = combined
-                    found = True
-                    break
             
-            if not found:
-                 df.at[idx, target_column] = "No Relevant Result"
+            if "linkedin" in title.lower() or "linkedin" in display_url.lower() or "linkedin" in snippet.lower():
+                combined = f"{title}\n{display_url}\n{snippet}"
+                df.at[idx, target_column] = combined
+                found = True
+                break
+        
+        if not found:
+             df.at[idx, target_column] = "No Relevant Result"
 
-        except Exception as e:
-            df.at[idx, target_column] = f"Error: {e}"
-        finally:
-            await page.close()
+    except Exception as e:
+        df.at[idx, target_column] = f"Error: {e}"
+    finally:
+        if hedge:
+            await hedge.release(page)
 
-async def process_sheet(sheet_name, input_file, browser_context):
+async def process_sheet(sheet_name, input_file, browser):
     print(f"\n📂 Reading {input_file} (Sheet: {sheet_name})...")
     try:
         df = pd.read_excel(input_file, sheet_name=sheet_name, engine='openpyxl')
@@ -101,8 +139,8 @@ async def process_sheet(sheet_name, input_file, browser_context):
     print(f"🚀 Starting Search for {len(rows_to_process)} profiles in {sheet_name}...")
     
     # Reduced concurrency for safety (aiming for ~6 hours total)
-    semaphore = asyncio.Semaphore(15) 
-    batch_size = 15
+    semaphore = asyncio.Semaphore(CONCURRENCY) 
+    batch_size = CONCURRENCY
     
     output_filename = f"live_processed_{sheet_name}.xlsx"
     output_file = current_dir / output_filename
@@ -116,7 +154,7 @@ async def process_sheet(sheet_name, input_file, browser_context):
         
         batch_tasks = []
         for idx, url in batch:
-            task = asyncio.create_task(search_worker(browser_context, semaphore, idx, url, df, target_column))
+            task = asyncio.create_task(search_worker(browser, semaphore, idx, url, df, target_column))
             batch_tasks.append(task)
         
         await asyncio.gather(*batch_tasks)
@@ -146,10 +184,14 @@ async def main():
     
     print(f"found sheets: {sheet_names}")
 
-    # Launch browser once
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=False)
-        context = await browser.new_context()
+    # Timeouts start from the latencies earlier runs observed
+    latency_file = current_dir / LATENCY_STATE_FILE
+    latency_tracker.load(str(latency_file))
+
+    # Launch browser once, with one pre-warmed tab per concurrent search
+    # (attaches to browser_server.py instead if LINKEDIN_BROWSER_ENDPOINT is set)
+    async with BrowserManager(headless=False, page_pool_size=CONCURRENCY, endpoint=os.environ.get(BROWSER_ENDPOINT_ENV)) as browser:
+        await browser.start_page_pool()
         
         for sheet in sheet_names:
             # Skip Sheet1 if we already did it manually, OR verify if it's done.
@@ -159,12 +201,18 @@ async def main():
                 print(f"⚠️ Skipping {sheet} (Output file {output_filename} exists). Delete it to re-run.")
                 continue
                 
-            await process_sheet(sheet, input_file, context)
+            await process_sheet(sheet, input_file, browser)
+            
+            latency_tracker.save(str(latency_file))
+            if hedge:
+                stats = hedge.stats
+                print(f"   ⏱️ Hedged {stats['hedges']}/{stats['navigations']} searches, {stats['wins']} won, ~{stats['saved_ms'] / 1000:.0f}s saved")
             
             # Cool down between sheets
             await asyncio.sleep(5)
-
-        await browser.close()
+        
+        if hedge:
+            await hedge.close()
 
     print("\n✅ All Sheets Processed.")
 
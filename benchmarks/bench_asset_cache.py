@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark: static asset cache
+
+Runs the same stand-in pages through two fresh browsers that share one
+asset cache directory (a cold run, then a warm one) and reports hit rate,
+bytes served from disk and bytes fetched from the stand-in.
+
+Usage:
+    python benchmarks/bench_asset_cache.py --profiles 10
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+current_dir = Path(__file__).resolve().parent
+sys.path.append(str(current_dir.parent))
+
+from linkedin_scraper import BrowserManager
+from linkedin_scraper.core.asset_cache import AssetCache
+from standin import StandinServer
+
+
+async def run(server: StandinServer, cache_dir: str, count: int, label: str) -> None:
+    cache = AssetCache(cache_dir)
+    bytes_before = server.bytes_sent
+    start = time.perf_counter()
+
+    async with BrowserManager(headless=True, routing_profile="no-media", asset_cache=cache) as browser:
+        async with browser.lease_page() as page:
+            for i in range(count):
+                await page.goto(server.profile_url(f"bench-person-{i}"), wait_until="load")
+
+    stats = cache.stats
+    print(
+        f"{label:<5} {time.perf_counter() - start:>8.2f}s  hit rate {stats['hit_rate']:>5.0%}  "
+        f"from cache {stats['bytes_served'] / 1024:>8.0f} KB  "
+        f"from network {(server.bytes_sent - bytes_before) / 1024:>8.0f} KB"
+    )
+
+
+async def main(count: int, latency: float):
+    with StandinServer(latency=latency) as server, tempfile.TemporaryDirectory() as cache_dir:
+        await run(server, cache_dir, count, "cold")
+        await run(server, cache_dir, count, "warm")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure the static asset cache on the stand-in")
+    parser.add_argument("--profiles", "-n", type=int, default=10, help="Profiles to load per run")
+    parser.add_argument("--latency", type=float, default=0.0, help="Stand-in document latency in seconds")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.profiles, args.latency))
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark: launch profiles
+
+Runs the same stand-in workload (profile, experience and education pages
+per person) with N concurrent workers under each launch profile and
+reports peak and mean Chromium RSS, RSS per worker and pages per minute.
+
+Usage:
+    python benchmarks/bench_launch_profiles.py --workers 8 --profiles 40
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+current_dir = Path(__file__).resolve().parent
+sys.path.append(str(current_dir.parent))
+
+from linkedin_scraper import BrowserManager
+from linkedin_scraper.core.launch import LAUNCH_PROFILES
+from linkedin_scraper.core.recycle import chromium_rss
+from standin import StandinServer
+
+
+async def sample_rss(samples: list, stop: asyncio.Event, interval: float = 0.5) -> None:
+    while not stop.is_set():
+        rss = await asyncio.to_thread(chromium_rss)
+        if rss is not None:
+            samples.append(rss)
+        try:
+            await asyncio.wait_for(stop.wait(), interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def run_profile(server: StandinServer, launch_profile: str, workers: int, count: int) -> dict:
+    queue: asyncio.Queue = asyncio.Queue()
+    for i in range(count):
+        queue.put_nowait(server.profile_url(f"bench-person-{i}"))
+
+    pages = 0
+    samples: list = []
+    stop = asyncio.Event()
+
+    async with BrowserManager(headless=True, launch_profile=launch_profile, routing_profile="no-media") as browser:
+        await browser.start_context_pool(size=workers)
+
+        async def worker():
+            nonlocal pages
+            while not queue.empty():
+                url = queue.get_nowait()
+                async with browser.lease_context() as context, browser.lease_page(context) as page:
+                    for target in (url, url + "details/experience/", url + "details/education/"):
+                        await page.goto(target, wait_until="load")
+                        pages += 1
+
+        sampler = asyncio.create_task(sample_rss(samples, stop))
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        seconds = time.perf_counter() - start
+        stop.set()
+        await sampler
+
+    peak = max(samples) if samples else 0
+    return {
+        "profile": launch_profile,
+        "seconds": seconds,
+        "pages_per_minute": pages / seconds * 60,
+        "peak_mb": peak / 1_048_576,
+        "mean_mb": statistics.mean(samples) / 1_048_576 if samples else 0,
+        "per_worker_mb": peak / 1_048_576 / workers,
+    }
+
+
+async def main(workers: int, count: int, latency: float):
+    with StandinServer(latency=latency) as server:
+        results = [await run_profile(server, name, workers, count) for name in LAUNCH_PROFILES]
+
+    print(f"\n{workers} workers, {count} profiles (RSS needs Linux /proc)")
+    print(f"{'profile':<11} {'pages/min':>10} {'peak MB':>8} {'mean MB':>8} {'MB/worker':>10}")
+    for r in results:
+        print(
+            f"{r['profile']:<11} {r['pages_per_minute']:>10.0f} {r['peak_mb']:>8.0f} "
+            f"{r['mean_mb']:>8.0f} {r['per_worker_mb']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare launch profiles by memory and throughput on the stand-in")
+    parser.add_argument("--workers", "-w", type=int, default=8, help="Concurrent workers (contexts)")
+    parser.add_argument("--profiles", "-n", type=int, default=40, help="Profiles to load per launch profile")
+    parser.add_argument("--latency", type=float, default=0.0, help="Stand-in document latency in seconds")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.workers, args.profiles, args.latency))
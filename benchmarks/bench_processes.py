@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark: multi-process sharded scraping
+
+Scrapes the same set of stand-in profiles with bulk_scrape's --processes
+machinery at several process counts and reports profiles/minute and the
+speedup over a single process.
+
+Usage:
+    python benchmarks/bench_processes.py --profiles 40 --processes 1 2 4 --workers 2
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+current_dir = Path(__file__).resolve().parent
+sys.path.append(str(current_dir.parent))
+
+from bulk_scrape import RunOptions, run_sharded
+from standin import StandinServer
+
+
+async def run(server: StandinServer, count: int, processes: int, workers: int) -> float:
+    tasks = [(i, server.profile_url(f"bench-person-{i}")) for i in range(count)]
+    errors = 0
+
+    async def on_result(index, values):
+        nonlocal errors
+        if str(values.get("Name", "")).startswith("Error:"):
+            errors += 1
+
+    browser_options = {"headless": True, "routing_profile": "no-media"}
+    # Stand-in latencies must not end up in the real .latency_state.json
+    options = RunOptions(latency_state=None, session_wait=0)
+    start = time.perf_counter()
+    received = await run_sharded(tasks, processes, workers, browser_options, None, on_result, options)
+    elapsed = time.perf_counter() - start
+
+    if errors or received != count:
+        print(f"  warning: {errors} errors, {received}/{count} results")
+    return elapsed
+
+
+async def main(count: int, process_counts, workers: int, latency: float):
+    with StandinServer(latency=latency) as server:
+        baseline = None
+        print(f"{'processes':>9} {'time (s)':>9} {'profiles/min':>13} {'speedup':>8}")
+        for processes in process_counts:
+            elapsed = await run(server, count, processes, workers)
+            baseline = baseline or elapsed
+            print(f"{processes:>9} {elapsed:>9.1f} {count / elapsed * 60:>13.1f} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure --processes scaling on the stand-in")
+    parser.add_argument("--profiles", "-n", type=int, default=40, help="Profiles to scrape per run")
+    parser.add_argument("--processes", "-p", type=int, nargs="+", default=[1, 2, 4], help="Process counts to compare")
+    parser.add_argument("--workers", "-w", type=int, default=2, help="Workers per process")
+    parser.add_argument("--latency", type=float, default=0.2, help="Stand-in document latency in seconds")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.profiles, args.processes, args.workers, args.latency))
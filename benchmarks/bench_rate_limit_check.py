@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark: rate-limit detection latency
+
+Navigates to stand-in profile, experience and education pages and times
+detect_rate_limit() after each navigation, once with the default
+response-based check and once with the thorough slow path (full body text
+scan), and reports mean / p95 latency per navigation.
+
+Usage:
+    python benchmarks/bench_rate_limit_check.py --profiles 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+current_dir = Path(__file__).resolve().parent
+sys.path.append(str(current_dir.parent))
+
+from linkedin_scraper import BrowserManager
+from linkedin_scraper.core.utils import detect_rate_limit
+from standin import StandinServer
+
+
+async def run_mode(browser: BrowserManager, server: StandinServer, thorough: bool, count: int) -> dict:
+    latencies = []
+    async with browser.lease_page() as page:
+        for i in range(count):
+            url = server.profile_url(f"bench-person-{i}")
+            for target in (url, url + "details/experience/", url + "details/education/"):
+                response = await page.goto(target, wait_until="domcontentloaded")
+                start = time.perf_counter()
+                await detect_rate_limit(page, response, thorough=thorough)
+                latencies.append((time.perf_counter() - start) * 1000)
+
+    latencies.sort()
+    return {
+        "mode": "thorough" if thorough else "default",
+        "mean": statistics.mean(latencies),
+        "p95": latencies[int(0.95 * (len(latencies) - 1))],
+        "navigations": len(latencies),
+    }
+
+
+async def main(count: int):
+    with StandinServer() as server:
+        async with BrowserManager(headless=True, routing_profile="no-media") as browser:
+            results = [await run_mode(browser, server, thorough, count) for thorough in (False, True)]
+
+    print(f"\n{'mode':<9} {'navigations':>12} {'mean (ms)':>10} {'p95 (ms)':>9}")
+    for r in results:
+        print(f"{r['mode']:<9} {r['navigations']:>12} {r['mean']:>10.1f} {r['p95']:>9.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time rate-limit detection per navigation on the stand-in")
+    parser.add_argument("--profiles", "-n", type=int, default=20, help="Profiles to visit per mode")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.profiles))
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark: soft (in-app) navigation vs full page loads
+
+Scrapes the same stand-in profiles (top card, experience and education
+pages) on one pooled page, once with full ``goto`` navigation and once in
+soft-navigation mode, and reports per-profile latency, Chromium CPU time
+(Linux) and how many HTML documents vs route fetches the stand-in served.
+
+Usage:
+    python benchmarks/bench_soft_navigation.py --profiles 10 --latency 0.1
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+current_dir = Path(__file__).resolve().parent
+sys.path.append(str(current_dir.parent))
+
+from linkedin_scraper import BrowserManager, PersonScraper
+from linkedin_scraper.core.recycle import chromium_cpu_seconds
+from standin import StandinServer
+
+
+async def run_mode(server: StandinServer, soft_navigation: bool, count: int) -> dict:
+    documents_before = server.documents
+    api_before = server.api_requests
+    latencies = []
+
+    async with BrowserManager(headless=True, routing_profile="no-media", soft_navigation=soft_navigation) as browser:
+        cpu_before = chromium_cpu_seconds()
+        for i in range(count):
+            start = time.perf_counter()
+            async with browser.lease_page() as page:
+                scraper = PersonScraper(page, soft_navigation=soft_navigation)
+                person = await scraper.scrape(server.profile_url(f"bench-person-{i}"))
+                assert person.name
+            latencies.append(time.perf_counter() - start)
+        cpu_after = chromium_cpu_seconds()
+
+    return {
+        "mode": "soft" if soft_navigation else "goto",
+        "median": statistics.median(latencies),
+        "p90": sorted(latencies)[int(0.9 * (len(latencies) - 1))],
+        "cpu": (cpu_after - cpu_before) / count if cpu_before is not None and cpu_after is not None else None,
+        "documents": server.documents - documents_before,
+        "route_fetches": server.api_requests - api_before,
+    }
+
+
+async def main(count: int, latency: float):
+    with StandinServer(latency=latency) as server:
+        results = [await run_mode(server, soft, count) for soft in (False, True)]
+
+    print(f"\n{'mode':<5} {'median (s)':>11} {'p90 (s)':>8} {'CPU/profile (s)':>16} {'documents':>10} {'route fetches':>14}")
+    for r in results:
+        cpu = f"{r['cpu']:.2f}" if r["cpu"] is not None else "n/a"
+        print(f"{r['mode']:<5} {r['median']:>11.2f} {r['p90']:>8.2f} {cpu:>16} {r['documents']:>10} {r['route_fetches']:>14}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare soft navigation with full page loads on the stand-in")
+    parser.add_argument("--profiles", "-n", type=int, default=10, help="Profiles to scrape per mode")
+    parser.add_argument("--latency", type=float, default=0.0, help="Stand-in document latency in seconds")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.profiles, args.latency))
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cold start of the package and the CLI scripts
+
+Every measurement runs in a fresh interpreter. For the package it reports
+import time of a few typical entry points; for each CLI script it reports
+the import time of the script module and the wall time from interpreter
+start to the first navigation (BrowserManager start + goto on the
+stand-in), which is what a user waits for before anything happens.
+
+Pass --connect with a browser_server.py endpoint to measure attached starts.
+
+Usage:
+    python benchmarks/bench_startup.py --runs 3
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+current_dir = Path(__file__).resolve().parent
+project_root = current_dir.parent
+sys.path.append(str(project_root))
+
+from standin import StandinServer
+
+SCRIPTS = [
+    "bulk_scrape.py",
+    "scrape_single_profile.py",
+    "scrape_single_company.py",
+    "create_session.py",
+    "browser_server.py",
+    "Search Snippet/working_SES.py",
+    "Search Snippet/scrape_google.py",
+]
+
+IMPORTS = [
+    "import linkedin_scraper",
+    "from linkedin_scraper import Person",
+    "from linkedin_scraper.core import LinkedInScraperException",
+    "from linkedin_scraper import BrowserManager, PersonScraper",
+]
+
+# Runs in the child: import the script as a module (so main() does not run),
+# then start a browser the way the script does and navigate once.
+CHILD = """
+import asyncio, importlib.util, json, sys, time
+path, url, endpoint = sys.argv[1], sys.argv[2], sys.argv[3] or None
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location("script_under_test", path)
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+imported = time.perf_counter()
+
+async def navigate():
+    async with module.BrowserManager(headless=True, endpoint=endpoint) as browser:
+        await browser.page.goto(url, wait_until="domcontentloaded")
+
+if url and hasattr(module, "BrowserManager"):
+    asyncio.run(navigate())
+print(json.dumps({"import": imported - start}))
+"""
+
+
+def run_child(args: List[str]) -> Tuple[float, Dict[str, float]]:
+    """Run a child interpreter; return its wall time and the JSON it printed last."""
+    start = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, *args],
+        cwd=str(project_root),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed = time.perf_counter() - start
+    return elapsed, json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def measure_import(statement: str, runs: int) -> float:
+    code = f"import json, time; t = time.perf_counter(); {statement}; print(json.dumps({{'import': time.perf_counter() - t}}))"
+    return statistics.median(run_child(["-c", code])[1]["import"] for _ in range(runs))
+
+
+def measure_script(script: str, url: str, endpoint: Optional[str], runs: int) -> Dict[str, float]:
+    imports, totals = [], []
+    for _ in range(runs):
+        elapsed, output = run_child(["-c", CHILD, str(project_root / script), url, endpoint or ""])
+        totals.append(elapsed)
+        imports.append(output["import"])
+    return {"import": statistics.median(imports), "total": statistics.median(totals)}
+
+
+def main(runs: int, endpoint: Optional[str]):
+    print(f"\n{'import statement':<60} {'median (ms)':>12}")
+    for statement in IMPORTS:
+        print(f"{statement:<60} {measure_import(statement, runs) * 1000:>12.1f}")
+
+    with StandinServer() as server:
+        url = server.profile_url("bench-person-0")
+        mode = f"attached to {endpoint}" if endpoint else "launching Chromium"
+        print(f"\n{'script (' + mode + ')':<45} {'import (ms)':>12} {'first nav (s)':>14}")
+        for script in SCRIPTS:
+            result = measure_script(script, url, endpoint, runs)
+            print(f"{script:<45} {result['import'] * 1000:>12.1f} {result['total']:>14.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure package import time and script time-to-first-navigation")
+    parser.add_argument("--runs", "-n", type=int, default=3, help="Fresh interpreters per measurement")
+    parser.add_argument("--connect", default=None, help="browser_server.py endpoint to attach to instead of launching")
+    args = parser.parse_args()
+
+    main(args.runs, args.connect)
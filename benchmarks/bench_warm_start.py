@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark: persistent-profile warm start
+
+Measures time-to-first-profile (browser start, first PersonScraper run on
+the stand-in) for a fresh profile on every run (cold) and for a persistent
+profile directory reused between runs (warm). The warm profile is primed
+by one untimed run first.
+
+The request router is left in passthrough ("full") mode and the asset cache
+off, because Chromium bypasses its HTTP disk cache for routed requests.
+
+Usage:
+    python benchmarks/bench_warm_start.py --runs 5
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+current_dir = Path(__file__).resolve().parent
+sys.path.append(str(current_dir.parent))
+
+from linkedin_scraper import BrowserManager, PersonScraper
+from standin import StandinServer
+
+
+async def time_to_first_profile(server: StandinServer, user_data_dir: Optional[str]) -> float:
+    start = time.perf_counter()
+
+    async with BrowserManager(headless=True, routing_profile="full", user_data_dir=user_data_dir) as browser:
+        async with browser.lease_page() as page:
+            person = await PersonScraper(page).scrape(server.profile_url("bench-person-0"))
+            assert person.name
+
+    return time.perf_counter() - start
+
+
+async def main(runs: int, latency: float):
+    with StandinServer(latency=latency) as server, tempfile.TemporaryDirectory() as profile_dir:
+        cold = [await time_to_first_profile(server, None) for _ in range(runs)]
+
+        bytes_before = server.bytes_sent
+        await time_to_first_profile(server, profile_dir)
+        priming_bytes = server.bytes_sent - bytes_before
+
+        bytes_before = server.bytes_sent
+        warm = [await time_to_first_profile(server, profile_dir) for _ in range(runs)]
+        warm_bytes = (server.bytes_sent - bytes_before) / runs
+
+    print(f"\n{'mode':<5} {'median (s)':>11} {'min (s)':>8} {'max (s)':>8}")
+    for label, samples in (("cold", cold), ("warm", warm)):
+        print(f"{label:<5} {statistics.median(samples):>11.2f} {min(samples):>8.2f} {max(samples):>8.2f}")
+    print(f"\nfetched per run: cold {priming_bytes / 1024:.0f} KB, warm {warm_bytes / 1024:.0f} KB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare cold and warm (persistent profile) starts on the stand-in")
+    parser.add_argument("--runs", "-n", type=int, default=5, help="Timed runs per mode")
+    parser.add_argument("--latency", type=float, default=0.0, help="Stand-in document latency in seconds")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.runs, args.latency))
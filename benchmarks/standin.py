@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Offline LinkedIn Stand-in Server
+
+Serves fake profile, details and company pages with the same DOM structure
+the scrapers parse, plus the kind of payload a real page pulls in (hashed
+JS/CSS bundles, fonts, images, tracking beacons). Used by the benchmark
+scripts so changes can be measured without touching LinkedIn.
+
+URLs keep "linkedin.com/in/" in the path so the Person model accepts them:
+    http://127.0.0.1:<port>/linkedin.com/in/<slug>/
+    http://127.0.0.1:<port>/linkedin.com/in/<slug>/details/experience/
+    http://127.0.0.1:<port>/linkedin.com/company/<slug>/
+
+Slugs starting with "missing-" return a 404 page.
+
+The app bundle includes a small client-side router: on ``popstate`` it
+fetches the route from /api/route/<path> and swaps <main> in place, so
+soft (in-app) navigation can be compared with full page loads.
+
+Usage:
+    python benchmarks/standin.py --port 8765 --latency 0.2
+"""
+
+import argparse
+import hashlib
+import html
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+
+# Hashed bundle names, like a production build
+APP_BUNDLE = "/static/app.8c1f2e7a.js"
+VENDOR_BUNDLE = "/static/vendor.41d09b3c.js"
+STYLESHEET = "/static/style.a9e4c512.css"
+FONT = "/static/font.77b2d0f1.woff2"
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+def _payload(name: str, size: int) -> bytes:
+    """Deterministic filler bytes for a static asset."""
+    seed = hashlib.sha256(name.encode()).digest()
+    return (seed * (size // len(seed) + 1))[:size]
+
+
+# Client-side router shipped in the app bundle (history API + fetch, like an SPA)
+ROUTER_JS = """
+window.addEventListener('popstate', async () => {
+    const response = await fetch('/api/route' + location.pathname);
+    const doc = new DOMParser().parseFromString(await response.text(), 'text/html');
+    const main = doc.querySelector('main');
+    if (main) document.querySelector('main').replaceWith(document.adoptNode(main));
+    document.title = doc.title;
+});
+"""
+
+
+def _script(size: int, marker: str, prelude: str = "") -> bytes:
+    """A JS bundle of roughly `size` bytes that does some parse/exec work."""
+    body = prelude + f"window.{marker} = (window.{marker} || 0) + 1;\n"
+    filler = "function f{0}(a){{return a*{0}+{0}%7;}}\n"
+    parts = [body]
+    i = 0
+    while sum(len(p) for p in parts) < size:
+        parts.append(filler.format(i))
+        i += 1
+    return "".join(parts).encode()
+
+
+STATIC = {
+    APP_BUNDLE: ("application/javascript", _script(400_000, "__standinApp", ROUTER_JS)),
+    VENDOR_BUNDLE: ("application/javascript", _script(250_000, "__standinVendor")),
+    STYLESHEET: ("text/css", b"body{font-family:standin,sans-serif;margin:0}" + b"\n.x{color:#000}" * 4000),
+    FONT: ("font/woff2", _payload("font", 45_000)),
+}
+
+
+def _rng(slug: str) -> random.Random:
+    """Per-slug deterministic random generator."""
+    return random.Random(int(hashlib.md5(slug.encode()).hexdigest(), 16))
+
+
+def _head(title: str) -> str:
+    return (
+        f"<!doctype html><html><head><meta charset='utf-8'><title>{html.escape(title)}</title>"
+        f"<link rel='stylesheet' href='{STYLESHEET}'>"
+        f"<link rel='preload' as='font' href='{FONT}' crossorigin>"
+        f"<script src='{VENDOR_BUNDLE}' defer></script>"
+        f"<script src='{APP_BUNDLE}' defer></script>"
+        "</head><body>"
+        "<nav id='global-nav'><a class='global-nav__primary-link' href='/linkedin.com/feed/'>Home</a></nav>"
+    )
+
+
+def _tail() -> str:
+    return (
+        "<img src='/li/track?pixel=1' width='1' height='1' alt=''>"
+        "<script>navigator.sendBeacon && navigator.sendBeacon('/li/track', 'view');</script>"
+        "</body></html>"
+    )
+
+
+def _images(slug: str, count: int) -> str:
+    return "".join(
+        f"<img src='/media/{slug}-{i}.jpg' width='48' height='48' alt=''>" for i in range(count)
+    )
+
+
+def profile_page(slug: str) -> str:
+    """Top-card profile page."""
+    rng = _rng(slug)
+    name = slug.replace("-", " ").title()
+    city = rng.choice(["Seattle, Washington", "London, United Kingdom", "Berlin, Germany", "Austin, Texas"])
+    about = " ".join(rng.choice(["Building", "products", "for", "teams", "at", "scale", "and", "shipping"]) for _ in range(60))
+    return (
+        _head(f"{name} | LinkedIn")
+        + "<main>"
+        + "<section class='pv-top-card'>"
+        + f"<div class='pv-top-card-profile-picture'><img src='/media/{slug}-avatar.jpg' title='{html.escape(name)}'></div>"
+        + f"<h1>{html.escape(name)}</h1>"
+        + f"<span class='text-body-small inline t-black--light break-words'>{html.escape(city)}</span>"
+        + "</section>"
+        + "<section data-view-name='profile-card'>"
+        + "<div><span aria-hidden='true'>About</span></div>"
+        + f"<div><span aria-hidden='true'>{html.escape(about)}</span></div>"
+        + "</section>"
+        + f"<section>{_images(slug, 12)}</section>"
+        + "</main>"
+        + _tail()
+    )
+
+
+def _entity(logo_href: str, spans: list, description: str = "") -> str:
+    span_html = "".join(f"<span><span aria-hidden='true'>{html.escape(s)}</span></span>" for s in spans)
+    desc_html = f"<div>{html.escape(description)}</div>" if description else ""
+    return (
+        "<li class='pvs-list__paged-list-item'>"
+        "<div data-view-name='profile-component-entity'>"
+        f"<div><a href='{logo_href}'><img src='/media/logo-{sum(map(ord, logo_href)) % 97}.jpg' alt=''></a></div>"
+        f"<div><div><div>{span_html}</div></div>{desc_html}</div>"
+        "</div></li>"
+    )
+
+
+def experience_page(slug: str) -> str:
+    """details/experience page."""
+    rng = _rng(slug + "/experience")
+    items = []
+    for i in range(rng.randint(3, 12)):
+        company = f"Company {rng.randint(1, 500)}"
+        start = 2024 - i * 2
+        to = "Present" if i == 0 else str(start + 2)
+        items.append(_entity(
+            f"/linkedin.com/company/company-{i}/",
+            [rng.choice(["Engineer", "Founder", "Manager", "Director"]), company,
+             f"{start} - {to} · {2 if i else 1} yrs", "Remote"],
+            "Worked on things." * rng.randint(1, 5),
+        ))
+    return (
+        _head("Experience | LinkedIn")
+        + "<main><section><div class='pvs-list__container'><ul>"
+        + "".join(items)
+        + "</ul></div></section></main>"
+        + _tail()
+    )
+
+
+def education_page(slug: str) -> str:
+    """details/education page."""
+    rng = _rng(slug + "/education")
+    items = []
+    for i in range(rng.randint(1, 3)):
+        start = 2010 - i * 4
+        items.append(_entity(
+            f"/linkedin.com/school/school-{i}/",
+            [f"University {rng.randint(1, 50)}", "BSc, Computer Science", f"{start} - {start + 4}"],
+        ))
+    return (
+        _head("Education | LinkedIn")
+        + "<main><section><div class='pvs-list__container'><ul>"
+        + "".join(items)
+        + "</ul></div></section></main>"
+        + _tail()
+    )
+
+
+def company_page(slug: str) -> str:
+    """Company overview page."""
+    name = slug.replace("-", " ").title()
+    return (
+        _head(f"{name} | LinkedIn")
+        + "<main>"
+        + f"<h1>{html.escape(name)}</h1>"
+        + "<div class='org-top-card-summary-info-list__info-item'>Software Development</div>"
+        + "<div class='org-top-card-summary-info-list__info-item'>Seattle, Washington</div>"
+        + "<div class='org-top-card-summary-info-list__info-item'>10K+ employees</div>"
+        + f"<section><h2>About us</h2><p>{html.escape(name)} makes software.</p></section>"
+        + f"<section>{_images(slug, 6)}</section>"
+        + "</main>"
+        + _tail()
+    )
+
+
+def not_found_page() -> str:
+    """LinkedIn-style 404 page."""
+    return _head("Page not found | LinkedIn") + "<main><h1>This page doesn’t exist</h1></main>" + _tail()
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """Request handler for the stand-in server."""
+
+    server_version = "LinkedInStandin/1.0"
+
+    def log_message(self, format, *args):  # noqa: A002 - signature from base class
+        pass
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        server: "StandinServer" = self.server.standin  # type: ignore[attr-defined]
+        server.requests += 1
+
+        if path in STATIC:
+            content_type, body = STATIC[path]
+            self._send(200, body, content_type, IMMUTABLE)
+            return
+
+        if path.startswith("/media/"):
+            self._send(200, _payload(path, 20_000), "image/jpeg", "public, max-age=86400")
+            return
+
+        if path.startswith("/li/track"):
+            self._send(204, b"", "text/plain")
+            return
+
+        if path.startswith("/api/route/"):
+            # Route data for the client-side router (no document, no bundles)
+            status, page = self._route_document(path[len("/api/route"):])
+            server.api_requests += 1
+            server.delay()
+            self._send(status, page.encode(), "text/html; charset=utf-8", "no-cache")
+            return
+
+        status, page = self._route_document(path)
+        server.documents += 1
+        server.delay()
+        self._send(status, page.encode(), "text/html; charset=utf-8", "no-cache")
+
+    def do_POST(self):
+        self.do_GET()
+
+    def _route_document(self, path: str) -> Tuple[int, str]:
+        parts = [p for p in path.split("/") if p]
+        if len(parts) >= 3 and parts[0] == "linkedin.com" and parts[1] in ("in", "company"):
+            slug = parts[2]
+            if slug.startswith("missing-"):
+                return 404, not_found_page()
+            if parts[1] == "company":
+                return 200, company_page(slug)
+            if parts[3:5] == ["details", "experience"]:
+                return 200, experience_page(slug)
+            if parts[3:5] == ["details", "education"]:
+                return 200, education_page(slug)
+            if len(parts) == 3:
+                return 200, profile_page(slug)
+        if parts[:2] == ["linkedin.com", "feed"]:
+            return 200, _head("Feed | LinkedIn") + "<main><h1>Feed</h1></main>" + _tail()
+        return 404, not_found_page()
+
+    def _send(self, status: int, body: bytes, content_type: str, cache_control: Optional[str] = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if cache_control:
+            self.send_header("Cache-Control", cache_control)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+        self.server.standin.bytes_sent += len(body)  # type: ignore[attr-defined]
+
+
+class StandinServer:
+    """
+    Threaded stand-in server with configurable document latency.
+
+    Example:
+        with StandinServer(latency=0.2) as server:
+            url = server.profile_url("jane-doe")
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, jitter: float = 0.0):
+        """
+        Initialize stand-in server.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            latency: Delay before each HTML document is sent (seconds)
+            jitter: Extra random delay up to this many seconds
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.requests = 0
+        self.documents = 0
+        self.api_requests = 0
+        self.bytes_sent = 0
+
+        self._httpd = ThreadingHTTPServer((host, port), StandinHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.standin = self  # type: ignore[attr-defined]
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def profile_url(self, slug: str) -> str:
+        return f"{self.base_url}/linkedin.com/in/{slug}/"
+
+    def company_url(self, slug: str) -> str:
+        return f"{self.base_url}/linkedin.com/company/{slug}/"
+
+    def delay(self) -> None:
+        """Sleep for the configured document latency."""
+        wait = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0)
+        if wait > 0:
+            time.sleep(wait)
+
+    def start(self) -> "StandinServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "StandinServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve offline LinkedIn stand-in pages")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8765, help="Port to bind (default: 8765)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Delay per HTML document in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random delay per document in seconds")
+    args = parser.parse_args()
+
+    server = StandinServer(args.host, args.port, args.latency, args.jitter)
+    print(f"Stand-in serving at {server.base_url} (e.g. {server.profile_url('jane-doe')})")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
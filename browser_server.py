@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Long-Running Browser Server
+
+Starts Chromium once and keeps it alive so scraping scripts can attach to it
+over CDP instead of paying a full browser launch on every run.
+
+Usage:
+    python browser_server.py --headless
+
+Then, in another terminal:
+    export LINKEDIN_BROWSER_ENDPOINT=http://127.0.0.1:9222
+    python scrape_single_profile.py
+
+The bulk scraper takes the endpoint with --connect (or the same variable).
+Each client gets its own fresh browser contexts, which are dropped when the
+client disconnects. If Chromium crashes it is relaunched on the same port.
+Stop the server with Ctrl+C.
+
+Note: The debugging port gives full control of the browser; keep it bound to
+localhost.
+"""
+import asyncio
+import argparse
+import signal
+from playwright.async_api import async_playwright
+
+from linkedin_scraper.core.browser import BROWSER_ENDPOINT_ENV
+from linkedin_scraper.core.launch import LAUNCH_PROFILES, get_launch_profile, merge_args
+
+
+async def serve(host: str, port: int, headless: bool, launch_profile: str):
+    """Launch Chromium with a remote debugging port and relaunch it if it dies."""
+    profile = get_launch_profile(launch_profile)
+    args = merge_args(profile["args"], [
+        f"--remote-debugging-port={port}",
+        f"--remote-debugging-address={host}",
+    ])
+    
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # Windows: Ctrl+C raises KeyboardInterrupt instead
+            pass
+    
+    async with async_playwright() as playwright:
+        while not stop.is_set():
+            browser = await playwright.chromium.launch(headless=headless, args=args)
+            disconnected = asyncio.Event()
+            browser.on("disconnected", lambda _: disconnected.set())
+            
+            endpoint = f"http://{host}:{port}"
+            print(f"✓ Browser server ready at {endpoint} (headless={headless}, profile={launch_profile})")
+            print(f"  export {BROWSER_ENDPOINT_ENV}={endpoint}")
+            
+            stop_task = asyncio.create_task(stop.wait())
+            crash_task = asyncio.create_task(disconnected.wait())
+            await asyncio.wait({stop_task, crash_task}, return_when=asyncio.FIRST_COMPLETED)
+            stop_task.cancel()
+            crash_task.cancel()
+            
+            if stop.is_set():
+                await browser.close()
+                break
+            
+            print("⚠️  Browser exited unexpectedly, relaunching...")
+    
+    print("Browser server stopped")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keep a Chromium instance running for scrapers to attach to")
+    parser.add_argument("--host", default="127.0.0.1", help="Address the debugging port binds to (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=9222, help="Remote debugging port (default: 9222)")
+    parser.add_argument("--headless", action="store_true", help="Run in headless mode (no browser window)")
+    parser.add_argument("--launch-profile", default="default", choices=list(LAUNCH_PROFILES), help="Chromium switches to launch with (default: default)")
+    
+    args = parser.parse_args()
+    
+    try:
+        asyncio.run(serve(args.host, args.port, args.headless, args.launch_profile))
+    except KeyboardInterrupt:
+        print("Browser server stopped")
+
+
+if __name__ == "__main__":
+    main()
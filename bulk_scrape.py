@@ -7,14 +7,72 @@ and saves the data back to the same file in new columns.
 
 Usage:
     python bulk_scrape.py --input profiles.xlsx --workers 3 --headless
+    python bulk_scrape.py --input profiles.xlsx --processes 4 --workers 3 --headless
+    python bulk_scrape.py --input profiles.xlsx --user-data-dir .profile --headless
 """
 
 import asyncio
 import argparse
+import multiprocessing
+import os
+import queue as queue_module
+import time
 import pandas as pd
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from linkedin_scraper import BrowserManager, PersonScraper
-from linkedin_scraper.core.exceptions import LinkedInScraperException
+from linkedin_scraper.core.browser import BROWSER_ENDPOINT_ENV
+from linkedin_scraper.core.routing import ROUTING_PROFILES
+from linkedin_scraper.core.launch import LAUNCH_PROFILES
+from linkedin_scraper.core.asset_cache import AssetCache
+from linkedin_scraper.core.deadline import Deadline
+from linkedin_scraper.core.hedging import HedgePolicy
+from linkedin_scraper.core.latency import LATENCY_STATE_FILE, latency_tracker
+from linkedin_scraper.core.probe import probe_stats
+from linkedin_scraper.core.utils import rate_limit_stats
+from linkedin_scraper.scrapers.base import NAVIGATION_TIMEOUT
+from linkedin_scraper.core.exceptions import LinkedInScraperException, PageCrashedError, ProfileNotFoundError, SessionExpiredError, TaskTimeoutError
+from linkedin_scraper.core.session_health import SessionHealth
+from linkedin_scraper.core.watchdog import PageWatchdog
+
+SESSION_FILE = "linkedin_session.json"
+RESULT_COLUMNS = ['Name', 'Headline', 'Location', 'About', 'Job Title', 'Company', 'Founder Of', 'Incomplete']
+
+# Name written for dead, private or unavailable profiles: a final result, never retried
+UNAVAILABLE_PREFIX = "Unavailable:"
+
+# In --processes mode the single writer saves at most this often (seconds)
+SAVE_INTERVAL = 10.0
+
+# Wall-clock ceiling per profile (seconds) and tries before a stuck row is recorded as an error
+TASK_TIMEOUT = 180.0
+TASK_ATTEMPTS = 2
+
+# How long workers stay paused waiting for a refreshed session file (seconds)
+SESSION_WAIT = 3600.0
+
+@dataclass
+class RunOptions:
+    """
+    Run settings passed from the CLI down to every shard and worker.
+    
+    One picklable object instead of a growing list of positional
+    arguments, so a spawned shard receives it unchanged.
+    """
+    # Wall-clock ceiling per profile (seconds) and tries per stuck row
+    task_timeout: float = TASK_TIMEOUT
+    max_attempts: int = TASK_ATTEMPTS
+    # How long workers wait for a refreshed session file (seconds, 0: don't)
+    session_wait: float = SESSION_WAIT
+    # File the adaptive timeouts persist in (None: no persistence)
+    latency_state: Optional[str] = LATENCY_STATE_FILE
+    # Hedge budget for slow page loads (None: no hedging)
+    hedge_budget: Optional[float] = None
+    # Time budget per profile (seconds, None: unbounded)
+    profile_budget: Optional[float] = None
+    # Profiles each worker loads ahead of the one it extracts
+    lookahead: int = 0
 
 # Global lock for saving files to prevent write conflicts
 save_lock = asyncio.Lock()
@@ -26,150 +84,636 @@ async def save_data(df, file_path):
         # Run synchronous pandas I/O in a separate thread to avoid blocking the event loop
         await asyncio.to_thread(df.to_excel, file_path, index=False)
 
-async def scrape_worker(worker_id: int, queue: asyncio.Queue, browser: BrowserManager, df: pd.DataFrame, file_path: Path, url_column: str):
+def create_browser(browser_options: Dict[str, Any]) -> BrowserManager:
     """
-    Worker task to process URLs from the queue.
+    Build a BrowserManager from picklable options (shared by both run modes).
     """
-    print(f"Worker {worker_id} started.")
+    options = dict(browser_options)
+    asset_cache_dir = options.pop("asset_cache_dir", None)
+    # Hashed JS/CSS bundles are reused across contexts, runs and processes
+    if asset_cache_dir:
+        options["asset_cache"] = AssetCache(asset_cache_dir)
+    return BrowserManager(**options)
+
+async def load_session(browser: BrowserManager, session_file: Optional[str]) -> None:
+    """Load the saved session, warning (not failing) if it is missing."""
+    if not session_file:
+        return
+    try:
+        await browser.load_session(session_file)
+        print("Session loaded")
+    except Exception:
+        print("Warning: No session file found. You may hit auth walls.")
+
+def print_watchdog_report(watchdog: PageWatchdog, workers: int, wall_seconds: float, label: str = "") -> None:
+    """Print how much worker time went to useful work vs crashed/hung tasks."""
+    report = watchdog.report(workers, wall_seconds)
+    print(f"{label}Worker utilization: {report['utilization']:.0%} busy, {report['lost_ratio']:.0%} lost to stuck tasks "
+          f"({report['crashes']} crashes, {report['timeouts']} timeouts, {report['lost_seconds']}s lost)")
+
+def print_session_report(health: SessionHealth, label: str = "") -> None:
+    """Print how often the session expired mid-run and how long workers were paused."""
+    stats = health.stats
+    if stats['expiries']:
+        print(f"{label}Session expired {stats['expiries']}x, reloaded {stats['reloads']}x, "
+              f"workers paused {stats['paused_seconds']}s" + (" (gave up waiting)" if stats['gave_up'] else ""))
+
+def print_probe_stats(label: str = "") -> None:
+    """Print field-probe waits and rate-limit check latency for a finished run."""
+    stats = probe_stats.stats
+    print(f"{label}Field probes: {stats['probes']} ({stats['misses']} absent) | "
+          f"waited {stats['wait_ms'] / 1000:.1f}s, {stats['absent_wait_ms'] / 1000:.1f}s of it on absent fields")
+    checks = rate_limit_stats.stats
+    print(f"{label}Rate-limit checks: {checks['checks']} ({checks['detections']} detections) | "
+          f"mean {checks['mean_ms']}ms, max {checks['max_ms']}ms per navigation")
+
+def print_latency_report(label: str = "") -> None:
+    """Print observed latency percentiles and the timeouts derived from them."""
+    for key, stats in latency_tracker.stats.items():
+        if '.' in key:
+            continue
+        timeout = latency_tracker.timeout_ms(key, NAVIGATION_TIMEOUT)
+        print(f"{label}Latency {key}: p50 {stats['p50'] / 1000:.1f}s, p95 {stats['p95'] / 1000:.1f}s, "
+              f"p99 {stats['p99'] / 1000:.1f}s over {stats['count']} loads, {stats['timeouts']} timed out | timeout {timeout / 1000:.0f}s")
+
+def print_hedge_report(hedge: HedgePolicy, label: str = "") -> None:
+    """Print how many page loads were hedged and the tail latency that saved."""
+    stats = hedge.stats
+    print(f"{label}Hedged loads: {stats['hedges']} of {stats['navigations']} ({stats['hedge_ratio']:.1%}), "
+          f"{stats['wins']} won | ~{stats['saved_ms'] / 1000:.1f}s tail latency saved "
+          f"({stats['over_budget']} over budget, {stats['no_spare']} without a spare page)")
+
+def load_latency_state(path: Optional[str]) -> None:
+    """Seed the adaptive timeouts with latencies saved by earlier runs."""
+    if path and latency_tracker.load(path):
+        print(f"Latency state loaded from {path}")
+
+def print_browser_stats(browser: BrowserManager, label: str = "") -> None:
+    """Print request-blocking and asset-cache counters for a finished run."""
+    stats = browser.router.stats
+    print(f"{label}Requests blocked: {stats['blocked']} | allowed: {stats['allowed']} | "
+          f"~{stats['bytes_saved_estimate'] / 1_048_576:.1f} MB saved ({stats['profile']})")
+    if browser.asset_cache:
+        cache_stats = browser.asset_cache.stats
+        print(f"{label}Asset cache hit rate: {cache_stats['hit_rate']:.0%} "
+              f"({cache_stats['hits']} hits, {cache_stats['misses']} misses) | "
+              f"{cache_stats['bytes_served'] / 1_048_576:.1f} MB served from cache")
+    for entry in browser.recycle_history:
+        print(f"{label}Browser recycled ({entry['reason']}): {entry['pages_served']} pages, "
+              f"RSS {entry['rss_before_mb']} -> {entry['rss_after_mb']} MB, "
+              f"drain {entry['drain_seconds']}s, relaunch {entry['relaunch_seconds']}s")
+
+def person_to_row(person) -> Dict[str, Any]:
+    """
+    Convert a scraped Person into the values written to the result columns.
+    """
+    # Extract 'Founder Of' companies
+    founder_companies = []
+    if person.experiences:
+        for exp in person.experiences:
+            if not exp.position_title or not exp.institution_name:
+                continue
+            
+            # Check if title indicates founder status
+            title_lower = exp.position_title.lower()
+            is_founder = "founder" in title_lower
+            
+            # Check if currently active (to_date is None, 'Present', or empty)
+            is_current = not exp.to_date or str(exp.to_date).lower() == "present"
+            
+            if is_founder and is_current:
+                founder_companies.append(exp.institution_name)
     
-    while True:
-        try:
-            # Get a "unit of work" from the queue
-            index, row = await queue.get()
-        except asyncio.CancelledError:
-            break
+    return {
+        'Name': person.name,
+        # Person model doesn't have headline, removing it or keeping empty
+        'Headline': "",
+        'Location': person.location,
+        'About': person.about[:500] + "..." if person.about else "",
+        # Use helper properties from Person model
+        'Job Title': person.job_title,
+        'Company': person.company,
+        'Founder Of': ", ".join(founder_companies) if founder_companies else "",
+        # The per-profile budget ran out before every section was scraped
+        'Incomplete': "Yes" if person.incomplete else "",
+    }
+
+async def scrape_url(
+    browser: BrowserManager,
+    url: str,
+    label: str,
+    watchdog: Optional[PageWatchdog] = None,
+    hedge: Optional[HedgePolicy] = None,
+    profile_budget: Optional[float] = None,
+    turn: Optional[asyncio.Lock] = None,
+) -> Dict[str, Any]:
+    """
+    Scrape one profile in a leased worker context and return its result-column values.
+    
+    Failures are returned as an 'Error: ...' Name so the row is retried next run.
+    A crashed or hung page raises PageCrashedError/TaskTimeoutError instead,
+    after the leases have replaced the page (and context), so the caller can
+    retry the row right away. An expired session raises SessionExpiredError
+    so the caller can wait for a refreshed session and retry the row.
+    Dead or unavailable profiles are returned as an 'Unavailable: ...' Name,
+    which later runs skip. With a hedge policy, slow page loads are raced
+    on a spare page of the worker's context. With a profile_budget (seconds),
+    a profile that runs out of time is written with what was scraped and
+    flagged in the 'Incomplete' column.
+    
+    With a turn lock (pipelined workers), the profile starts loading as soon
+    as its page is leased, and is extracted once the worker's previous row
+    has released the lock.
+    """
+    try:
+        # Lease an isolated context and its pooled page for this task only, so a
+        # browser recycle can drain between tasks (page is reset and reused)
+        async with browser.lease_context() as context, browser.lease_page(context) as page:
+            scraper = PersonScraper(page, soft_navigation=browser.soft_navigation, hedge=hedge)
             
-        url = row[url_column]
-        print(f"[Worker {worker_id}] Processing row {index+1}: {url}")
+            async def run_scrape():
+                # The budget (and the watchdog) only start once it is this row's turn
+                deadline = Deadline(profile_budget)
+                if watchdog:
+                    return await watchdog.run(page, scraper.scrape(url, deadline), label)
+                return await scraper.scrape(url, deadline)
+            
+            if turn:
+                scraper.prefetch(url, page_type="profile")
+                try:
+                    async with turn:
+                        person = await run_scrape()
+                finally:
+                    scraper.cancel_prefetch()
+            else:
+                person = await run_scrape()
+        
+        if person.incomplete:
+            print(f"   [{label}] Scraped (incomplete, budget ran out): {person.name}")
+        else:
+            print(f"   [{label}] Scraped: {person.name}")
+        return person_to_row(person)
+    
+    except (PageCrashedError, TaskTimeoutError, SessionExpiredError):
+        raise
+    except ProfileNotFoundError as e:
+        print(f"   [{label}] Profile unavailable, not retrying: {url}")
+        return {'Name': f"{UNAVAILABLE_PREFIX} {str(e)}"}
+    except LinkedInScraperException as e:
+        print(f"   [{label}] Failed to scrape {url}: {e}")
+        return {'Name': f"Error: {str(e)}"}
+    except Exception as e:
+        print(f"   [{label}] Unexpected error on {url}: {e}")
+        return {'Name': f"Error: {str(e)}"}
 
-        # Create a new isolated page for this task
-        page = await browser.new_page()
-        scraper = PersonScraper(page)
+def apply_result(df: pd.DataFrame, index, values: Dict[str, Any]) -> None:
+    """Write one row's result values into the DataFrame."""
+    for column, value in values.items():
+        df.at[index, column] = value
 
+async def scrape_worker(
+    worker_id: int,
+    queue: asyncio.Queue,
+    browser: BrowserManager,
+    df: pd.DataFrame,
+    file_path: Path,
+    url_column: str,
+    watchdog: Optional[PageWatchdog] = None,
+    attempts: Optional[Dict[Any, int]] = None,
+    session_health: Optional[SessionHealth] = None,
+    hedge: Optional[HedgePolicy] = None,
+    options: Optional[RunOptions] = None,
+):
+    """
+    Worker task to process URLs from the queue.
+    
+    Rows whose page crashed or hung are put back at the end of the queue
+    (up to options.max_attempts tries) instead of blocking the worker. Rows that hit
+    an expired session are put back too, once a refreshed session file has
+    been loaded (workers pause until then).
+    
+    With options.lookahead > 0 the worker is pipelined: up to that many further rows
+    are taken from the queue and start loading on their own pages while the
+    current row is extracted, and rows are extracted one at a time in order.
+    """
+    print(f"Worker {worker_id} started.")
+    options = options or RunOptions()
+    attempts = attempts if attempts is not None else {}
+    turn = asyncio.Lock() if options.lookahead > 0 else None
+    slots = asyncio.Semaphore(options.lookahead + 1)
+    in_flight = set()
+    
+    async def process(index, row):
+        url = row[url_column]
+        
         try:
-            person = await scraper.scrape(url)
-
+            generation = None
+            if session_health:
+                await session_health.wait_healthy()
+                generation = session_health.reloads
+            print(f"[Worker {worker_id}] Processing row {index+1}: {url}")
+            
+            try:
+                values = await scrape_url(
+                    browser, url, f"Worker {worker_id}",
+                    watchdog=watchdog, hedge=hedge, profile_budget=options.profile_budget, turn=turn,
+                )
+            except SessionExpiredError as e:
+                if session_health and await session_health.report_expired(str(e), generation):
+                    print(f"   [Worker {worker_id}] Session refreshed; re-queued row {index+1}")
+                    queue.put_nowait((index, row))
+                    return
+                values = {'Name': f"Error: {str(e)}"}
+            except (PageCrashedError, TaskTimeoutError) as e:
+                attempts[index] = attempts.get(index, 0) + 1
+                if attempts[index] < options.max_attempts:
+                    print(f"   [Worker {worker_id}] {e}; re-queued row {index+1}")
+                    # Re-enqueue before task_done() so queue.join() keeps waiting for it
+                    queue.put_nowait((index, row))
+                    return
+                values = {'Name': f"Error: {str(e)}"}
+            
             # Update DataFrame (Asyncio is single-threaded, so memory updates are atomic between awaits)
-            df.at[index, 'Name'] = person.name
-            # Person model doesn't have headline, removing it or keeping empty
-            df.at[index, 'Headline'] = "" 
-            df.at[index, 'Location'] = person.location
-            df.at[index, 'About'] = person.about[:500] + "..." if person.about else ""
-
-            # Use helper properties from Person model
-            df.at[index, 'Job Title'] = person.job_title
-            df.at[index, 'Company'] = person.company
-
-            # Extract 'Founder Of' companies
-            founder_companies = []
-            if person.experiences:
-                for exp in person.experiences:
-                    if not exp.position_title or not exp.institution_name:
-                        continue
-                    
-                    # Check if title indicates founder status
-                    title_lower = exp.position_title.lower()
-                    is_founder = "founder" in title_lower
-                    
-                    # Check if currently active (to_date is None, 'Present', or empty)
-                    is_current = not exp.to_date or str(exp.to_date).lower() == "present"
-                    
-                    if is_founder and is_current:
-                        founder_companies.append(exp.institution_name)
-            
-            df.at[index, 'Founder Of'] = ", ".join(founder_companies) if founder_companies else ""
-            
-            print(f"   [Worker {worker_id}] Scraped: {person.name}")
-
-        except LinkedInScraperException as e:
-            print(f"   [Worker {worker_id}] Failed to scrape {url}: {e}")
-            df.at[index, 'Name'] = f"Error: {str(e)}"
-        except Exception as e:
-            print(f"   [Worker {worker_id}] Unexpected error on {url}: {e}")
-            df.at[index, 'Name'] = f"Error: {str(e)}"
+            apply_result(df, index, values)
         finally:
-            # Cleanup page
-            await page.close()
             # Mark task as done
             queue.task_done()
+            slots.release()
             
             # Save periodically (e.g., every 5 items globally, but here we can just trigger a save)
-            # To avoid saving too often, we could check queue size or just save. 
+            # To avoid saving too often, we could check queue size or just save.
             # For simplicity in parallel, we'll save after every successful scrape but use the lock.
             # Ideally, we would batch this, but safety first.
             await save_data(df, file_path)
+    
+    try:
+        while True:
+            # Take the next row only while fewer than lookahead + 1 are in flight
+            await slots.acquire()
+            try:
+                # Get a "unit of work" from the queue
+                index, row = await queue.get()
+            except BaseException:
+                slots.release()
+                raise
+            task = asyncio.create_task(process(index, row))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+    except asyncio.CancelledError:
+        pass
+    finally:
+        for task in list(in_flight):
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
 
-async def process_excel(input_path: str, url_column: str, headless: bool, num_workers: int):
+def shard_process_main(
+    shard_id: int,
+    task_queue,
+    result_queue,
+    num_workers: int,
+    browser_options: Dict[str, Any],
+    session_file: Optional[str],
+    options: Optional[RunOptions] = None,
+):
     """
-    Read Excel, scrape profiles in parallel, and update the file.
+    Entry point of one --processes shard: its own asyncio loop and browser.
     """
-    file_path = Path(input_path)
-    if not file_path.exists():
-        print(f"Error: File not found: {input_path}")
-        return
+    asyncio.run(run_shard(shard_id, task_queue, result_queue, num_workers, browser_options, session_file, options))
+
+async def run_shard(
+    shard_id: int,
+    task_queue,
+    result_queue,
+    num_workers: int,
+    browser_options: Dict[str, Any],
+    session_file: Optional[str],
+    options: Optional[RunOptions] = None,
+):
+    """
+    Pull (index, url) tasks from the coordinator queue until a None sentinel
+    and stream (index, values) results back to the writer.
+    
+    A crashed or hung row is retried by the same worker on a fresh page;
+    it cannot go back on the shared queue, which already ends in sentinels.
+    Likewise a row that hit an expired session is retried once the shard
+    has reloaded a refreshed session file.
+    
+    Timeouts adapt to the latencies this shard observes, seeded from and
+    saved back to the options.latency_state file.
+    """
+    options = options or RunOptions()
+    if browser_options.get("user_data_dir"):
+        # Chromium locks a profile directory, so every shard keeps its own
+        browser_options = dict(browser_options)
+        browser_options["user_data_dir"] = str(Path(browser_options["user_data_dir"]) / f"shard-{shard_id}")
+    
+    watchdog = PageWatchdog(options.task_timeout)
+    load_latency_state(options.latency_state)
+    hedge = HedgePolicy(budget=options.hedge_budget) if options.hedge_budget else None
+    
+    async with create_browser(browser_options) as browser:
+        await load_session(browser, session_file)
+        # One context per row in flight (each worker has up to lookahead + 1)
+        await browser.start_context_pool(size=num_workers * (options.lookahead + 1))
+        health = SessionHealth(browser, session_file, max_wait=options.session_wait) if session_file and options.session_wait > 0 else None
+        
+        async def shard_worker(worker_id: int):
+            label = f"Process {shard_id}/Worker {worker_id}"
+            # Pipelined (lookahead > 0): later rows load while the current one is extracted
+            turn = asyncio.Lock() if options.lookahead > 0 else None
+            slots = asyncio.Semaphore(options.lookahead + 1)
+            in_flight = []
+            
+            async def process(index, url):
+                print(f"[{label}] Processing row {index+1}: {url}")
+                attempt = 0
+                try:
+                    while True:
+                        generation = None
+                        if health:
+                            await health.wait_healthy()
+                            generation = health.reloads
+                        try:
+                            values = await scrape_url(
+                                browser, url, label,
+                                watchdog=watchdog, hedge=hedge, profile_budget=options.profile_budget, turn=turn,
+                            )
+                            break
+                        except SessionExpiredError as e:
+                            values = {'Name': f"Error: {str(e)}"}
+                            if not (health and await health.report_expired(str(e), generation)):
+                                break
+                            print(f"   [{label}] Session refreshed; retrying row {index+1}")
+                        except (PageCrashedError, TaskTimeoutError) as e:
+                            values = {'Name': f"Error: {str(e)}"}
+                            attempt += 1
+                            if attempt >= options.max_attempts:
+                                break
+                            print(f"   [{label}] {e}; retrying row {index+1}")
+                    result_queue.put((index, values))
+                finally:
+                    slots.release()
+            
+            while True:
+                await slots.acquire()
+                # Blocking multiprocessing queue read, off the event loop
+                task = await asyncio.to_thread(task_queue.get)
+                if task is None:
+                    break
+                in_flight.append(asyncio.create_task(process(*task)))
+            await asyncio.gather(*in_flight)
+        
+        start = time.monotonic()
+        try:
+            await asyncio.gather(*(shard_worker(i + 1) for i in range(num_workers)))
+        finally:
+            if health:
+                await health.close()
+            if hedge:
+                await hedge.close()
+        print_watchdog_report(watchdog, num_workers, time.monotonic() - start, f"[Process {shard_id}] ")
+        if health:
+            print_session_report(health, f"[Process {shard_id}] ")
+        print_probe_stats(f"[Process {shard_id}] ")
+        print_latency_report(f"[Process {shard_id}] ")
+        if hedge:
+            print_hedge_report(hedge, f"[Process {shard_id}] ")
+        if options.latency_state:
+            # Merged with what the other shards saved
+            latency_tracker.save(options.latency_state)
+        print_browser_stats(browser, f"[Process {shard_id}] ")
 
-    print(f"Reading {input_path}...")
+async def run_sharded(
+    tasks: List[Tuple[Any, str]],
+    processes: int,
+    num_workers: int,
+    browser_options: Dict[str, Any],
+    session_file: Optional[str],
+    on_result: Callable[[Any, Dict[str, Any]], Awaitable[None]],
+    options: Optional[RunOptions] = None,
+) -> int:
+    """
+    Scrape tasks across `processes` worker processes, each running
+    `num_workers` concurrent workers, and hand every result to `on_result`
+    in this (the single writer) process.
+    
+    Returns:
+        Number of results received
+    """
+    mp = multiprocessing.get_context("spawn")
+    task_queue = mp.Queue()
+    result_queue = mp.Queue()
+    
+    for task in tasks:
+        task_queue.put(task)
+    # One sentinel per worker coroutine across all processes
+    for _ in range(processes * num_workers):
+        task_queue.put(None)
+    
+    shards = [
+        mp.Process(
+            target=shard_process_main,
+            args=(i + 1, task_queue, result_queue, num_workers, browser_options, session_file, options),
+            daemon=True,
+        )
+        for i in range(processes)
+    ]
+    for shard in shards:
+        shard.start()
+    
+    received = 0
+    while received < len(tasks):
+        try:
+            index, values = await asyncio.to_thread(result_queue.get, True, 1.0)
+        except queue_module.Empty:
+            if not any(shard.is_alive() for shard in shards):
+                print(f"Warning: all worker processes exited with {len(tasks) - received} rows outstanding.")
+                break
+            continue
+        received += 1
+        await on_result(index, values)
+    
+    for shard in shards:
+        await asyncio.to_thread(shard.join, 30)
+    
+    return received
+
+async def read_input(file_path: Path, url_column: str) -> Optional[pd.DataFrame]:
+    """
+    Read the Excel sheet off the event loop and add missing result columns.
+    
+    Returns:
+        DataFrame, or None (after printing why) if the file can't be used
+    """
+    if not file_path.exists():
+        print(f"Error: File not found: {file_path}")
+        return None
+    
+    print(f"Reading {file_path}...")
     try:
-        df = pd.read_excel(file_path)
+        df = await asyncio.to_thread(pd.read_excel, file_path)
     except Exception as e:
         print(f"Error reading Excel file: {e}")
-        return
-
+        return None
+    
     if url_column not in df.columns:
         print(f"Error: Column '{url_column}' not found in Excel file.")
         print(f"   Available columns: {', '.join(df.columns)}")
-        return
-
+        return None
+    
     # Initialize new columns if they don't exist
-    new_columns = ['Name', 'Headline', 'Location', 'About', 'Job Title', 'Company', 'Founder Of']
-    for col in new_columns:
+    for col in RESULT_COLUMNS:
         if col not in df.columns:
             df[col] = None
-
-    # Filter rows that need processing
-    queue = asyncio.Queue()
-    tasks_count = 0
     
-    for index, row in df.iterrows():
-        url = row[url_column]
-        
-        # Skip empty or already scraped rows
-        if pd.isna(url) or (pd.notna(row['Name']) and str(row['Name']) != "" and not str(row['Name']).startswith("Error:")):
-            continue
-            
-        queue.put_nowait((index, row))
-        tasks_count += 1
+    return df
 
-    if tasks_count == 0:
-        print("No new profiles to scrape.")
-        return
+def pending_rows(df: pd.DataFrame, url_column: str) -> pd.DataFrame:
+    """
+    Rows that still need scraping: a URL and no result yet (or a previous error).
+    
+    'Unavailable: ...' rows are final and are not retried.
+    """
+    names = df['Name'].astype(str)
+    scraped = df['Name'].notna() & (names != "") & ~names.str.startswith("Error:")
+    return df[df[url_column].notna() & ~scraped]
 
-    print(f"Starting bulk scrape for {tasks_count} profiles with {num_workers} workers (Headless: {headless})...")
+async def process_excel(
+    input_path: str,
+    url_column: str,
+    num_workers: int,
+    browser_options: Dict[str, Any],
+    processes: int = 1,
+    options: Optional[RunOptions] = None,
+):
+    """
+    Read Excel, scrape profiles in parallel, and update the file.
     
-    async with BrowserManager(headless=headless) as browser:
-        # Load session
-        try:
-            await browser.load_session("linkedin_session.json")
-            print("Session loaded")
-        except Exception:
-            print("Warning: No session file found. You may hit auth walls.")
+    The sheet is read while the session file is parsed; Playwright and
+    Chromium only start when the first pending row reaches a worker, so a
+    rerun with nothing left to scrape never starts a browser.
+    
+    If the session expires mid-run, workers pause (up to options.session_wait
+    seconds) until linkedin_session.json is refreshed, reload it into every
+    context and retry the affected rows.
+    
+    Navigation and content-wait timeouts adapt to observed latencies, which
+    persist between runs in options.latency_state (None disables persistence).
+    With a hedge_budget, loads past their p95 are also raced on a spare page.
+    With a profile_budget (seconds), each profile's waits are clamped so it
+    finishes within the budget, partial profiles flagged 'Incomplete'.
+    With a lookahead, each worker loads up to that many next profiles while
+    it extracts the current one.
+    """
+    options = options or RunOptions()
+    file_path = Path(input_path)
+    headless = browser_options.get("headless", True)
+    
+    if processes > 1:
+        df = await read_input(file_path, url_column)
+        if df is None:
+            return
         
-        # Create workers
-        workers = []
-        for i in range(min(num_workers, tasks_count)):
-            task = asyncio.create_task(scrape_worker(i+1, queue, browser, df, file_path, url_column))
-            workers.append(task)
+        pending = pending_rows(df, url_column)
+        if pending.empty:
+            print("No new profiles to scrape.")
+            return
         
-        # Wait for queue to be fully processed
-        await queue.join()
+        print(f"Starting bulk scrape for {len(pending)} profiles with {processes} processes x {num_workers} workers (Headless: {headless})...")
         
-        # Cancel workers
-        for task in workers:
-            task.cancel()
+        tasks = list(zip(pending.index, pending[url_column]))
+        last_save = time.monotonic()
         
-        # Wait for workers to finish cancelling
-        await asyncio.gather(*workers, return_exceptions=True)
-
+        async def write_result(index, values):
+            # Single writer: only this process touches the DataFrame and the file
+            nonlocal last_save
+            apply_result(df, index, values)
+            if time.monotonic() - last_save >= SAVE_INTERVAL:
+                await save_data(df, file_path)
+                last_save = time.monotonic()
+        
+        # Shards launch lazily too: one that gets no rows never starts Chromium
+        shard_options = {**browser_options, "lazy": True}
+        await run_sharded(tasks, processes, num_workers, shard_options, SESSION_FILE, write_result, options)
+        await save_data(df, file_path)
+    else:
+        browser = create_browser({**browser_options, "lazy": True})
+        try:
+            load_latency_state(options.latency_state)
+            # Lazy: only marks the browser as started, the launch comes with the first lease
+            await browser.start()
+            df, _ = await asyncio.gather(
+                read_input(file_path, url_column),
+                load_session(browser, SESSION_FILE),
+            )
+            if df is None:
+                return
+            
+            pending = pending_rows(df, url_column)
+            if pending.empty:
+                print("No new profiles to scrape.")
+                return
+            
+            print(f"Starting bulk scrape for {len(pending)} profiles with {num_workers} workers (Headless: {headless})...")
+            
+            queue = asyncio.Queue()
+            for index, row in pending.iterrows():
+                queue.put_nowait((index, row))
+            
+            # One isolated context (built from the in-memory session) per worker,
+            # created when the first worker leases one
+            worker_count = min(num_workers, len(pending))
+            # Pipelined workers lease one context per row in flight
+            await browser.start_context_pool(size=min(worker_count * (options.lookahead + 1), len(pending)))
+            
+            # Crashed/hung pages are abandoned and their rows re-queued
+            watchdog = PageWatchdog(options.task_timeout)
+            attempts: Dict[Any, int] = {}
+            
+            # Loads running past their p95 are raced on a spare page (opt-in)
+            hedge = HedgePolicy(budget=options.hedge_budget) if options.hedge_budget else None
+            
+            # An expired session pauses all workers until the session file is refreshed
+            health = SessionHealth(browser, SESSION_FILE, max_wait=options.session_wait) if options.session_wait > 0 else None
+            
+            # Create workers
+            workers = []
+            for i in range(worker_count):
+                task = asyncio.create_task(scrape_worker(
+                    i+1, queue, browser, df, file_path, url_column,
+                    watchdog=watchdog, attempts=attempts, session_health=health, hedge=hedge, options=options,
+                ))
+                workers.append(task)
+            
+            # Wait for queue to be fully processed
+            start = time.monotonic()
+            await queue.join()
+            wall_seconds = time.monotonic() - start
+            
+            # Cancel workers
+            for task in workers:
+                task.cancel()
+            
+            # Wait for workers to finish cancelling
+            await asyncio.gather(*workers, return_exceptions=True)
+            if health:
+                await health.close()
+            if hedge:
+                await hedge.close()
+            
+            print_watchdog_report(watchdog, worker_count, wall_seconds)
+            if health:
+                print_session_report(health)
+            print_probe_stats()
+            print_latency_report()
+            if hedge:
+                print_hedge_report(hedge)
+            if options.latency_state:
+                latency_tracker.save(options.latency_state)
+            print_browser_stats(browser)
+        finally:
+            await browser.close()
+    
     print("\n" + "="*60)
     print(f"Bulk scraping complete. Data saved to {input_path}")
     print("="*60)
@@ -179,11 +723,48 @@ def main():
     parser.add_argument("--input", "-i", required=True, help="Path to input Excel file (.xlsx)")
     parser.add_argument("--column", "-c", default="LinkedIn URL", help="Column name containing LinkedIn URLs")
     parser.add_argument("--headless", action="store_true", help="Run in headless mode (no browser window)")
-    parser.add_argument("--workers", "-w", type=int, default=1, help="Number of concurrent workers (default: 1)")
+    parser.add_argument("--workers", "-w", type=int, default=1, help="Number of concurrent workers per process (default: 1)")
+    parser.add_argument("--processes", "-p", type=int, default=1, help="Worker processes, each with its own browser (default: 1)")
+    parser.add_argument("--task-timeout", type=float, default=TASK_TIMEOUT, help=f"Abandon a profile whose page hangs this many seconds (default: {TASK_TIMEOUT:.0f})")
+    parser.add_argument("--task-attempts", type=int, default=TASK_ATTEMPTS, help=f"Tries per profile after crashes/hangs (default: {TASK_ATTEMPTS})")
+    parser.add_argument("--session-wait", type=float, default=SESSION_WAIT, help=f"If the session expires mid-run, pause this many seconds for a refreshed {SESSION_FILE} (e.g. from create_session.py), 0 to fail rows instead (default: {SESSION_WAIT:.0f})")
+    parser.add_argument("--latency-state", default=LATENCY_STATE_FILE, help=f"File the observed page latencies (and so the adaptive timeouts) persist in between runs, empty to disable (default: {LATENCY_STATE_FILE})")
+    parser.add_argument("--hedge", nargs="?", type=float, const=0.05, default=None, metavar="BUDGET", help="Race page loads that run past their p95 on a spare page, at most BUDGET extra loads per load (default when given: 0.05)")
+    parser.add_argument("--profile-budget", type=float, default=None, help="Seconds per profile; when they run out, write what was scraped and flag the row Incomplete (default: no budget)")
+    parser.add_argument("--lookahead", type=int, default=0, help="Pipeline each worker: load up to N next profiles on extra pages while the current one is extracted (default: 0, sequential)")
+    parser.add_argument("--launch-profile", default="default", choices=list(LAUNCH_PROFILES), help="Chromium launch settings; low_memory packs more workers per box (default: default)")
+    parser.add_argument("--routing-profile", default="full", choices=list(ROUTING_PROFILES), help="Which resources to block (default: full, nothing blocked)")
+    parser.add_argument("--asset-cache", default=None, metavar="DIR", help="Static asset cache directory, e.g. .asset_cache (default: no cache)")
+    parser.add_argument("--recycle-pages", type=int, default=None, help="Relaunch the browser after this many pages (default: never)")
+    parser.add_argument("--recycle-rss-mb", type=int, default=None, help="Relaunch the browser when Chromium RSS exceeds this many MB (Linux, default: never)")
+    parser.add_argument("--connect", default=os.environ.get(BROWSER_ENDPOINT_ENV), help=f"Attach to a browser_server.py endpoint instead of launching Chromium (default: ${BROWSER_ENDPOINT_ENV})")
+    parser.add_argument("--soft-navigation", action="store_true", help="Move between profiles with in-app navigation instead of full page loads (falls back to goto)")
+    parser.add_argument("--user-data-dir", default=None, help="Persistent Chromium profile directory for warm starts; workers share one context (default: fresh profile per run)")
     
     args = parser.parse_args()
     
-    asyncio.run(process_excel(args.input, args.column, args.headless, args.workers))
+    browser_options = {
+        "headless": args.headless,
+        "launch_profile": args.launch_profile,
+        "routing_profile": args.routing_profile,
+        "asset_cache_dir": args.asset_cache,
+        "recycle_after_pages": args.recycle_pages,
+        "recycle_rss_mb": args.recycle_rss_mb,
+        "user_data_dir": args.user_data_dir,
+        "endpoint": args.connect,
+        "soft_navigation": args.soft_navigation,
+    }
+    
+    options = RunOptions(
+        task_timeout=args.task_timeout,
+        max_attempts=args.task_attempts,
+        session_wait=args.session_wait,
+        latency_state=args.latency_state or None,
+        hedge_budget=args.hedge,
+        profile_budget=args.profile_budget,
+        lookahead=args.lookahead,
+    )
+    asyncio.run(process_excel(args.input, args.column, args.workers, browser_options, args.processes, options))
 
 if __name__ == "__main__":
     main()
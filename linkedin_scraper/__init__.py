@@ -1,93 +1,122 @@
-"""LinkedIn Scraper - Async Playwright-based scraper for LinkedIn."""
+"""LinkedIn Scraper - Async Playwright-based scraper for LinkedIn.
+
+Public names are loaded on first access (PEP 562): ``import linkedin_scraper``
+is cheap, and e.g. ``from linkedin_scraper import Person`` imports pydantic
+but not Playwright.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
 # Version
 __version__ = "3.0.1"
 
-# Core modules
-from .core import (
-    BrowserManager,
-    login_with_credentials,
-    login_with_cookie,
-    is_logged_in,
-    wait_for_manual_login,
-    load_credentials_from_env,
-    # Exceptions
-    LinkedInScraperException,
-    AuthenticationError,
-    RateLimitError,
-    ElementNotFoundError,
-    ProfileNotFoundError,
-    NetworkError,
-    ScrapingError,
-)
+if TYPE_CHECKING:
+    # Core modules
+    from .core import (
+        BrowserManager,
+        login_with_credentials,
+        login_with_cookie,
+        is_logged_in,
+        wait_for_manual_login,
+        load_credentials_from_env,
+        # Exceptions
+        LinkedInScraperException,
+        AuthenticationError,
+        RateLimitError,
+        ElementNotFoundError,
+        ProfileNotFoundError,
+        NetworkError,
+        ScrapingError,
+    )
 
-# Scrapers
-from .scrapers import (
-    PersonScraper,
-    CompanyScraper,
-    JobScraper,
-    JobSearchScraper,
-)
+    # Scrapers
+    from .scrapers import (
+        PersonScraper,
+        CompanyScraper,
+        JobScraper,
+        JobSearchScraper,
+    )
 
-# Callbacks
-from .callbacks import (
-    ProgressCallback,
-    ConsoleCallback,
-    SilentCallback,
-    JSONLogCallback,
-    MultiCallback,
-)
+    # Callbacks
+    from .callbacks import (
+        ProgressCallback,
+        ConsoleCallback,
+        SilentCallback,
+        JSONLogCallback,
+        MultiCallback,
+    )
 
-# Models
-from .models import (
-    Person,
-    Experience,
-    Education,
-    Contact,
-    Accomplishment,
-    Company,
-    CompanySummary,
-    Employee,
-    Job,
-)
+    # Models
+    from .models import (
+        Person,
+        Experience,
+        Education,
+        Contact,
+        Accomplishment,
+        Company,
+        CompanySummary,
+        Employee,
+        Job,
+    )
 
-__all__ = [
-    # Version
-    '__version__',
+# Public name -> module that defines it
+_LAZY_ATTRIBUTES = {
     # Core
-    'BrowserManager',
-    'login_with_credentials',
-    'login_with_cookie',
-    'is_logged_in',
-    'wait_for_manual_login',
-    'load_credentials_from_env',
+    'BrowserManager': '.core.browser',
+    'login_with_credentials': '.core.auth',
+    'login_with_cookie': '.core.auth',
+    'is_logged_in': '.core.auth',
+    'wait_for_manual_login': '.core.auth',
+    'load_credentials_from_env': '.core.auth',
     # Scrapers
-    'PersonScraper',
-    'CompanyScraper',
-    'JobScraper',
-    'JobSearchScraper',
+    'PersonScraper': '.scrapers.person',
+    'CompanyScraper': '.scrapers.company',
+    'JobScraper': '.scrapers.job',
+    'JobSearchScraper': '.scrapers.job_search',
     # Exceptions
-    'LinkedInScraperException',
-    'AuthenticationError',
-    'RateLimitError',
-    'ElementNotFoundError',
-    'ProfileNotFoundError',
-    'NetworkError',
-    'ScrapingError',
+    'LinkedInScraperException': '.core.exceptions',
+    'AuthenticationError': '.core.exceptions',
+    'RateLimitError': '.core.exceptions',
+    'ElementNotFoundError': '.core.exceptions',
+    'ProfileNotFoundError': '.core.exceptions',
+    'NetworkError': '.core.exceptions',
+    'ScrapingError': '.core.exceptions',
     # Callbacks
-    'ProgressCallback',
-    'ConsoleCallback',
-    'SilentCallback',
-    'JSONLogCallback',
-    'MultiCallback',
+    'ProgressCallback': '.callbacks',
+    'ConsoleCallback': '.callbacks',
+    'SilentCallback': '.callbacks',
+    'JSONLogCallback': '.callbacks',
+    'MultiCallback': '.callbacks',
     # Models
-    'Person',
-    'Experience',
-    'Education',
-    'Contact',
-    'Accomplishment',
-    'Company',
-    'CompanySummary',
-    'Employee',
-    'Job',
+    'Person': '.models.person',
+    'Experience': '.models.person',
+    'Education': '.models.person',
+    'Contact': '.models.person',
+    'Accomplishment': '.models.person',
+    'Company': '.models.company',
+    'CompanySummary': '.models.company',
+    'Employee': '.models.company',
+    'Job': '.models.job',
+}
+
+__all__ = [
+    # Version
+    '__version__',
+    *_LAZY_ATTRIBUTES,
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module defining ``name`` on first access and cache the value."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -1,61 +1,137 @@
-"""Core modules for LinkedIn scraper."""
-
-from .browser import BrowserManager
-from .auth import (
-    login_with_credentials,
-    login_with_cookie,
-    is_logged_in,
-    wait_for_manual_login,
-    load_credentials_from_env,
-    warm_up_browser
-)
-from .exceptions import (
-    LinkedInScraperException,
-    AuthenticationError,
-    RateLimitError,
-    ElementNotFoundError,
-    ProfileNotFoundError,
-    NetworkError,
-    ScrapingError
-)
-from .utils import (
-    retry_async,
-    detect_rate_limit,
-    wait_for_element_smart,
-    extract_text_safe,
-    scroll_to_bottom,
-    scroll_to_half,
-    click_see_more_buttons,
-    handle_modal_close,
-    is_page_loaded
-)
-
-__all__ = [
+"""Core modules for LinkedIn scraper.
+
+Names are loaded on first access (PEP 562), so importing one of them only
+imports the submodule that defines it.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .browser import BrowserManager
+    from .pool import PagePool, ContextPool
+    from .launch import LAUNCH_PROFILES
+    from .watchdog import PageWatchdog
+    from .session_health import SessionHealth
+    from .readiness import wait_until_ready, READINESS_PRESETS
+    from .probe import probe, probe_stats, ProbeStats
+    from .latency import LatencyTracker, latency_tracker
+    from .hedging import HedgePolicy
+    from .deadline import Deadline
+    from .routing import RequestRouter, ROUTING_PROFILES
+    from .asset_cache import AssetCache
+    from .auth import (
+        login_with_credentials,
+        login_with_cookie,
+        is_logged_in,
+        AuthState,
+        get_auth_state,
+        wait_for_manual_login,
+        load_credentials_from_env,
+        warm_up_browser
+    )
+    from .exceptions import (
+        LinkedInScraperException,
+        AuthenticationError,
+        SessionExpiredError,
+        RateLimitError,
+        ElementNotFoundError,
+        ProfileNotFoundError,
+        NetworkError,
+        ScrapingError,
+        PageCrashedError,
+        TaskTimeoutError,
+        DeadlineExceededError
+    )
+    from .utils import (
+        retry_async,
+        detect_rate_limit,
+        inspect_navigation,
+        rate_limit_stats,
+        wait_for_element_smart,
+        extract_text_safe,
+        scroll_to_bottom,
+        scroll_to_load,
+        scroll_to_half,
+        click_see_more_buttons,
+        expand_see_more_buttons,
+        handle_modal_close,
+        is_page_loaded
+    )
+
+# Public name -> submodule that defines it
+_LAZY_ATTRIBUTES = {
     # Browser
-    'BrowserManager',
+    'BrowserManager': '.browser',
+    'PagePool': '.pool',
+    'ContextPool': '.pool',
+    'LAUNCH_PROFILES': '.launch',
+    'PageWatchdog': '.watchdog',
+    'SessionHealth': '.session_health',
+    # Readiness
+    'wait_until_ready': '.readiness',
+    'READINESS_PRESETS': '.readiness',
+    'probe': '.probe',
+    'probe_stats': '.probe',
+    'ProbeStats': '.probe',
+    'LatencyTracker': '.latency',
+    'latency_tracker': '.latency',
+    'HedgePolicy': '.hedging',
+    'Deadline': '.deadline',
+    # Routing
+    'RequestRouter': '.routing',
+    'ROUTING_PROFILES': '.routing',
+    'AssetCache': '.asset_cache',
     # Auth
-    'login_with_credentials',
-    'login_with_cookie',
-    'is_logged_in',
-    'wait_for_manual_login',
-    'load_credentials_from_env',
-    'warm_up_browser',
+    'login_with_credentials': '.auth',
+    'login_with_cookie': '.auth',
+    'is_logged_in': '.auth',
+    'AuthState': '.auth',
+    'get_auth_state': '.auth',
+    'wait_for_manual_login': '.auth',
+    'load_credentials_from_env': '.auth',
+    'warm_up_browser': '.auth',
     # Exceptions
-    'LinkedInScraperException',
-    'AuthenticationError',
-    'RateLimitError',
-    'ElementNotFoundError',
-    'ProfileNotFoundError',
-    'NetworkError',
-    'ScrapingError',
+    'LinkedInScraperException': '.exceptions',
+    'AuthenticationError': '.exceptions',
+    'SessionExpiredError': '.exceptions',
+    'RateLimitError': '.exceptions',
+    'ElementNotFoundError': '.exceptions',
+    'ProfileNotFoundError': '.exceptions',
+    'NetworkError': '.exceptions',
+    'ScrapingError': '.exceptions',
+    'PageCrashedError': '.exceptions',
+    'TaskTimeoutError': '.exceptions',
+    'DeadlineExceededError': '.exceptions',
     # Utils
-    'retry_async',
-    'detect_rate_limit',
-    'wait_for_element_smart',
-    'extract_text_safe',
-    'scroll_to_bottom',
-    'scroll_to_half',
-    'click_see_more_buttons',
-    'handle_modal_close',
-    'is_page_loaded',
-]
+    'retry_async': '.utils',
+    'detect_rate_limit': '.utils',
+    'inspect_navigation': '.utils',
+    'rate_limit_stats': '.utils',
+    'wait_for_element_smart': '.utils',
+    'extract_text_safe': '.utils',
+    'scroll_to_bottom': '.utils',
+    'scroll_to_load': '.utils',
+    'scroll_to_half': '.utils',
+    'click_see_more_buttons': '.utils',
+    'expand_see_more_buttons': '.utils',
+    'handle_modal_close': '.utils',
+    'is_page_loaded': '.utils',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining ``name`` on first access and cache the value."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
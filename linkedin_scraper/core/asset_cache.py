@@ -0,0 +1,352 @@
+"""Content-addressed on-disk cache for immutable static assets."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+from playwright.async_api import BrowserContext, Request, Route
+
+logger = logging.getLogger(__name__)
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+
+# Bundle names that embed a content hash (app.8c1f2e7a.js, main-3f9a0c1b2d.css)
+# and LinkedIn's static host layout (static.licdn.com/aero-v1/sc/h/<hash>).
+HASHED_ASSET_PATTERN = re.compile(
+    r"(?:[._-][0-9a-f]{8,}\.(?:m?js|css|woff2?|ttf|otf)$)|(?:/sc/h/[0-9a-z]{10,}$)",
+    re.IGNORECASE,
+)
+
+CACHEABLE_RESOURCE_TYPES = {"script", "stylesheet", "font"}
+
+# Response headers replayed when an asset is served from the cache
+STORED_HEADERS = (
+    "content-type",
+    "cache-control",
+    "access-control-allow-origin",
+    "timing-allow-origin",
+    "etag",
+    "last-modified",
+)
+
+
+class _FileLock:
+    """Blocking inter-process lock on a file (flock on POSIX, msvcrt on Windows)."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._fd: Optional[int] = None
+
+    def __enter__(self) -> "_FileLock":
+        self._fd = os.open(str(self.path), os.O_RDWR | os.O_CREAT)
+        if fcntl:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        else:
+            msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._fd is None:
+            return
+        try:
+            if fcntl:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+
+class AssetCache:
+    """
+    Route-level cache serving hashed JS/CSS/font bundles from local disk.
+
+    Bodies are stored by SHA-256 under ``objects/`` and URLs map to them via
+    small JSON entries under ``index/``, so identical bundles served from
+    different URLs are stored once. All writes go through a temp file and
+    ``os.replace``, and eviction holds an inter-process file lock, so several
+    browsers (or processes) can share one directory. The cache is size-bounded
+    and evicts least recently used objects first.
+
+    Example:
+        cache = AssetCache(".asset_cache", max_bytes=256 * 1024 * 1024)
+        await cache.attach(context)
+        ...
+        print(cache.stats)
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 512 * 1024 * 1024):
+        """
+        Initialize asset cache.
+
+        Args:
+            directory: Cache directory (created if missing)
+            max_bytes: Size bound for stored objects; oldest are evicted beyond it
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+        self._objects = self.directory / "objects"
+        self._index = self.directory / "index"
+        self._lock_path = self.directory / "cache.lock"
+        self._objects.mkdir(parents=True, exist_ok=True)
+        self._index.mkdir(parents=True, exist_ok=True)
+
+        # put()/evict() run in worker threads (asyncio.to_thread)
+        self._size_lock = threading.Lock()
+        self._size = self._scan_size()
+
+        self.hits = 0
+        self.misses = 0
+        self.stored = 0
+        self.evicted = 0
+        self.bytes_served = 0
+
+    @staticmethod
+    def is_cacheable_url(url: str) -> bool:
+        """
+        Check whether a URL looks like an immutable, content-hashed asset.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            True if the URL path carries a content hash
+        """
+        path = url.split("?", 1)[0].split("#", 1)[0]
+        return bool(HASHED_ASSET_PATTERN.search(path))
+
+    async def attach(self, context: BrowserContext) -> None:
+        """
+        Install the cache route handler on a context.
+
+        Register it before any blocking router: Playwright runs the most
+        recently registered handler first, and the router falls back here.
+
+        Args:
+            context: Playwright browser context
+        """
+        await context.route("**/*", self._handle)
+
+    async def _handle(self, route: Route, request: Request) -> None:
+        """Serve a request from the cache, or fetch and store it."""
+        if (
+            request.method != "GET"
+            or request.resource_type not in CACHEABLE_RESOURCE_TYPES
+            or not self.is_cacheable_url(request.url)
+        ):
+            await route.fallback()
+            return
+
+        cached = await asyncio.to_thread(self.get, request.url)
+        try:
+            if cached is not None:
+                body, headers = cached
+                await route.fulfill(status=200, headers=headers, body=body)
+                self.hits += 1
+                self.bytes_served += len(body)
+                return
+
+            self.misses += 1
+            response = await route.fetch()
+            body = await response.body()
+            if response.status == 200:
+                headers = {
+                    name: value
+                    for name, value in response.headers.items()
+                    if name.lower() in STORED_HEADERS
+                }
+                try:
+                    await asyncio.to_thread(self.put, request.url, body, headers)
+                except OSError as e:
+                    logger.debug(f"Could not cache {request.url}: {e}")
+
+            await route.fulfill(response=response, body=body)
+        except Exception as e:
+            # Never leave the request unresolved: let the network (or the next handler) serve it
+            logger.debug(f"Asset cache could not serve {request.url}: {e}")
+            try:
+                await route.fallback()
+            except Exception as fallback_error:
+                logger.debug(f"Fallback failed for {request.url}: {fallback_error}")
+
+    def get(self, url: str) -> Optional[Tuple[bytes, Dict[str, str]]]:
+        """
+        Look up a cached asset and mark it as recently used.
+
+        Args:
+            url: Asset URL
+
+        Returns:
+            (body, headers) or None on a miss
+        """
+        entry_path = self._index / f"{self._url_key(url)}.json"
+        try:
+            with open(entry_path, "r") as f:
+                entry = json.load(f)
+            object_path = self._object_path(entry["sha256"])
+            body = object_path.read_bytes()
+        except (FileNotFoundError, KeyError, ValueError):
+            return None
+
+        try:
+            os.utime(object_path)
+        except OSError:
+            pass
+
+        return body, entry.get("headers", {})
+
+    def put(self, url: str, body: bytes, headers: Dict[str, str]) -> None:
+        """
+        Store an asset body under its content hash and index its URL.
+
+        Args:
+            url: Asset URL
+            body: Response body
+            headers: Response headers to replay on hits
+        """
+        digest = hashlib.sha256(body).hexdigest()
+        object_path = self._object_path(digest)
+
+        if not object_path.exists():
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            self._atomic_write(object_path, body)
+            with self._size_lock:
+                self._size += len(body)
+
+        entry = {"url": url, "sha256": digest, "size": len(body), "headers": headers}
+        self._atomic_write(
+            self._index / f"{self._url_key(url)}.json",
+            json.dumps(entry).encode(),
+        )
+        self.stored += 1
+
+        with self._size_lock:
+            over_budget = self._size > self.max_bytes
+        if over_budget:
+            self.evict()
+
+    def evict(self, target_ratio: float = 0.9) -> int:
+        """
+        Delete least recently used objects until under ``target_ratio * max_bytes``.
+
+        Index entries of the removed objects are deleted with them. Holds the
+        inter-process lock, so concurrent processes don't evict twice.
+
+        Args:
+            target_ratio: Fraction of max_bytes to shrink to
+
+        Returns:
+            Number of objects removed
+        """
+        removed = 0
+        with _FileLock(self._lock_path):
+            objects = []
+            for path in self._objects.glob("*/*"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                objects.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in objects)
+            target = int(self.max_bytes * target_ratio)
+            removed_digests = set()
+            for _, size, path in sorted(objects, key=lambda item: item[0]):
+                if total <= target:
+                    break
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                total -= size
+                removed += 1
+                removed_digests.add(path.name)
+
+            if removed_digests:
+                self._remove_index_entries(removed_digests)
+
+            with self._size_lock:
+                self._size = total
+
+        self.evicted += removed
+        if removed:
+            logger.debug(f"Asset cache evicted {removed} objects")
+        return removed
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of cacheable requests served from disk."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters, hit rate and bytes served from cache."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 3),
+            "bytes_served": self.bytes_served,
+            "stored": self.stored,
+            "evicted": self.evicted,
+            "size_bytes": self._size,
+        }
+
+    def _remove_index_entries(self, digests: Set[str]) -> None:
+        """Delete the index entries pointing at the given objects."""
+        for entry_path in self._index.glob("*.json"):
+            try:
+                with open(entry_path, "r") as f:
+                    digest = json.load(f).get("sha256")
+            except (FileNotFoundError, ValueError):
+                continue
+            if digest in digests:
+                try:
+                    entry_path.unlink()
+                except FileNotFoundError:
+                    pass
+
+    def _object_path(self, digest: str) -> Path:
+        return self._objects / digest[:2] / digest
+
+    @staticmethod
+    def _url_key(url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def _scan_size(self) -> int:
+        total = 0
+        for path in self._objects.glob("*/*"):
+            try:
+                total += path.stat().st_size
+            except FileNotFoundError:
+                continue
+        return total
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes) -> None:
+        """Write via a temp file in the same directory and rename into place."""
+        fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
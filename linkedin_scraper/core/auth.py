@@ -3,15 +3,149 @@
 import asyncio
 import logging
 import os
+import time
+import weakref
 from typing import Optional, Tuple
-from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
-from dotenv import load_dotenv
+from urllib.parse import urlsplit
+from playwright.async_api import BrowserContext, Page, TimeoutError as PlaywrightTimeoutError
 
 from .exceptions import AuthenticationError
 from .utils import detect_rate_limit
 
 logger = logging.getLogger(__name__)
 
+# Seconds a successful login check is trusted before it is repeated
+AUTH_STATE_TTL = 600.0
+
+# Path prefixes LinkedIn redirects to when a session is missing, expired or challenged
+AUTH_REDIRECT_PATHS = ('/login', '/uas/login', '/authwall', '/checkpoint', '/challenge')
+
+# The subset of those that means the session itself is gone (not a challenge)
+LOGIN_REDIRECT_PATHS = ('/login', '/uas/login', '/authwall')
+
+# Any of these on the page means the global nav of a logged-in session
+LOGGED_IN_SELECTORS = (
+    '.global-nav__primary-link',
+    '[data-control-name="nav.settings"]',
+    '#global-nav',
+    '.feed-identity-module',
+)
+
+
+def is_auth_redirect(url: str) -> bool:
+    """
+    Check whether a URL is one of LinkedIn's login, authwall or checkpoint pages.
+    
+    Args:
+        url: Page URL (after redirects)
+        
+    Returns:
+        True if the URL means the session is not (or no longer) logged in
+    """
+    parts = urlsplit(url)
+    return parts.netloc.endswith('linkedin.com') and parts.path.startswith(AUTH_REDIRECT_PATHS)
+
+
+def is_login_redirect(url: str) -> bool:
+    """
+    Check whether a URL is LinkedIn's login page or authwall (session missing or expired).
+    
+    Args:
+        url: Page URL (after redirects)
+        
+    Returns:
+        True if the session needs to be replaced to continue
+    """
+    parts = urlsplit(url)
+    return parts.netloc.endswith('linkedin.com') and parts.path.startswith(LOGIN_REDIRECT_PATHS)
+
+
+class AuthState:
+    """
+    Cached login state of one browser context.
+    
+    A DOM check on every navigation costs protocol round trips on the hot
+    path. Instead the state is verified once, kept fresh passively by
+    watching where navigations end up (a redirect to a login, authwall or
+    checkpoint URL invalidates it), and re-verified only after such a
+    signal or once ``ttl`` seconds have passed.
+    """
+    
+    def __init__(self, ttl: float = AUTH_STATE_TTL):
+        """
+        Initialize auth state.
+        
+        Args:
+            ttl: Seconds a successful check is trusted
+        """
+        self.ttl = ttl
+        self.verified_at: Optional[float] = None
+        self.checks = 0
+        self.skipped = 0
+        self.invalidations = 0
+    
+    @property
+    def is_fresh(self) -> bool:
+        """True if a successful check happened within the last ``ttl`` seconds."""
+        return self.verified_at is not None and time.monotonic() - self.verified_at < self.ttl
+    
+    def mark_verified(self) -> None:
+        """Record a successful login check."""
+        self.verified_at = time.monotonic()
+    
+    def invalidate(self, reason: str = "") -> None:
+        """
+        Forget the last check so the next one hits the page again.
+        
+        Args:
+            reason: Why the state is no longer trusted (for logging)
+        """
+        if self.verified_at is not None:
+            self.invalidations += 1
+            logger.info(f"Auth state invalidated{': ' + reason if reason else ''}")
+        self.verified_at = None
+    
+    def observe_url(self, url: str) -> bool:
+        """
+        Passively update the state from where a navigation ended up.
+        
+        Args:
+            url: Page URL after the navigation (and its redirects)
+            
+        Returns:
+            False if the URL is an auth redirect, True otherwise
+        """
+        if is_auth_redirect(url):
+            self.invalidate(f"redirected to {url}")
+            return False
+        return True
+
+
+_auth_states: "weakref.WeakKeyDictionary[BrowserContext, AuthState]" = weakref.WeakKeyDictionary()
+
+
+def get_auth_state(context: BrowserContext, ttl: Optional[float] = None) -> AuthState:
+    """
+    Get the auth state tracked for a browser context, creating it if needed.
+    
+    Pages of the same context share cookies and therefore login state, so
+    one check covers every page (and scraper) in that context.
+    
+    Args:
+        context: Playwright browser context
+        ttl: Seconds a successful check is trusted (updates an existing state)
+        
+    Returns:
+        The context's AuthState
+    """
+    state = _auth_states.get(context)
+    if state is None:
+        state = AuthState(ttl if ttl is not None else AUTH_STATE_TTL)
+        _auth_states[context] = state
+    elif ttl is not None:
+        state.ttl = ttl
+    return state
+
 
 async def warm_up_browser(page: Page) -> None:
     """
@@ -52,6 +186,8 @@ def load_credentials_from_env() -> Tuple[Optional[str], Optional[str]]:
     Returns:
         Tuple of (email, password) or (None, None) if not found
     """
+    from dotenv import load_dotenv
+    
     load_dotenv()
     
     # Support both LINKEDIN_EMAIL and LINKEDIN_USERNAME
@@ -102,10 +238,10 @@ async def login_with_credentials(
     
     try:
         # Navigate to login page
-        await page.goto('https://www.linkedin.com/login', wait_until='domcontentloaded')
+        response = await page.goto('https://www.linkedin.com/login', wait_until='domcontentloaded')
         
         # Check for rate limiting
-        await detect_rate_limit(page)
+        await detect_rate_limit(page, response)
         
         # Wait for login form
         try:
@@ -167,6 +303,7 @@ async def login_with_credentials(
                 state='attached'
             )
             logger.info("✓ Successfully logged in to LinkedIn")
+            get_auth_state(page.context).mark_verified()
         except PlaywrightTimeoutError:
             # We might still be logged in, just can't find the nav element
             logger.warning(
@@ -224,6 +361,7 @@ async def login_with_cookie(page: Page, cookie_value: str) -> None:
                 state='attached'
             )
             logger.info("✓ Successfully authenticated with cookie")
+            get_auth_state(page.context).mark_verified()
         except PlaywrightTimeoutError:
             logger.warning(
                 "Could not verify cookie login. "
@@ -250,21 +388,9 @@ async def is_logged_in(page: Page) -> bool:
         # Check 1: URL contains 'feed'
         if "/feed" in page.url:
             return True
-            
-        # Check 2: Global Nav Bar presence
-        # Trying multiple common selectors
-        selectors = [
-            '.global-nav__primary-link',
-            '[data-control-name="nav.settings"]',
-            '#global-nav',
-            '.feed-identity-module'
-        ]
         
-        for selector in selectors:
-            if await page.locator(selector).count() > 0:
-                return True
-                
-        return False
+        # Check 2: Global Nav Bar presence (all selectors in one round trip)
+        return await page.locator(', '.join(LOGGED_IN_SELECTORS)).count() > 0
     except Exception:
         return False
 
@@ -291,6 +417,7 @@ async def wait_for_manual_login(page: Page, timeout: int = 300000) -> None:
         # Check if logged in
         if await is_logged_in(page):
             logger.info("✓ Manual login completed successfully")
+            get_auth_state(page.context).mark_verified()
             return
         
         # Check timeout
@@ -3,14 +3,24 @@
 import asyncio
 import json
 import logging
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator, Awaitable, Callable, List
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
 
-from .exceptions import NetworkError
+from .exceptions import NetworkError, PageCrashedError
+from .pool import PagePool, ContextPool, read_storage_state, apply_storage_state
+from .routing import RequestRouter
+from .asset_cache import AssetCache
+from .recycle import RecycleBudget, chromium_rss
+from .launch import get_launch_profile, merge_args
 
 logger = logging.getLogger(__name__)
 
+# Environment variable the entry-point scripts read the browser server endpoint from
+BROWSER_ENDPOINT_ENV = "LINKEDIN_BROWSER_ENDPOINT"
+
 
 class BrowserManager:
     """Async context manager for Playwright browser lifecycle."""
@@ -21,6 +31,19 @@ class BrowserManager:
         slow_mo: int = 0,
         viewport: Optional[Dict[str, int]] = None,
         user_agent: Optional[str] = None,
+        page_pool_size: int = 1,
+        page_max_uses: int = 50,
+        pages_per_context: int = 1,
+        routing_profile: str = "full",
+        router: Optional[RequestRouter] = None,
+        asset_cache: Optional[AssetCache] = None,
+        recycle_after_pages: Optional[int] = None,
+        recycle_rss_mb: Optional[int] = None,
+        user_data_dir: Optional[str] = None,
+        endpoint: Optional[str] = None,
+        launch_profile: str = "default",
+        lazy: bool = False,
+        soft_navigation: bool = False,
         **launch_options: Any
     ):
         """
@@ -29,21 +52,89 @@ class BrowserManager:
         Args:
             headless: Run browser in headless mode
             slow_mo: Slow down operations by specified milliseconds
-            viewport: Browser viewport size (default: 1280x720)
+            viewport: Browser viewport size (default: from the launch profile,
+                1280x720 for "default")
             user_agent: Custom user agent string
-            **launch_options: Additional Playwright launch options
+            page_pool_size: Number of pages kept in the lease_page() pool
+                (usually the number of concurrent workers)
+            page_max_uses: Leases after which a pooled page is recycled
+            pages_per_context: Pages pooled for each worker context leased
+                through lease_context()
+            routing_profile: Request blocking profile applied to every context
+                ("full", "no-media" or "text-only")
+            router: Custom RequestRouter (overrides routing_profile)
+            asset_cache: On-disk static asset cache shared by every context
+            recycle_after_pages: Drain and relaunch the browser after this
+                many page leases (None: never)
+            recycle_rss_mb: Drain and relaunch the browser when Chromium's
+                combined RSS exceeds this many MB (None: never, Linux only)
+            user_data_dir: Persistent profile directory. When set, Chromium is
+                launched with launch_persistent_context() so the disk cache,
+                service workers and compiled code survive between runs
+            endpoint: CDP endpoint of a running browser server (see
+                browser_server.py), e.g. "http://127.0.0.1:9222". When set,
+                start() connects instead of launching Chromium, and close()
+                only disconnects
+            launch_profile: Named Chromium switches/viewport/context settings
+                ("default" or "low_memory", see LAUNCH_PROFILES). Ignored
+                for the browser flags when attaching through ``endpoint``
+            lazy: Defer launching Chromium until the first lease. start() then
+                returns immediately (not even the Playwright driver starts),
+                load_session() only parses
+                the session file and start_context_pool() only records the
+                size, so a run with nothing to fetch never launches a browser
+            soft_navigation: Keep pooled pages loaded between leases instead of
+                resetting them to about:blank, so scrapers created with
+                ``soft_navigation=browser.soft_navigation`` can move to the
+                next profile with in-app navigation
+            **launch_options: Additional Playwright launch options (``args``
+                are merged with the profile's switches)
         """
         self.headless = headless
         self.slow_mo = slow_mo
-        self.viewport = viewport or {"width": 1280, "height": 720}
+        self.launch_profile = launch_profile
+        self._launch_profile = get_launch_profile(launch_profile)
+        self.viewport = viewport or dict(self._launch_profile["viewport"])
         self.user_agent = user_agent
         self.launch_options = launch_options
+        self.page_pool_size = page_pool_size
+        self.page_max_uses = page_max_uses
+        self.pages_per_context = pages_per_context
+        self.soft_navigation = soft_navigation
+        self.router = router or RequestRouter.from_profile(routing_profile)
+        self.asset_cache = asset_cache
+        self.recycle_budget = RecycleBudget(recycle_after_pages, recycle_rss_mb)
+        self.recycle_history: List[Dict[str, Any]] = []
+        self.pages_served = 0
+        self.user_data_dir = user_data_dir
+        self.endpoint = endpoint
+        
+        if user_data_dir and endpoint:
+            raise ValueError("user_data_dir and endpoint are mutually exclusive")
         
         self._playwright: Optional[Playwright] = None
         self._browser: Optional[Browser] = None
         self._context: Optional[BrowserContext] = None
         self._page: Optional[Page] = None
+        self._page_pool: Optional[PagePool] = None
+        self._context_pool: Optional[ContextPool] = None
+        self._context_page_pools: Dict[BrowserContext, PagePool] = {}
+        self._context_pool_size: Optional[int] = None
+        self._storage_state: Optional[Dict[str, Any]] = None
         self._is_authenticated = False
+        
+        # Lease gate used to drain work before a recycle
+        self._active_leases = 0
+        self._drained = asyncio.Event()
+        self._drained.set()
+        self._ready = asyncio.Event()
+        self._ready.set()
+        self._recycle_lock = asyncio.Lock()
+        
+        # Deferred launch (lazy=True)
+        self.lazy = lazy
+        self._lazy_started = False
+        self._launch_lock = asyncio.Lock()
     
     async def __aenter__(self) -> "BrowserManager":
         """Start browser and create context."""
@@ -55,62 +146,265 @@ class BrowserManager:
         await self.close()
     
     async def start(self) -> None:
-        """Start Playwright and launch browser."""
+        """Start Playwright and launch browser (deferred to the first lease when lazy)."""
+        if self.lazy:
+            self._lazy_started = True
+            logger.info("Browser launch deferred until first use")
+            return
+        
         try:
             self._playwright = await async_playwright().start()
+            await self._launch()
             
-            # Launch browser
-            self._browser = await self._playwright.chromium.launch(
-                headless=self.headless,
+        except Exception as e:
+            await self.close()
+            raise NetworkError(f"Failed to start browser: {e}")
+    
+    @property
+    def is_launched(self) -> bool:
+        """True once the browser (or persistent context) is up."""
+        return self._context is not None
+    
+    async def ensure_launched(self) -> None:
+        """
+        Launch the browser now if a lazy start deferred it.
+        
+        Concurrent callers share one launch. Pools requested before the
+        launch are built right after it.
+        """
+        if self.is_launched:
+            return
+        
+        async with self._launch_lock:
+            if self.is_launched:
+                return
+            if not self._playwright and not self._lazy_started:
+                raise RuntimeError("Browser not started. Use async context manager or call start().")
+            
+            try:
+                if not self._playwright:
+                    self._playwright = await async_playwright().start()
+                await self._launch()
+                if self._context_pool_size:
+                    await self.start_context_pool(self._context_pool_size)
+            except Exception as e:
+                await self._shutdown_browser()
+                raise NetworkError(f"Failed to launch browser: {e}")
+    
+    @property
+    def _page_reset_url(self) -> Optional[str]:
+        """URL pooled pages are reset to on release (None: leave the app loaded)."""
+        return None if self.soft_navigation else "about:blank"
+    
+    @property
+    def persistent(self) -> bool:
+        """True if the browser runs on a persistent profile (user_data_dir)."""
+        return self.user_data_dir is not None
+    
+    async def _launch(self) -> None:
+        """Launch the browser and create the main context and page."""
+        if self.persistent:
+            await self._launch_persistent()
+            return
+        
+        if self.endpoint:
+            # The server owns the browser; this only opens a CDP connection
+            self._browser = await self._playwright.chromium.connect_over_cdp(  # type: ignore[union-attr]
+                self.endpoint,
                 slow_mo=self.slow_mo,
-                **self.launch_options
+            )
+            logger.info(f"Connected to browser server at {self.endpoint}")
+        else:
+            # Launch browser
+            self._browser = await self._launch_chromium(
+                self._playwright.chromium.launch,  # type: ignore[union-attr]
             )
             
-            logger.info(f"Browser launched (headless={self.headless})")
-            
-            # Create context
-            context_options: Dict[str, Any] = {
-                "viewport": self.viewport,
-            }
-            
-            if self.user_agent:
-                context_options["user_agent"] = self.user_agent
-            
-            self._context = await self._browser.new_context(**context_options)
-            
-            # Create initial page
-            self._page = await self._context.new_page()
-            
-            logger.info("Browser context and page created")
+            logger.info(f"Browser launched (headless={self.headless}, profile={self.launch_profile})")
+        
+        # Create context (keeps the loaded session across relaunches)
+        self._context = await self.new_context(self._storage_state)
+        
+        # Create initial page
+        self._page = await self._context.new_page()
+        
+        self.pages_served = 0
+        self.recycle_budget.reset()
+        
+        logger.info("Browser context and page created")
+    
+    async def _launch_persistent(self) -> None:
+        """Launch Chromium on the persistent profile; its context is the main context."""
+        Path(self.user_data_dir).mkdir(parents=True, exist_ok=True)  # type: ignore[arg-type]
+        
+        self._context = await self._launch_chromium(
+            self._playwright.chromium.launch_persistent_context,  # type: ignore[union-attr]
+            self.user_data_dir,
+            **self._context_options()
+        )
+        # Persistent contexts have no separate Browser object
+        self._browser = self._context.browser
+        
+        logger.info(f"Browser launched on persistent profile {self.user_data_dir} (headless={self.headless})")
+        
+        await self._configure_context(self._context)
+        if self._storage_state is not None:
+            await apply_storage_state(self._context, self._storage_state)
+        
+        # Chromium opens the persistent profile with one blank page
+        self._page = self._context.pages[0] if self._context.pages else await self._context.new_page()
+        
+        self.pages_served = 0
+        self.recycle_budget.reset()
+        
+        logger.info("Persistent context and page ready")
+    
+    async def _launch_chromium(self, launcher: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        """
+        Call a Playwright launcher with the launch profile applied.
+        
+        The profile's channel (e.g. the headless shell) is only a preference:
+        if that build is not installed, Chromium is launched without it.
+        
+        Args:
+            launcher: chromium.launch or chromium.launch_persistent_context
+            *args: Positional arguments for the launcher
+            **kwargs: Extra keyword arguments for the launcher
             
+        Returns:
+            Whatever the launcher returns (Browser or BrowserContext)
+        """
+        options: Dict[str, Any] = dict(self.launch_options)
+        options["args"] = merge_args(self._launch_profile["args"], options.get("args"))
+        
+        channel = self._launch_profile["channel"]
+        preferred_channel = self.headless and channel and "channel" not in options
+        if preferred_channel:
+            options["channel"] = channel
+        
+        try:
+            return await launcher(*args, headless=self.headless, slow_mo=self.slow_mo, **options, **kwargs)
         except Exception as e:
-            await self.close()
-            raise NetworkError(f"Failed to start browser: {e}")
+            if not preferred_channel:
+                raise
+            logger.info(f"Channel {channel} unavailable, using the default Chromium build: {e}")
+            options.pop("channel")
+            return await launcher(*args, headless=self.headless, slow_mo=self.slow_mo, **options, **kwargs)
     
     async def close(self) -> None:
         """Close browser and cleanup resources."""
         try:
-            if self._page:
-                await self._page.close()
-                self._page = None
-            
-            if self._context:
-                await self._context.close()
-                self._context = None
-            
-            if self._browser:
-                await self._browser.close()
-                self._browser = None
+            await self._shutdown_browser()
             
             if self._playwright:
                 await self._playwright.stop()
                 self._playwright = None
+            self._lazy_started = False
             
             logger.info("Browser closed")
             
         except Exception as e:
             logger.error(f"Error closing browser: {e}")
     
+    async def _shutdown_browser(self) -> None:
+        """
+        Close pools, the main page/context and the browser (Playwright stays up).
+        
+        A browser reached through ``endpoint`` is only disconnected: closing
+        it drops the contexts this manager created and leaves the server running.
+        """
+        await self._close_page_pool()
+        await self._close_context_pool()
+        
+        if self._page:
+            await self._page.close()
+            self._page = None
+        
+        if self._context:
+            await self._context.close()
+            self._context = None
+        
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+    
+    async def recycle(self, reason: str = "manual") -> None:
+        """
+        Drain in-flight leases, then relaunch the browser and rebuild pools.
+        
+        New leases wait until the relaunch is done, so queued work is not
+        lost; it simply resumes on the fresh browser. The loaded session and
+        pool sizes carry over.
+        
+        Args:
+            reason: Why the browser is recycled (logged and kept in recycle_history)
+        """
+        async with self._recycle_lock:
+            self._ready.clear()
+            try:
+                drain_start = time.monotonic()
+                await self._drained.wait()
+                drain_seconds = time.monotonic() - drain_start
+                
+                rss_before = chromium_rss()
+                pages_served = self.pages_served
+                context_pool_size = self._context_pool_size
+                had_page_pool = self._page_pool is not None
+                
+                relaunch_start = time.monotonic()
+                await self._shutdown_browser()
+                await self._launch()
+                if had_page_pool:
+                    await self.start_page_pool()
+                if context_pool_size:
+                    await self.start_context_pool(context_pool_size)
+                
+                entry = {
+                    "reason": reason,
+                    "pages_served": pages_served,
+                    "rss_before_mb": round(rss_before / 1_048_576, 1) if rss_before is not None else None,
+                    "rss_after_mb": None,
+                    "drain_seconds": round(drain_seconds, 2),
+                    "relaunch_seconds": round(time.monotonic() - relaunch_start, 2),
+                }
+                rss_after = chromium_rss()
+                if rss_after is not None:
+                    entry["rss_after_mb"] = round(rss_after / 1_048_576, 1)
+                self.recycle_history.append(entry)
+                
+                logger.info(
+                    f"Browser recycled ({reason}): served {pages_served} pages, "
+                    f"RSS {entry['rss_before_mb']} -> {entry['rss_after_mb']} MB, "
+                    f"drain {entry['drain_seconds']}s, relaunch {entry['relaunch_seconds']}s"
+                )
+            finally:
+                self._ready.set()
+    
+    async def _enter_lease(self) -> None:
+        """Wait for any recycle in progress, trigger one if over budget, then register a lease."""
+        while True:
+            await self._ready.wait()
+            # After the wait, so a lazy launch never races a recycle's relaunch
+            await self.ensure_launched()
+            
+            if self.recycle_budget.enabled and not self._recycle_lock.locked():
+                reason = self.recycle_budget.exceeded(self.pages_served)
+                if reason:
+                    await self.recycle(reason)
+                    continue
+            
+            if self._ready.is_set():
+                break
+        
+        self._active_leases += 1
+        self._drained.clear()
+    
+    def _exit_lease(self) -> None:
+        """Unregister a lease and signal when all leases are back."""
+        self._active_leases -= 1
+        if self._active_leases == 0:
+            self._drained.set()
+    
     async def new_page(self) -> Page:
         """
         Create a new page in the current context.
@@ -124,6 +418,241 @@ class BrowserManager:
         page = await self._context.new_page()
         return page
     
+    async def start_page_pool(self, size: Optional[int] = None, max_uses: Optional[int] = None) -> PagePool:
+        """
+        Create (or resize) the page pool and pre-warm its pages.
+        
+        Args:
+            size: Number of pooled pages (default: page_pool_size)
+            max_uses: Leases after which a page is recycled (default: page_max_uses)
+            
+        Returns:
+            The active page pool
+        """
+        if not self._context:
+            raise RuntimeError("Browser context not initialized. Call start() first.")
+        
+        if size is not None:
+            self.page_pool_size = size
+        if max_uses is not None:
+            self.page_max_uses = max_uses
+        
+        await self._close_page_pool()
+        self._page_pool = PagePool(
+            self._context.new_page,
+            size=self.page_pool_size,
+            max_uses=self.page_max_uses,
+            reset_url=self._page_reset_url,
+        )
+        await self._page_pool.warm()
+        
+        logger.info(f"Page pool started with {self.page_pool_size} pages")
+        return self._page_pool
+    
+    @asynccontextmanager
+    async def lease_page(self, context: Optional[BrowserContext] = None) -> AsyncIterator[Page]:
+        """
+        Lease a pooled page for the duration of an ``async with`` block.
+        
+        The page is reset to about:blank and returned to the pool afterwards
+        instead of being closed. The pool is started on first use if
+        start_page_pool() was not called.
+        
+        Args:
+            context: Worker context from lease_context() (default: main context)
+        
+        Yields:
+            Playwright page
+        """
+        main = context is None or context is self._context
+        # Pages of a leased worker context are already covered by its lease;
+        # on a persistent profile lease_context() hands out the main context
+        gated = context is None or (main and not self.persistent)
+        if gated:
+            await self._enter_lease()
+        
+        try:
+            if not main:
+                pool = self._context_page_pools.get(context)  # type: ignore[arg-type]
+                if pool is None:
+                    pool = PagePool(
+                        context.new_page,  # type: ignore[union-attr]
+                        size=self.pages_per_context,
+                        max_uses=self.page_max_uses,
+                        reset_url=self._page_reset_url,
+                    )
+                    self._context_page_pools[context] = pool  # type: ignore[index]
+            else:
+                if not self._page_pool:
+                    await self.start_page_pool()
+                pool = self._page_pool  # type: ignore[assignment]
+            
+            async with pool.lease() as page:
+                yield page
+        finally:
+            self.pages_served += 1
+            if gated:
+                self._exit_lease()
+    
+    @property
+    def page_pool(self) -> Optional[PagePool]:
+        """
+        Get the active page pool.
+        
+        Returns:
+            Page pool, or None if it has not been started
+        """
+        return self._page_pool
+    
+    async def new_context(self, storage_state: Optional[Dict[str, Any]] = None) -> BrowserContext:
+        """
+        Create a new browser context with this manager's context options.
+        
+        Args:
+            storage_state: Parsed storage state to start the context from
+            
+        Returns:
+            New Playwright browser context
+        """
+        if self.persistent:
+            raise RuntimeError("A persistent profile has a single context; use the main context")
+        if not self._browser:
+            raise RuntimeError("Browser not started")
+        
+        context_options = self._context_options()
+        
+        if storage_state is not None:
+            context_options["storage_state"] = storage_state
+        
+        context = await self._browser.new_context(**context_options)
+        await self._configure_context(context)
+        return context
+    
+    def _context_options(self) -> Dict[str, Any]:
+        """Context options shared by new_context() and the persistent launch."""
+        context_options: Dict[str, Any] = {
+            **self._launch_profile["context_options"],
+            "viewport": self.viewport,
+        }
+        
+        if self.user_agent:
+            context_options["user_agent"] = self.user_agent
+        
+        return context_options
+    
+    async def _configure_context(self, context: BrowserContext) -> None:
+        """Install the asset cache and request router on a context."""
+        # The cache handler must be registered first: Playwright runs the most
+        # recently registered route first, and the router falls back to it.
+        if self.asset_cache:
+            await self.asset_cache.attach(context)
+        await self.router.attach(context)
+    
+    async def start_context_pool(self, size: int, warm: bool = True) -> Optional[ContextPool]:
+        """
+        Create a pool of isolated per-worker contexts.
+        
+        Every context starts from the storage state loaded by load_session(),
+        parsed once and kept in memory.
+        
+        A persistent profile cannot open extra contexts, so there every
+        worker shares the main context and the page pool is grown to
+        ``size * pages_per_context`` pages instead.
+        
+        Args:
+            size: Number of contexts (usually the number of workers)
+            warm: Create all contexts up front
+            
+        Returns:
+            The active context pool (None on a persistent profile, or until
+            a lazy browser is launched)
+        """
+        await self._close_context_pool()
+        self._context_pool_size = size
+        
+        if not self.is_launched:
+            # Lazy start: built by ensure_launched() on the first lease
+            return None
+        
+        if self.persistent:
+            pages = size * self.pages_per_context
+            if not self._page_pool or self.page_pool_size < pages:
+                await self.start_page_pool(max(self.page_pool_size, pages))
+            logger.info(f"Persistent profile shared by {size} workers ({self.page_pool_size} pages)")
+            return None
+        
+        self._context_pool = ContextPool(
+            self.new_context,
+            size=size,
+            storage_state=self._storage_state,
+        )
+        if warm:
+            await self._context_pool.warm()
+        
+        logger.info(f"Context pool started with {size} contexts")
+        return self._context_pool
+    
+    @asynccontextmanager
+    async def lease_context(self) -> AsyncIterator[BrowserContext]:
+        """
+        Lease an isolated worker context for an ``async with`` block.
+        
+        Use lease_page(context) to get pooled pages inside it. Hold the lease
+        for one task at a time: a recycle waits for all leases to come back.
+        If the block raises PageCrashedError, the context and its pages are
+        closed and a fresh context takes their place.
+        
+        Yields:
+            Playwright browser context
+        """
+        await self._enter_lease()
+        try:
+            if not self._context_pool_size:
+                raise RuntimeError("Context pool not started. Call start_context_pool() first.")
+            
+            if self.persistent:
+                yield self.context
+            else:
+                async with self._context_pool.lease() as context:  # type: ignore[union-attr]
+                    try:
+                        yield context
+                    except PageCrashedError:
+                        pool = self._context_page_pools.pop(context, None)
+                        if pool:
+                            await pool.close()
+                        raise
+        finally:
+            self._exit_lease()
+    
+    @property
+    def context_pool(self) -> Optional[ContextPool]:
+        """
+        Get the active context pool.
+        
+        Returns:
+            Context pool, or None if it has not been started
+        """
+        return self._context_pool
+    
+    async def _close_context_pool(self) -> None:
+        """Close the context pool and the page pools of its contexts."""
+        self._context_pool_size = None
+        for pool in self._context_page_pools.values():
+            await pool.close()
+        self._context_page_pools.clear()
+        
+        if self._context_pool:
+            logger.debug(f"Closing context pool: {self._context_pool.stats}")
+            await self._context_pool.close()
+            self._context_pool = None
+    
+    async def _close_page_pool(self) -> None:
+        """Close the page pool, if any."""
+        if self._page_pool:
+            logger.debug(f"Closing page pool: {self._page_pool.stats}")
+            await self._page_pool.close()
+            self._page_pool = None
+    
     @property
     def page(self) -> Page:
         """
@@ -153,6 +682,8 @@ class BrowserManager:
         """
         Get the browser instance.
         
+        Not available on a persistent profile, which has no Browser object.
+        
         Returns:
             Playwright browser
         """
@@ -184,34 +715,89 @@ class BrowserManager:
         """
         Load browser session from file.
         
+        The file is parsed once and kept in memory; contexts created later by
+        start_context_pool() reuse the parsed state instead of re-reading it.
+        
+        On a persistent profile the state is applied to the existing context
+        (the profile's own cookies are replaced) since it cannot be recreated.
+        
         Args:
             filepath: Path to session file
         """
-        if not Path(filepath).exists():
-            raise FileNotFoundError(f"Session file not found: {filepath}")
+        storage_state = read_storage_state(filepath)
         
-        # Close existing context and create new one with stored state
-        if self._context:
-            await self._context.close()
+        if not self.is_launched and self.lazy:
+            # Applied to the main context and pools when the browser launches
+            self._storage_state = storage_state
+            self._is_authenticated = True
+            logger.info(f"Session parsed from {filepath} (applied at launch)")
+            return
+        
+        if self.persistent:
+            if not self._context:
+                raise RuntimeError("Browser not started")
+            self._storage_state = storage_state
+            await apply_storage_state(self._context, storage_state)
+            self._is_authenticated = True
+            logger.info(f"Session loaded from {filepath} into persistent profile")
+            return
         
         if not self._browser:
             raise RuntimeError("Browser not started")
         
-        self._context = await self._browser.new_context(
-            storage_state=filepath,
-            viewport=self.viewport,
-            user_agent=self.user_agent
-        )
+        # Close existing context and create new one with stored state
+        await self._close_page_pool()
+        if self._context:
+            await self._context.close()
+        
+        self._storage_state = storage_state
+        self._context = await self.new_context(storage_state)
         
         # Create new page
         if self._page:
             await self._page.close()
         self._page = await self._context.new_page()
         
+        # Contexts handed to workers pick up the new state in place
+        if self._context_pool:
+            await self._context_pool.update_storage_state(storage_state)
+        
         self._is_authenticated = True
         
         logger.info(f"Session loaded from {filepath}")
     
+    async def reload_session(self, filepath: str) -> None:
+        """
+        Hot-swap a session file into the main context and all pooled contexts.
+        
+        Unlike load_session(), no context is closed, so pages that are
+        currently leased keep running with the refreshed cookies.
+        
+        Args:
+            filepath: Path to session file
+        """
+        storage_state = read_storage_state(filepath)
+        self._storage_state = storage_state
+        
+        if self._context:
+            await apply_storage_state(self._context, storage_state)
+        if self._context_pool:
+            await self._context_pool.update_storage_state(storage_state)
+        
+        self._is_authenticated = True
+        
+        logger.info(f"Session reloaded from {filepath}")
+    
+    @property
+    def storage_state(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the in-memory storage state loaded from the session file.
+        
+        Returns:
+            Parsed storage state, or None if no session was loaded
+        """
+        return self._storage_state
+    
     async def set_cookie(self, name: str, value: str, domain: str = ".linkedin.com") -> None:
         """
         Set a single cookie.
@@ -0,0 +1,108 @@
+"""Per-scrape time budget that bounds every wait, probe and navigation."""
+
+import logging
+import time
+from typing import Optional
+
+from .exceptions import DeadlineExceededError
+
+logger = logging.getLogger(__name__)
+
+
+class Deadline:
+    """
+    Time budget for one scrape.
+
+    Scrapers clamp each timeout to what is left of the budget, so the waits
+    of a bad page can't add up past it. Once the budget is spent, new
+    navigations and content waits raise DeadlineExceededError (probes just
+    stop waiting), and the scraper returns what it has so far.
+
+    ``cut_short`` records whether the budget actually cut something short
+    (a wait it shortened ran out, or a step was skipped), as opposed to
+    running out just after the last step finished.
+
+    A Deadline without a budget never expires.
+
+    Example:
+        person = await PersonScraper(page).scrape(url, deadline=Deadline(90))
+        if person.incomplete:
+            ...
+    """
+
+    def __init__(self, budget: Optional[float] = None):
+        """
+        Initialize deadline.
+
+        Args:
+            budget: Seconds from now until the deadline (None: no deadline)
+        """
+        self.budget = budget
+        self.expires_at = time.monotonic() + budget if budget is not None else None
+        self.cut_short = False
+
+    def remaining_ms(self) -> Optional[float]:
+        """
+        Get the time left.
+
+        Returns:
+            Milliseconds until the deadline (0 once passed), or None without a budget
+        """
+        if self.expires_at is None:
+            return None
+        return max(0.0, (self.expires_at - time.monotonic()) * 1000)
+
+    @property
+    def expired(self) -> bool:
+        """True once the budget is spent."""
+        return self.remaining_ms() == 0
+
+    def clamp(self, timeout_ms: float) -> float:
+        """
+        Limit a timeout to the time left.
+
+        Args:
+            timeout_ms: Timeout the caller would use (milliseconds)
+
+        Returns:
+            The smaller of the timeout and the time left
+        """
+        remaining = self.remaining_ms()
+        return timeout_ms if remaining is None else min(timeout_ms, remaining)
+
+    def mark_cut_short(self, what: str) -> None:
+        """
+        Record that the budget cut a step short.
+
+        Args:
+            what: The step that was cut short (for logging)
+        """
+        if not self.cut_short:
+            logger.debug(f"Time budget cut short {what}")
+        self.cut_short = True
+
+    def exceeded(self, message: str) -> DeadlineExceededError:
+        """
+        Build the error for a step the budget cut short, and record it.
+
+        Args:
+            message: Error message
+
+        Returns:
+            DeadlineExceededError to raise
+        """
+        self.mark_cut_short(message)
+        return DeadlineExceededError(message)
+
+    def check(self, what: str = "scrape") -> None:
+        """
+        Raise if the budget is spent.
+
+        Args:
+            what: What was about to start (for the error message)
+
+        Raises:
+            DeadlineExceededError: If the deadline has passed
+        """
+        if self.expired:
+            raise self.exceeded(f"Time budget of {self.budget:g}s exhausted before {what}")
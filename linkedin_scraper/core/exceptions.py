@@ -11,6 +11,11 @@ class AuthenticationError(LinkedInScraperException):
     pass
 
 
+class SessionExpiredError(AuthenticationError):
+    """Raised when a navigation is redirected to login because the session expired."""
+    pass
+
+
 class RateLimitError(LinkedInScraperException):
     """Raised when rate limiting is detected."""
     
@@ -37,3 +42,18 @@ class NetworkError(LinkedInScraperException):
 class ScrapingError(LinkedInScraperException):
     """Raised when scraping fails for various reasons."""
     pass
+
+
+class PageCrashedError(ScrapingError):
+    """Raised when a page crashes or is closed while a task is running on it."""
+    pass
+
+
+class TaskTimeoutError(ScrapingError):
+    """Raised when a task exceeds its wall-clock ceiling."""
+    pass
+
+
+class DeadlineExceededError(ScrapingError):
+    """Raised when a scrape's time budget runs out before a navigation or wait."""
+    pass
@@ -0,0 +1,280 @@
+"""Hedged navigation: race a second load of a slow page on a spare page."""
+
+import asyncio
+import logging
+import time
+import weakref
+from typing import Any, Dict, Optional, Tuple
+from playwright.async_api import BrowserContext, Page, Response, TimeoutError as PlaywrightTimeoutError
+
+from .latency import LatencyTracker, latency_tracker
+from .pool import PagePool
+
+logger = logging.getLogger(__name__)
+
+
+class HedgePolicy:
+    """
+    Opt-in hedging of navigations that run past the live p95.
+
+    ``goto()`` loads the URL as usual, but once the load has taken longer
+    than the page type's current p95 (see LatencyTracker) it starts a second
+    load of the same URL on a spare page of the same browser context. Whichever
+    finishes first is kept; the other is stopped. A stall near the timeout
+    then costs roughly p95 plus one normal load instead of the full timeout.
+
+    Hedges are capped at ``budget`` extra navigations per navigation (5% by
+    default), so the extra load on the site stays small. Spare pages come
+    from a small pool per context and are never created while ``spare_pages``
+    hedges are already in flight there.
+
+    When the hedge wins, the caller continues on the spare page and must
+    hand it back with ``release()`` once done with it. A context's spare
+    pages are dropped once the context closes (e.g. when
+    ``BrowserManager.recycle()`` relaunches the browser).
+
+    Example:
+        hedge = HedgePolicy(budget=0.05)
+        page, response = await hedge.goto(page, url, "profile", timeout=60000)
+        ...
+        await hedge.release(page)
+        print(hedge.stats)
+        await hedge.close()  # at shutdown
+    """
+
+    def __init__(
+        self,
+        budget: float = 0.05,
+        percentile: str = "p95",
+        min_delay_ms: float = 1000,
+        spare_pages: int = 1,
+        tracker: Optional[LatencyTracker] = None,
+    ):
+        """
+        Initialize hedge policy.
+
+        Args:
+            budget: Maximum hedges per navigation (0.05: at most 5% extra loads)
+            percentile: Latency percentile after which a load is hedged ("p50", "p95" or "p99")
+            min_delay_ms: Never hedge a load before it has run this long
+            spare_pages: Spare pages (concurrent hedges) per browser context
+            tracker: Latency source (default: the process-wide tracker)
+        """
+        self.budget = budget
+        self.percentile = percentile
+        self.min_delay_ms = min_delay_ms
+        self.spare_pages = spare_pages
+        self.tracker = tracker or latency_tracker
+
+        self._spares: "weakref.WeakKeyDictionary[BrowserContext, PagePool]" = weakref.WeakKeyDictionary()
+        self._leased: "weakref.WeakKeyDictionary[Page, PagePool]" = weakref.WeakKeyDictionary()
+
+        self.navigations = 0
+        self.hedges = 0
+        self.wins = 0
+        self.over_budget = 0
+        self.no_spare = 0
+        self.saved_ms = 0.0
+
+    def delay_ms(self, key: str) -> Optional[float]:
+        """
+        Get how long a load of this page type runs before it is hedged.
+
+        Args:
+            key: Page type
+
+        Returns:
+            Delay in milliseconds, or None until the page type has enough samples
+        """
+        stats = self.tracker.percentiles(key)
+        if stats is None or stats["count"] < self.tracker.min_samples:
+            return None
+        return max(self.min_delay_ms, stats[self.percentile])
+
+    def _take_budget(self) -> bool:
+        """Reserve one hedge if the budget allows it."""
+        if self.hedges + 1 > self.budget * self.navigations:
+            self.over_budget += 1
+            return False
+        self.hedges += 1
+        return True
+
+    def _spare_pool(self, context: BrowserContext) -> PagePool:
+        pool = self._spares.get(context)
+        if pool is None:
+            pool = PagePool(context.new_page, size=self.spare_pages)
+            self._spares[context] = pool
+            # The pool's pages reference the context, so drop it explicitly
+            context.on("close", lambda _: self.forget(context))
+        return pool
+
+    def forget(self, context: BrowserContext) -> None:
+        """
+        Drop the spare pages of a closed (or retired) context.
+
+        Called when the context emits ``close``; its pages are gone with it.
+
+        Args:
+            context: Browser context
+        """
+        pool = self._spares.pop(context, None)
+        if pool is None:
+            return
+        for page, owner in list(self._leased.items()):
+            if owner is pool:
+                del self._leased[page]
+
+    async def goto(
+        self,
+        page: Page,
+        url: str,
+        key: str,
+        wait_until: str = "domcontentloaded",
+        timeout: float = 60000,
+        record_timeout: bool = True,
+    ) -> Tuple[Page, Optional[Response]]:
+        """
+        Navigate, hedging the load on a spare page if it runs past the p95.
+
+        The navigation's latency is recorded in the tracker under ``key``;
+        when the hedge wins, the hedge's own load time is recorded (the
+        abandoned load has no latency to record).
+
+        Args:
+            page: Page to navigate
+            url: URL to load
+            key: Page type (e.g. "profile")
+            wait_until: Wait condition (domcontentloaded, networkidle, load)
+            timeout: Timeout of the whole navigation in milliseconds
+            record_timeout: Count a timeout in the tracker (False when the
+                caller cut the timeout short, e.g. to a time budget)
+
+        Returns:
+            Tuple of the page that holds the loaded URL (``page`` or a spare
+            page to release() later) and the navigation response
+
+        Raises:
+            PlaywrightTimeoutError: If no load finished within the timeout
+        """
+        self.navigations += 1
+        start = time.monotonic()
+
+        def elapsed_ms() -> float:
+            return (time.monotonic() - start) * 1000
+
+        primary = asyncio.ensure_future(page.goto(url, wait_until=wait_until, timeout=timeout))  # type: ignore
+        hedge: Optional[asyncio.Future] = None
+        spare: Optional[Page] = None
+        try:
+            delay = self.delay_ms(key)
+            if delay is not None and delay < timeout:
+                await asyncio.wait({primary}, timeout=delay / 1000)
+                hedging = not primary.done() and self._take_budget()
+            else:
+                hedging = False
+            if not hedging:
+                response = await primary
+                self.tracker.record(key, elapsed_ms())
+                return page, response
+
+            pool = self._spare_pool(page.context)
+            try:
+                spare = await pool.try_acquire()
+            except Exception as e:
+                logger.debug(f"No spare page for hedging: {e}")
+            if spare is None:
+                # Every spare of this context is busy with another hedge
+                self.hedges -= 1
+                self.no_spare += 1
+                response = await primary
+                self.tracker.record(key, elapsed_ms())
+                return page, response
+            self._leased[spare] = pool
+
+            logger.debug(f"Hedging navigation to {url} after {elapsed_ms():.0f}ms")
+            hedge_start = time.monotonic()
+            hedge = asyncio.ensure_future(
+                spare.goto(url, wait_until=wait_until, timeout=max(1, timeout - elapsed_ms()))  # type: ignore
+            )
+
+            # Keep the first load that succeeds; if one fails, wait for the other
+            winner = None
+            pending = {primary, hedge}
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in (primary, hedge) if task in done and not task.exception()), None)
+
+            if winner is None:
+                await primary  # both failed: raise the original error
+            if winner is primary:
+                self.tracker.record(key, elapsed_ms())
+                return page, primary.result()
+
+            self.wins += 1
+            abandoned_ms = elapsed_ms()
+            # Expected extra wait for the first load, from loads that ran this long
+            self.saved_ms += self.tracker.expected_remaining_ms(key, abandoned_ms)
+            self.tracker.record(key, (time.monotonic() - hedge_start) * 1000)
+            logger.debug(f"Hedge won for {url} after {abandoned_ms:.0f}ms")
+            await self._stop(page, primary)
+            winning_page, spare = spare, None
+            return winning_page, hedge.result()
+        except PlaywrightTimeoutError:
+            if record_timeout:
+                self.tracker.record_timeout(key)
+            raise
+        finally:
+            if not primary.done():
+                primary.cancel()
+            if hedge is not None and not hedge.done():
+                hedge.cancel()
+            for task in (primary, hedge):
+                if task is not None and task.done() and not task.cancelled():
+                    task.exception()  # retrieved, so asyncio doesn't log it
+            if spare is not None:
+                await self.release(spare)
+
+    async def _stop(self, page: Page, load: "asyncio.Future[Any]") -> None:
+        """Stop the losing load so it doesn't keep fetching in the background."""
+        load.cancel()
+        try:
+            await page.goto("about:blank", timeout=5000)
+        except Exception as e:
+            logger.debug(f"Could not stop abandoned navigation: {e}")
+
+    async def release(self, page: Page) -> None:
+        """
+        Return a spare page that won a hedge (no-op for any other page).
+
+        Args:
+            page: Page returned by goto()
+        """
+        pool = self._leased.pop(page, None)
+        if pool is not None:
+            await pool.release(page)
+
+    async def close(self) -> None:
+        """Close the spare pages of every context."""
+        for pool in list(self._spares.values()):
+            await pool.close()
+        self._spares.clear()
+        self._leased.clear()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get hedging counters.
+
+        Returns:
+            Dict with navigations, hedges (and their share), hedges won,
+            hedges skipped and the estimated tail latency saved
+        """
+        return {
+            "navigations": self.navigations,
+            "hedges": self.hedges,
+            "hedge_ratio": self.hedges / self.navigations if self.navigations else 0.0,
+            "wins": self.wins,
+            "over_budget": self.over_budget,
+            "no_spare": self.no_spare,
+            "saved_ms": round(self.saved_ms),
+        }
@@ -0,0 +1,210 @@
+"""Streaming latency percentiles per page type, and timeouts derived from them."""
+
+import json
+import logging
+import os
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+from .asset_cache import _FileLock
+
+logger = logging.getLogger(__name__)
+
+# Page types whose navigations are recorded; waits after the navigation are
+# recorded as "<type>.content" (main content) and "<type>.list" (detail lists)
+PAGE_TYPES = ("profile", "experience", "education", "company", "job", "job_search", "search_result")
+
+# Default file the estimator state is persisted to between runs
+LATENCY_STATE_FILE = ".latency_state.json"
+
+
+class LatencyTracker:
+    """
+    Rolling p50/p95/p99 latency per page type.
+
+    Each key keeps its most recent ``window`` samples, so the percentiles
+    follow the network as it changes during a run. Once a key has
+    ``min_samples`` samples, ``timeout_ms()`` returns ``p99 * headroom``
+    (clamped to ``floor_ms``..the caller's default) instead of the
+    hard-coded default, so a slow outlier no longer holds a worker for a
+    full minute.
+
+    Only completed waits are samples. Timeouts are counted separately
+    (``record_timeout()``): recording them at their timeout would feed the
+    timeout back into p99 and ratchet it up on every stall.
+
+    Example:
+        tracker = LatencyTracker()
+        tracker.load(".latency_state.json")
+        timeout = tracker.timeout_ms("profile", default_ms=60000)
+        ...
+        tracker.record("profile", elapsed_ms)
+        tracker.save(".latency_state.json")
+    """
+
+    def __init__(
+        self,
+        window: int = 500,
+        min_samples: int = 20,
+        headroom: float = 2.0,
+        floor_ms: float = 5000,
+    ):
+        """
+        Initialize tracker.
+
+        Args:
+            window: Samples kept per key
+            min_samples: Samples needed before timeouts are derived
+            headroom: Multiplier applied to p99
+            floor_ms: Lowest derived timeout (milliseconds)
+        """
+        self.window = window
+        self.min_samples = min_samples
+        self.headroom = headroom
+        self.floor_ms = floor_ms
+
+        self._samples: Dict[str, Deque[float]] = {}
+        # Samples recorded since load(), merged into the file by save()
+        self._new: Dict[str, List[float]] = {}
+        self._timeouts: Dict[str, int] = {}
+
+    def record(self, key: str, elapsed_ms: float) -> None:
+        """
+        Add one latency sample.
+
+        Args:
+            key: Page type (e.g. "profile" or "profile.content")
+            elapsed_ms: Observed latency in milliseconds
+        """
+        self._samples.setdefault(key, deque(maxlen=self.window)).append(elapsed_ms)
+        self._new.setdefault(key, []).append(elapsed_ms)
+
+    def record_timeout(self, key: str) -> None:
+        """
+        Count a wait that timed out (it is not a latency sample).
+
+        Args:
+            key: Page type
+        """
+        self._timeouts[key] = self._timeouts.get(key, 0) + 1
+
+    def percentiles(self, key: str) -> Optional[Dict[str, float]]:
+        """
+        Get the current p50/p95/p99 for a key.
+
+        Args:
+            key: Page type
+
+        Returns:
+            Dict with count, p50, p95 and p99 in ms, or None without samples
+        """
+        samples = self._samples.get(key)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+
+        def rank(q: float) -> float:
+            return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+        return {"count": len(ordered), "p50": rank(0.50), "p95": rank(0.95), "p99": rank(0.99)}
+
+    def timeout_ms(self, key: str, default_ms: float, floor_ms: Optional[float] = None) -> float:
+        """
+        Get the effective timeout for a key.
+
+        Args:
+            key: Page type
+            default_ms: Timeout used until enough samples exist, and the highest derived one
+            floor_ms: Lowest derived timeout (defaults to the tracker's)
+
+        Returns:
+            Timeout in milliseconds
+        """
+        stats = self.percentiles(key)
+        if stats is None or stats["count"] < self.min_samples:
+            return default_ms
+        floor_ms = self.floor_ms if floor_ms is None else floor_ms
+        return round(min(default_ms, max(floor_ms, stats["p99"] * self.headroom)))
+
+    def expected_remaining_ms(self, key: str, elapsed_ms: float) -> float:
+        """
+        Estimate how much longer a load that has run ``elapsed_ms`` would take.
+
+        Args:
+            key: Page type
+            elapsed_ms: Time the load has been running (milliseconds)
+
+        Returns:
+            Mean remaining latency of the recorded loads that ran longer (0 if none did)
+        """
+        longer = [sample for sample in self._samples.get(key, ()) if sample > elapsed_ms]
+        return sum(longer) / len(longer) - elapsed_ms if longer else 0.0
+
+    def load(self, path: str) -> bool:
+        """
+        Load samples persisted by an earlier run.
+
+        Args:
+            path: State file
+
+        Returns:
+            True if a state file was loaded
+        """
+        try:
+            state = json.loads(Path(path).read_text())
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable latency state {path}: {e}")
+            return False
+
+        for key, samples in state.get("samples", {}).items():
+            self._samples[key] = deque(samples[-self.window:], maxlen=self.window)
+        logger.debug(f"Loaded latency state for {len(self._samples)} page types from {path}")
+        return True
+
+    def save(self, path: str) -> None:
+        """
+        Persist samples, merging with what other processes saved meanwhile.
+
+        Only samples recorded since load() are appended to the file's, and
+        the read-merge-write holds an inter-process lock (``<path>.lock``),
+        so several processes sharing one state file don't overwrite each other.
+
+        Args:
+            path: State file
+        """
+        with _FileLock(Path(f"{path}.lock")):
+            try:
+                merged = json.loads(Path(path).read_text()).get("samples", {})
+            except (OSError, ValueError):
+                merged = {}
+
+            for key, samples in self._new.items():
+                merged[key] = (merged.get(key, []) + samples)[-self.window:]
+            for key, samples in self._samples.items():
+                merged.setdefault(key, list(samples))
+
+            # Write to a temp file and swap it in, so readers never see half a file
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            Path(tmp_path).write_text(json.dumps({"samples": merged}))
+            os.replace(tmp_path, path)
+        self._new = {}
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get percentiles and timeouts for every key.
+
+        Returns:
+            Dict of key -> count/p50/p95/p99 (ms) and timeouts
+        """
+        return {
+            key: {**self.percentiles(key), "timeouts": self._timeouts.get(key, 0)}
+            for key in sorted(self._samples)
+        }
+
+
+# Process-wide tracker (all scrapers, all pages)
+latency_tracker = LatencyTracker()
@@ -0,0 +1,117 @@
+"""Client-side (soft) navigation inside an already loaded single-page app."""
+
+import logging
+import uuid
+import weakref
+from typing import Optional
+from urllib.parse import urlsplit
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+
+logger = logging.getLogger(__name__)
+
+# Present on every LinkedIn app page (and on the benchmark stand-in)
+APP_SHELL_SELECTOR = "#global-nav"
+
+# Pages whose router ignored a pushed route; soft navigation is not tried on them again
+_ROUTER_MISSES: "weakref.WeakSet[Page]" = weakref.WeakSet()
+
+# Tag the current route's content, then hand the URL to the app's router the
+# same way the browser's back/forward buttons do (routers listen for popstate).
+_PUSH_ROUTE_JS = """
+([url, marker]) => {
+    const main = document.querySelector('main');
+    if (main) {
+        main.setAttribute('data-soft-nav', marker);
+        for (const child of main.children) child.setAttribute('data-soft-nav', marker);
+    }
+    history.pushState(history.state, '', url);
+    window.dispatchEvent(new PopStateEvent('popstate', {state: history.state}));
+}
+"""
+
+# The new route has rendered once <main> has content that wasn't tagged before
+_ROUTE_RENDERED_JS = """
+([url, marker]) => {
+    if (location.href !== new URL(url, location.href).href) return false;
+    const main = document.querySelector('main');
+    if (!main || !main.children.length) return false;
+    for (const child of main.children) {
+        if (child.getAttribute('data-soft-nav') === marker) return false;
+    }
+    return true;
+}
+"""
+
+
+def _same_origin(a: str, b: str) -> bool:
+    first, second = urlsplit(a), urlsplit(b)
+    return (first.scheme, first.netloc) == (second.scheme, second.netloc)
+
+
+async def can_soft_navigate(page: Page, url: str, shell_selector: str = APP_SHELL_SELECTOR) -> bool:
+    """
+    Check whether ``page`` has the app loaded and can route to ``url`` in place.
+
+    Args:
+        page: Playwright page
+        url: Target URL
+        shell_selector: Element that marks a loaded app page
+
+    Returns:
+        True if the page is a loaded app page on the same origin as ``url``
+    """
+    current = page.url
+    if not current.startswith("http") or current == url or not _same_origin(current, url):
+        return False
+    try:
+        return await page.evaluate("(selector) => !!document.querySelector(selector)", shell_selector)
+    except Exception:
+        return False
+
+
+async def soft_navigate(
+    page: Page,
+    url: str,
+    timeout: float = 5000,
+    ready_selector: Optional[str] = None,
+    shell_selector: str = APP_SHELL_SELECTOR
+) -> bool:
+    """
+    Move to ``url`` through the app's client-side router instead of a page load.
+
+    The bundles already loaded stay parsed and running; only the route's
+    data and markup are fetched. Returns False (without raising) when the
+    page can't soft-navigate or the new route doesn't render in time, so the
+    caller can fall back to ``page.goto``.
+
+    After the first route that doesn't render, the page is not soft-navigated
+    again (a router that ignores popstate would cost the full timeout on
+    every navigation).
+
+    Args:
+        page: Playwright page with the app loaded
+        url: Target URL
+        timeout: Milliseconds to wait for the new route to render
+        ready_selector: Optional element that must also be present afterwards
+        shell_selector: Element that marks a loaded app page
+
+    Returns:
+        True if the route rendered in place
+    """
+    if page in _ROUTER_MISSES or not await can_soft_navigate(page, url, shell_selector):
+        return False
+
+    marker = uuid.uuid4().hex
+    try:
+        await page.evaluate(_PUSH_ROUTE_JS, [url, marker])
+        await page.wait_for_function(_ROUTE_RENDERED_JS, arg=[url, marker], timeout=timeout)
+        if ready_selector:
+            await page.wait_for_selector(ready_selector, timeout=timeout, state="attached")
+        return True
+    except PlaywrightTimeoutError:
+        logger.info(f"Soft navigation to {url} did not render within {timeout:.0f}ms, using page loads from now on")
+    except Exception as e:
+        # e.g. the router did a full page load and the evaluate context went away
+        logger.info(f"Soft navigation to {url} failed, using page loads from now on: {e}")
+    _ROUTER_MISSES.add(page)
+    return False
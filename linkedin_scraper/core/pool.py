@@ -0,0 +1,467 @@
+"""Reusable page and context pools with lease/release semantics."""
+
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+from playwright.async_api import BrowserContext, Page
+
+from .auth import get_auth_state
+from .exceptions import PageCrashedError, TaskTimeoutError
+
+logger = logging.getLogger(__name__)
+
+
+class PagePool:
+    """
+    Fixed-size pool of pre-warmed pages.
+
+    Pages are leased to a caller, reset to a blank document on release and
+    handed to the next caller, so bulk runs don't pay tab creation and
+    renderer teardown for every URL. A page is recycled (closed and replaced)
+    after ``max_uses`` leases or when it was closed/crashed while leased.
+
+    Example:
+        pool = PagePool(context.new_page, size=4)
+        await pool.warm()
+        async with pool.lease() as page:
+            await page.goto(url)
+    """
+
+    def __init__(
+        self,
+        page_factory: Callable[[], Awaitable[Page]],
+        size: int = 1,
+        max_uses: int = 50,
+        reset_url: Optional[str] = "about:blank"
+    ):
+        """
+        Initialize page pool.
+
+        Args:
+            page_factory: Coroutine function that creates a new page
+            size: Maximum number of pages alive (and leased) at once
+            max_uses: Number of leases after which a page is recycled
+            reset_url: URL loaded into a page when it is returned to the pool
+                (None keeps the page as it is, e.g. for soft navigation)
+        """
+        if size < 1:
+            raise ValueError("Page pool size must be at least 1")
+
+        self.page_factory = page_factory
+        self.size = size
+        self.max_uses = max_uses
+        self.reset_url = reset_url
+
+        self._idle: "asyncio.Queue[Page]" = asyncio.Queue()
+        self._slots = asyncio.Semaphore(size)
+        self._uses: Dict[Page, int] = {}
+        self._closed = False
+
+        self.pages_created = 0
+        self.pages_recycled = 0
+        self.leases = 0
+
+    async def warm(self, count: Optional[int] = None) -> None:
+        """
+        Pre-create idle pages so the first leases don't wait on tab creation.
+
+        Args:
+            count: Number of pages to create (default: pool size)
+        """
+        target = min(count if count is not None else self.size, self.size)
+        missing = target - len(self._uses)
+        if missing <= 0:
+            return
+
+        pages = await asyncio.gather(*(self._create_page() for _ in range(missing)))
+        for page in pages:
+            self._idle.put_nowait(page)
+
+        logger.debug(f"Page pool warmed with {len(pages)} pages")
+
+    async def acquire(self) -> Page:
+        """
+        Take a page out of the pool, creating one if none is idle.
+
+        Waits while ``size`` pages are already leased.
+
+        Returns:
+            Playwright page ready for navigation
+        """
+        if self._closed:
+            raise RuntimeError("Page pool is closed")
+
+        await self._slots.acquire()
+        try:
+            while not self._idle.empty():
+                page = self._idle.get_nowait()
+                if page.is_closed():
+                    self._uses.pop(page, None)
+                    continue
+                self.leases += 1
+                return page
+
+            page = await self._create_page()
+            self.leases += 1
+            return page
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def try_acquire(self) -> Optional[Page]:
+        """
+        Take a page out of the pool unless that means waiting.
+
+        Returns:
+            Playwright page, or None while ``size`` pages are already leased
+        """
+        if self._closed or self._slots.locked():
+            return None
+        return await self.acquire()
+
+    async def release(self, page: Page, discard: bool = False) -> None:
+        """
+        Return a leased page to the pool.
+
+        Args:
+            page: Page obtained from acquire()
+            discard: Close the page instead of reusing it
+        """
+        try:
+            uses = self._uses.get(page, 0) + 1
+            self._uses[page] = uses
+
+            if discard or self._closed or page.is_closed() or uses >= self.max_uses:
+                await self._retire(page)
+                return
+
+            try:
+                if self.reset_url:
+                    await page.goto(self.reset_url)
+            except Exception as e:
+                logger.debug(f"Could not reset pooled page, recycling it: {e}")
+                await self._retire(page)
+                return
+
+            self._idle.put_nowait(page)
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[Page]:
+        """
+        Lease a page for the duration of an ``async with`` block.
+
+        Yields:
+            Playwright page, returned to the pool when the block exits
+        """
+        page = await self.acquire()
+        discard = False
+        try:
+            yield page
+        except (asyncio.CancelledError, PageCrashedError, TaskTimeoutError):
+            # Page may be dead or mid-navigation; don't hand it to the next caller
+            discard = True
+            raise
+        finally:
+            await self.release(page, discard=discard)
+
+    async def close(self) -> None:
+        """Close all pooled pages."""
+        self._closed = True
+        for page in list(self._uses):
+            await self._close_page(page)
+        self._uses.clear()
+        while not self._idle.empty():
+            self._idle.get_nowait()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Pool counters (pages created, recycled, leases served, idle pages)."""
+        return {
+            "size": self.size,
+            "pages_created": self.pages_created,
+            "pages_recycled": self.pages_recycled,
+            "leases": self.leases,
+            "idle": self._idle.qsize(),
+        }
+
+    async def _create_page(self) -> Page:
+        """Create a new page and start tracking it."""
+        page = await self.page_factory()
+        self._uses[page] = 0
+        self.pages_created += 1
+        return page
+
+    async def _retire(self, page: Page) -> None:
+        """Stop tracking a page and close it."""
+        self._uses.pop(page, None)
+        self.pages_recycled += 1
+        await self._close_page(page)
+
+    async def _close_page(self, page: Page) -> None:
+        """Close a page, ignoring errors from already-dead pages."""
+        try:
+            if not page.is_closed():
+                await page.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled page: {e}")
+
+
+class ContextPool:
+    """
+    Pool of isolated browser contexts, one per worker.
+
+    Every context is built from the same in-memory storage state, so the
+    session file is parsed once and adding a worker only costs a
+    ``new_context`` call. Cookies don't contend across workers because each
+    context has its own cookie jar and HTTP cache.
+
+    Example:
+        pool = ContextPool(browser_manager.new_context, size=3, storage_state=state)
+        async with pool.lease() as context:
+            page = await context.new_page()
+    """
+
+    def __init__(
+        self,
+        context_factory: Callable[[Optional[Dict[str, Any]]], Awaitable[BrowserContext]],
+        size: int = 1,
+        storage_state: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize context pool.
+
+        Args:
+            context_factory: Coroutine function creating a context from a storage state dict
+            size: Maximum number of contexts alive (and leased) at once
+            storage_state: Parsed storage state (cookies/origins) applied to every context
+        """
+        if size < 1:
+            raise ValueError("Context pool size must be at least 1")
+
+        self.context_factory = context_factory
+        self.size = size
+        self.storage_state = storage_state
+
+        self._idle: "asyncio.Queue[BrowserContext]" = asyncio.Queue()
+        self._slots = asyncio.Semaphore(size)
+        self._contexts: List[BrowserContext] = []
+        self._closed = False
+
+        self.contexts_created = 0
+        self.contexts_discarded = 0
+        self.state_swaps = 0
+
+    async def warm(self, count: Optional[int] = None) -> None:
+        """
+        Pre-create idle contexts.
+
+        Args:
+            count: Number of contexts to create (default: pool size)
+        """
+        target = min(count if count is not None else self.size, self.size)
+        missing = target - len(self._contexts)
+        if missing <= 0:
+            return
+
+        contexts = await asyncio.gather(*(self._create_context() for _ in range(missing)))
+        for context in contexts:
+            self._idle.put_nowait(context)
+
+        logger.debug(f"Context pool warmed with {len(contexts)} contexts")
+
+    async def acquire(self) -> BrowserContext:
+        """
+        Take a context out of the pool, creating one if none is idle.
+
+        Returns:
+            Playwright browser context
+        """
+        if self._closed:
+            raise RuntimeError("Context pool is closed")
+
+        await self._slots.acquire()
+        try:
+            if not self._idle.empty():
+                return self._idle.get_nowait()
+            return await self._create_context()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, context: BrowserContext) -> None:
+        """
+        Return a leased context to the pool.
+
+        Args:
+            context: Context obtained from acquire()
+        """
+        try:
+            if not self._closed and context in self._contexts:
+                self._idle.put_nowait(context)
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[BrowserContext]:
+        """
+        Lease a context for the duration of an ``async with`` block.
+
+        Yields:
+            Playwright browser context
+        """
+        context = await self.acquire()
+        discard = False
+        try:
+            yield context
+        except PageCrashedError:
+            # A crashed renderer may have taken sibling pages with it
+            discard = True
+            raise
+        finally:
+            if discard:
+                await self.discard(context)
+            else:
+                self.release(context)
+
+    async def discard(self, context: BrowserContext) -> None:
+        """
+        Close a leased context instead of returning it; a fresh one replaces it on demand.
+
+        Args:
+            context: Context obtained from acquire()
+        """
+        try:
+            if context in self._contexts:
+                self._contexts.remove(context)
+            self.contexts_discarded += 1
+            try:
+                await context.close()
+            except Exception as e:
+                logger.debug(f"Error closing discarded context: {e}")
+        finally:
+            self._slots.release()
+
+    async def update_storage_state(self, storage_state: Dict[str, Any]) -> None:
+        """
+        Hot-swap a new storage state into every context, idle or leased.
+
+        Cookies are replaced in place and localStorage is rewritten on open
+        pages of matching origins, so live pages keep running. Contexts
+        created afterwards start from the new state.
+
+        Args:
+            storage_state: Parsed storage state (cookies/origins)
+        """
+        self.storage_state = storage_state
+        await asyncio.gather(
+            *(apply_storage_state(context, storage_state) for context in self._contexts)
+        )
+        self.state_swaps += 1
+        logger.info(f"Storage state swapped into {len(self._contexts)} pooled contexts")
+
+    async def close(self) -> None:
+        """Close all pooled contexts."""
+        self._closed = True
+        for context in self._contexts:
+            try:
+                await context.close()
+            except Exception as e:
+                logger.debug(f"Error closing pooled context: {e}")
+        self._contexts.clear()
+        while not self._idle.empty():
+            self._idle.get_nowait()
+
+    @property
+    def contexts(self) -> List[BrowserContext]:
+        """All contexts currently owned by the pool."""
+        return list(self._contexts)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Pool counters (contexts created/discarded, state swaps, idle contexts)."""
+        return {
+            "size": self.size,
+            "contexts_created": self.contexts_created,
+            "contexts_discarded": self.contexts_discarded,
+            "state_swaps": self.state_swaps,
+            "idle": self._idle.qsize(),
+        }
+
+    async def _create_context(self) -> BrowserContext:
+        """Create a new context from the current storage state."""
+        context = await self.context_factory(self.storage_state)
+        self._contexts.append(context)
+        self.contexts_created += 1
+        return context
+
+
+def read_storage_state(filepath: str) -> Dict[str, Any]:
+    """
+    Parse a saved session (Playwright storage state) file.
+
+    Args:
+        filepath: Path to session file
+
+    Returns:
+        Storage state dict with ``cookies`` and ``origins``
+    """
+    if not Path(filepath).exists():
+        raise FileNotFoundError(f"Session file not found: {filepath}")
+
+    with open(filepath, 'r') as f:
+        state = json.load(f)
+
+    state.setdefault("cookies", [])
+    state.setdefault("origins", [])
+    return state
+
+
+async def apply_storage_state(context: BrowserContext, storage_state: Dict[str, Any]) -> None:
+    """
+    Apply a storage state to an existing context without closing its pages.
+
+    Args:
+        context: Playwright browser context
+        storage_state: Parsed storage state (cookies/origins)
+    """
+    get_auth_state(context).invalidate("storage state replaced")
+    await context.clear_cookies()
+    cookies = storage_state.get("cookies") or []
+    if cookies:
+        await context.add_cookies(cookies)
+
+    origins = {
+        origin["origin"]: origin.get("localStorage", [])
+        for origin in storage_state.get("origins") or []
+        if origin.get("origin")
+    }
+    if not origins:
+        return
+
+    for page in context.pages:
+        items = origins.get(_page_origin(page.url))
+        if items is None:
+            continue
+        try:
+            await page.evaluate(
+                """(items) => {
+                    for (const {name, value} of items) {
+                        window.localStorage.setItem(name, value);
+                    }
+                }""",
+                items,
+            )
+        except Exception as e:
+            logger.debug(f"Could not apply localStorage to {page.url}: {e}")
+
+
+def _page_origin(url: str) -> str:
+    """Return scheme://host[:port] for a page URL."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
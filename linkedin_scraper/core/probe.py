@@ -0,0 +1,129 @@
+"""Instant element probes, so absent fields don't cost a timeout."""
+
+import logging
+import time
+from typing import Any, Dict, Optional
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+
+logger = logging.getLogger(__name__)
+
+# One query answers whether the element exists and what it contains
+_PROBE_JS = """
+([selector, attribute, inner]) => {
+    const element = document.querySelector(selector);
+    if (!element) return null;
+    return {
+        text: inner ? element.innerText : element.textContent,
+        attribute: attribute ? element.getAttribute(attribute) : null,
+    };
+}
+"""
+
+
+class ProbeStats:
+    """
+    Counters for element probes.
+
+    ``absent_wait_ms`` is the time spent waiting for elements that never
+    appeared: with instant probes it only grows when a caller explicitly
+    asked to wait.
+    """
+
+    def __init__(self):
+        """Initialize counters."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero all counters."""
+        self.probes = 0
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+        self.wait_ms = 0.0
+        self.absent_wait_ms = 0.0
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get probe counters.
+
+        Returns:
+            Dict with probe/hit/miss counts and time spent waiting
+        """
+        return {
+            "probes": self.probes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "waits": self.waits,
+            "wait_ms": round(self.wait_ms),
+            "absent_wait_ms": round(self.absent_wait_ms),
+        }
+
+
+# Process-wide counters (all scrapers, all pages)
+probe_stats = ProbeStats()
+
+
+async def _probe_locator(page: Page, selector: str, attribute: Optional[str], inner: bool) -> Optional[Dict[str, Optional[str]]]:
+    """Probe with a locator, for Playwright-only selector syntax (text=, :has-text(), ...)."""
+    element = page.locator(selector).first
+    if await element.count() == 0:
+        return None
+    return {
+        "text": await (element.inner_text() if inner else element.text_content()),
+        "attribute": await element.get_attribute(attribute) if attribute else None,
+    }
+
+
+async def probe(
+    page: Page,
+    selector: str,
+    attribute: Optional[str] = None,
+    timeout: float = 0,
+    inner: bool = False
+) -> Optional[Dict[str, Optional[str]]]:
+    """
+    Look up an element's text (and optionally an attribute) in one query.
+
+    Absent elements return None immediately. Only when ``timeout`` is given
+    and the element is not there yet does the probe wait for it to attach.
+
+    Args:
+        page: Playwright page object
+        selector: CSS selector (first match is used)
+        attribute: Attribute to read as well
+        timeout: Milliseconds to wait for a missing element (0: don't wait)
+        inner: Return rendered ``innerText`` instead of ``textContent``
+
+    Returns:
+        Dict with ``text`` and ``attribute``, or None if the element is absent
+    """
+    probe_stats.probes += 1
+
+    async def query() -> Optional[Dict[str, Optional[str]]]:
+        try:
+            return await page.evaluate(_PROBE_JS, [selector, attribute, inner])
+        except Exception:
+            # Not plain CSS (querySelector throws); let Playwright resolve it
+            return await _probe_locator(page, selector, attribute, inner)
+
+    try:
+        result = await query()
+        if result is None and timeout > 0:
+            probe_stats.waits += 1
+            start = time.monotonic()
+            try:
+                await page.wait_for_selector(selector, timeout=timeout, state='attached')
+                result = await query()
+            except PlaywrightTimeoutError:
+                probe_stats.absent_wait_ms += (time.monotonic() - start) * 1000
+            probe_stats.wait_ms += (time.monotonic() - start) * 1000
+    except Exception as e:
+        logger.debug(f"Probe failed for {selector}: {e}")
+        result = None
+
+    if result is None:
+        probe_stats.misses += 1
+    else:
+        probe_stats.hits += 1
+    return result
@@ -0,0 +1,177 @@
+"""Wait for page content on concrete signals instead of fixed sleeps."""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+from playwright.async_api import Page
+
+logger = logging.getLogger(__name__)
+
+# Per page type: what "ready" means and how long to wait for it at most.
+#   selector  - element that must be attached
+#   items     - list items whose count must stop changing
+#   responses - URL fragments of fetch/XHR requests that must have completed
+#   root      - subtree watched for quiescence (falls back to the whole document)
+#   quiet_ms  - root must go this long without mutations (and item count unchanged)
+#   cap_ms    - hard cap; the wait returns (not ready) after this long
+READINESS_PRESETS: Dict[str, Dict[str, Any]] = {
+    # Profile top card
+    "profile": {
+        "selector": "main h1",
+        "items": None,
+        "responses": [],
+        "root": "main",
+        "quiet_ms": 250,
+        "cap_ms": 3000,
+    },
+    # details/experience, details/education, ...
+    "details": {
+        "selector": "main .pvs-list__container",
+        "items": "main .pvs-list__paged-list-item",
+        "responses": [],
+        "root": "main",
+        "quiet_ms": 300,
+        "cap_ms": 4000,
+    },
+    "company": {
+        "selector": "main h1",
+        "items": None,
+        "responses": [],
+        "root": "main",
+        "quiet_ms": 250,
+        "cap_ms": 3000,
+    },
+    "job": {
+        "selector": "main h1, .top-card-layout__title",
+        "items": None,
+        "responses": [],
+        "root": "main",
+        "quiet_ms": 250,
+        "cap_ms": 3000,
+    },
+    "job_search": {
+        "selector": ".jobs-search__results-list",
+        "items": ".jobs-search__results-list > li",
+        "responses": [],
+        "root": ".jobs-search__results-list",
+        "quiet_ms": 400,
+        "cap_ms": 4000,
+    },
+}
+
+# Resolves once every requested signal holds (or the cap runs out), all in
+# one round trip. A MutationObserver on the content root tracks quiescence
+# (widgets elsewhere on the page don't hold it up), the item count is
+# sampled for stability, and completed fetch/XHR entries come from the
+# Resource Timing buffer, so requests that finished before the wait
+# started still count.
+_READY_JS = """
+({selector, items, responses, root, quietMs, capMs}) => new Promise(resolve => {
+    const start = performance.now();
+    let lastMutation = start;
+    let lastCount = -1;
+    let countSince = start;
+    const observer = new MutationObserver(() => { lastMutation = performance.now(); });
+    const target = (root && document.querySelector(root)) || document.documentElement;
+    observer.observe(target, {childList: true, subtree: true, characterData: true});
+
+    const completed = (fragment) => performance.getEntriesByType('resource').some(entry =>
+        (entry.initiatorType === 'fetch' || entry.initiatorType === 'xmlhttprequest')
+        && entry.name.includes(fragment) && entry.responseEnd > 0);
+
+    let timer = null;
+    const check = () => {
+        const now = performance.now();
+        const present = !selector || !!document.querySelector(selector);
+        let count = null;
+        if (items) {
+            count = document.querySelectorAll(items).length;
+            if (count !== lastCount) { lastCount = count; countSince = now; }
+        }
+        const stable = !items || now - countSince >= quietMs;
+        const quiet = now - lastMutation >= quietMs;
+        const fetched = responses.every(completed);
+        const ready = present && stable && quiet && fetched;
+        if (ready || now - start >= capMs) {
+            observer.disconnect();
+            clearInterval(timer);
+            resolve({ready, elapsed_ms: Math.round(now - start), present, stable, quiet, fetched, items: count});
+        }
+    };
+    timer = setInterval(check, 50);
+    check();
+})
+"""
+
+
+def get_readiness_preset(name: str) -> Dict[str, Any]:
+    """
+    Look up a readiness preset by name.
+
+    Args:
+        name: Preset name (see READINESS_PRESETS)
+
+    Returns:
+        Preset dict with selector, items, responses, root, quiet_ms and cap_ms
+
+    Raises:
+        ValueError: If the preset does not exist
+    """
+    if name not in READINESS_PRESETS:
+        raise ValueError(
+            f"Unknown readiness preset '{name}'. "
+            f"Available: {', '.join(READINESS_PRESETS)}"
+        )
+    return READINESS_PRESETS[name]
+
+
+async def wait_until_ready(
+    page: Page,
+    preset: str = "profile",
+    cap_ms: Optional[float] = None,
+    **overrides: Any
+) -> Dict[str, Any]:
+    """
+    Wait until the page's content is present and has settled.
+
+    Returns as soon as every signal of the preset holds, so a fast page
+    costs a few hundred milliseconds instead of a fixed sleep, and never
+    waits longer than the cap. It does not raise: a page that never gets
+    ready (missing section, changed markup) just returns after the cap and
+    the caller's own selectors decide what is there.
+
+    Args:
+        page: Playwright page object
+        preset: Page type (see READINESS_PRESETS)
+        cap_ms: Hard cap in milliseconds (defaults to the preset's)
+        **overrides: Replace preset fields (selector, items, responses, root, quiet_ms)
+
+    Returns:
+        Dict with ``ready``, ``elapsed_ms`` and the state of each signal
+    """
+    options = {**get_readiness_preset(preset), **overrides}
+    if cap_ms is not None:
+        options["cap_ms"] = cap_ms
+
+    args = {
+        "selector": options.get("selector"),
+        "items": options.get("items"),
+        "responses": list(options.get("responses") or []),
+        "root": options.get("root"),
+        "quietMs": options.get("quiet_ms", 250),
+        "capMs": options["cap_ms"],
+    }
+
+    try:
+        # The in-page cap resolves first; this only guards a wedged renderer
+        result = await asyncio.wait_for(page.evaluate(_READY_JS, args), timeout=options["cap_ms"] / 1000 + 2)
+    except Exception as e:
+        # e.g. the page navigated away mid-wait
+        logger.debug(f"Readiness wait ({preset}) interrupted: {e}")
+        return {"ready": False, "elapsed_ms": None, "error": str(e)}
+
+    if result["ready"]:
+        logger.debug(f"Page ready ({preset}) after {result['elapsed_ms']}ms")
+    else:
+        logger.debug(f"Page not ready ({preset}) after {result['elapsed_ms']}ms cap: {result}")
+    return result
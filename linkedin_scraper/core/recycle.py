@@ -0,0 +1,174 @@
+"""Memory and page-count budgets for recycling long-running browsers."""
+
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# /proc/<pid>/comm of Chromium processes (browser, renderers, GPU, utility)
+CHROMIUM_PROCESS_NAMES = ("chrome", "chromium", "headless_shell", "chrome-headless")
+
+
+def _read_ppid_and_name(pid: int) -> Optional[tuple]:
+    """Return (ppid, comm) for a process from /proc, or None if it vanished."""
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text()
+    except (FileNotFoundError, ProcessLookupError, PermissionError):
+        return None
+    # comm is wrapped in parentheses and may itself contain spaces
+    name = stat[stat.index("(") + 1:stat.rindex(")")]
+    fields = stat[stat.rindex(")") + 2:].split()
+    return int(fields[1]), name
+
+
+def _read_rss(pid: int) -> int:
+    """Resident set size of a process in bytes (0 if unavailable)."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except (FileNotFoundError, ProcessLookupError, PermissionError):
+        pass
+    return 0
+
+
+def _chromium_pids(root_pid: int) -> List[int]:
+    """PIDs of all Chromium processes descended from ``root_pid``."""
+    children: Dict[int, List[int]] = {}
+    names: Dict[int, str] = {}
+
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        info = _read_ppid_and_name(int(entry))
+        if info is None:
+            continue
+        ppid, name = info
+        children.setdefault(ppid, []).append(int(entry))
+        names[int(entry)] = name
+
+    pids = []
+    stack = list(children.get(root_pid, []))
+    while stack:
+        pid = stack.pop()
+        stack.extend(children.get(pid, []))
+        if names.get(pid, "").lower().startswith(CHROMIUM_PROCESS_NAMES):
+            pids.append(pid)
+    return pids
+
+
+def chromium_rss(root_pid: Optional[int] = None) -> Optional[int]:
+    """
+    Sum the RSS of all Chromium processes descended from ``root_pid``.
+
+    Playwright starts a driver process as a child of Python, and Chromium as a
+    child of the driver, so the default root (this process) covers exactly
+    the browsers this process launched.
+
+    Args:
+        root_pid: Process whose descendants are inspected (default: current process)
+
+    Returns:
+        Total RSS in bytes, or None when /proc is not available (non-Linux)
+    """
+    if not os.path.isdir("/proc"):
+        return None
+
+    return sum(_read_rss(pid) for pid in _chromium_pids(root_pid or os.getpid()))
+
+
+def chromium_cpu_seconds(root_pid: Optional[int] = None) -> Optional[float]:
+    """
+    Sum the user+system CPU time of live Chromium processes descended from ``root_pid``.
+
+    Time spent by processes that already exited (e.g. renderers swapped out
+    by a cross-site navigation) is not included.
+
+    Args:
+        root_pid: Process whose descendants are inspected (default: current process)
+
+    Returns:
+        CPU seconds, or None when /proc is not available (non-Linux)
+    """
+    if not os.path.isdir("/proc"):
+        return None
+
+    ticks = 0
+    for pid in _chromium_pids(root_pid or os.getpid()):
+        try:
+            stat = Path(f"/proc/{pid}/stat").read_text()
+        except (FileNotFoundError, ProcessLookupError, PermissionError):
+            continue
+        fields = stat[stat.rindex(")") + 2:].split()
+        # utime and stime are fields 14 and 15 of /proc/<pid>/stat
+        ticks += int(fields[11]) + int(fields[12])
+    return ticks / os.sysconf("SC_CLK_TCK")
+
+
+class RecycleBudget:
+    """
+    Decides when a browser should be drained and relaunched.
+
+    A budget is exceeded once the browser has served ``max_pages`` page
+    leases, or once the combined Chromium RSS goes over ``max_rss_mb``.
+    RSS is sampled at most every ``check_interval`` seconds since walking
+    /proc is not free.
+    """
+
+    def __init__(
+        self,
+        max_pages: Optional[int] = None,
+        max_rss_mb: Optional[int] = None,
+        check_interval: float = 15.0
+    ):
+        """
+        Initialize recycle budget.
+
+        Args:
+            max_pages: Page leases served before relaunching (None: no limit)
+            max_rss_mb: Chromium RSS in MB before relaunching (None: no limit)
+            check_interval: Minimum seconds between RSS samples
+        """
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.check_interval = check_interval
+
+        self.last_rss: Optional[int] = None
+        self._last_check = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """True if any budget is configured."""
+        return bool(self.max_pages or self.max_rss_mb)
+
+    def exceeded(self, pages_served: int) -> Optional[str]:
+        """
+        Check the budget.
+
+        Args:
+            pages_served: Page leases served since the browser was launched
+
+        Returns:
+            Human-readable reason if the budget is exceeded, otherwise None
+        """
+        if self.max_pages and pages_served >= self.max_pages:
+            return f"page budget reached ({pages_served}/{self.max_pages} pages)"
+
+        if self.max_rss_mb:
+            now = time.monotonic()
+            if now - self._last_check >= self.check_interval:
+                self._last_check = now
+                self.last_rss = chromium_rss()
+                if self.last_rss is not None and self.last_rss > self.max_rss_mb * 1024 * 1024:
+                    return f"memory budget exceeded ({self.last_rss / 1_048_576:.0f}/{self.max_rss_mb} MB RSS)"
+
+        return None
+
+    def reset(self) -> None:
+        """Forget the last RSS sample (after a relaunch)."""
+        self.last_rss = None
+        self._last_check = time.monotonic()
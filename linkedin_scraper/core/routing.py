@@ -0,0 +1,251 @@
+"""Request routing that blocks resources the scrapers never read."""
+
+import fnmatch
+import logging
+from typing import Dict, Iterable, List, Optional
+from playwright.async_api import BrowserContext, Request, Response, Route
+
+logger = logging.getLogger(__name__)
+
+
+# Analytics, ads and telemetry endpoints. None of them affect page content.
+TRACKER_PATTERNS = [
+    "*://*.doubleclick.net/*",
+    "*://*.google-analytics.com/*",
+    "*://*.googletagmanager.com/*",
+    "*://*.googlesyndication.com/*",
+    "*://*.facebook.net/*",
+    "*://*.bing.com/*",
+    "*://*.ads-twitter.com/*",
+    "*://*.adsrvr.org/*",
+    "*://*.demdex.net/*",
+    "*://*.omtrdc.net/*",
+    "*://px.ads.linkedin.com/*",
+    "*://*.linkedin.com/li/track*",
+    "*://*.linkedin.com/li/tscp/*",
+    "*://*.linkedin.com/realtime/*",
+    "*/li/track*",
+    "*/sensorCollect*",
+]
+
+# Rough transfer size per blocked resource type, used until real sizes of
+# that type have been observed on allowed responses.
+DEFAULT_RESOURCE_SIZES = {
+    "image": 25_000,
+    "media": 500_000,
+    "font": 40_000,
+    "stylesheet": 60_000,
+    "script": 100_000,
+    "xhr": 5_000,
+    "fetch": 5_000,
+    "ping": 500,
+    "other": 5_000,
+}
+
+ROUTING_PROFILES: Dict[str, Dict[str, List[str]]] = {
+    # Load everything (no route handler is installed)
+    "full": {
+        "block_types": [],
+        "block_patterns": [],
+    },
+    # Drop pixels, video and fonts; keep CSS/JS so layout-dependent checks work
+    "no-media": {
+        "block_types": ["image", "media", "font"],
+        "block_patterns": TRACKER_PATTERNS,
+    },
+    # Only what's needed to render text: document, scripts and API calls
+    "text-only": {
+        "block_types": ["image", "media", "font", "stylesheet", "texttrack", "manifest", "ping", "eventsource", "websocket"],
+        "block_patterns": TRACKER_PATTERNS,
+    },
+}
+
+
+class RequestRouter:
+    """
+    Route handler that aborts unwanted requests on a browser context.
+
+    Requests are blocked by resource type (image, font, ...) or by URL glob
+    pattern. ``allow_patterns`` always win, so a single needed asset can be
+    let through a broad block rule. Allowed requests are passed on with
+    ``route.fallback()`` so other route handlers (e.g. an asset cache) still
+    see them.
+
+    Example:
+        router = RequestRouter.from_profile("text-only")
+        await router.attach(context)
+        ...
+        print(router.stats)
+    """
+
+    def __init__(
+        self,
+        block_types: Optional[Iterable[str]] = None,
+        block_patterns: Optional[Iterable[str]] = None,
+        allow_patterns: Optional[Iterable[str]] = None,
+        profile: str = "custom"
+    ):
+        """
+        Initialize request router.
+
+        Args:
+            block_types: Playwright resource types to abort (image, media, font, ...)
+            block_patterns: URL glob patterns to abort (fnmatch syntax)
+            allow_patterns: URL glob patterns that are never blocked
+            profile: Name used in logs and stats
+        """
+        self.block_types = set(block_types or [])
+        self.block_patterns = list(block_patterns or [])
+        self.allow_patterns = list(allow_patterns or [])
+        self.profile = profile
+
+        self.blocked = 0
+        self.allowed = 0
+        self.blocked_by_type: Dict[str, int] = {}
+        self.allowed_by_type: Dict[str, int] = {}
+        self.bytes_allowed = 0
+
+        self._observed_sizes: Dict[str, List[int]] = {}
+
+    @classmethod
+    def from_profile(
+        cls,
+        name: str,
+        block_types: Optional[Iterable[str]] = None,
+        block_patterns: Optional[Iterable[str]] = None,
+        allow_patterns: Optional[Iterable[str]] = None
+    ) -> "RequestRouter":
+        """
+        Create a router from a named profile, optionally extended with extra rules.
+
+        Args:
+            name: Profile name (see ROUTING_PROFILES)
+            block_types: Extra resource types to block
+            block_patterns: Extra URL patterns to block
+            allow_patterns: URL patterns that are never blocked
+
+        Returns:
+            Configured RequestRouter
+        """
+        if name not in ROUTING_PROFILES:
+            raise ValueError(
+                f"Unknown routing profile '{name}'. "
+                f"Available: {', '.join(ROUTING_PROFILES)}"
+            )
+
+        profile = ROUTING_PROFILES[name]
+        return cls(
+            block_types=list(profile["block_types"]) + list(block_types or []),
+            block_patterns=list(profile["block_patterns"]) + list(block_patterns or []),
+            allow_patterns=allow_patterns,
+            profile=name,
+        )
+
+    @property
+    def is_passthrough(self) -> bool:
+        """True if the router never blocks anything."""
+        return not self.block_types and not self.block_patterns
+
+    async def attach(self, context: BrowserContext) -> None:
+        """
+        Install the route handler on a context.
+
+        Args:
+            context: Playwright browser context
+        """
+        context.on("response", self._on_response)
+
+        if self.is_passthrough:
+            return
+
+        await context.route("**/*", self._handle)
+        logger.debug(f"Request router '{self.profile}' attached to context")
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        """
+        Decide whether a request should be aborted.
+
+        Args:
+            url: Request URL
+            resource_type: Playwright resource type
+
+        Returns:
+            True if the request should be blocked
+        """
+        if any(fnmatch.fnmatchcase(url, pattern) for pattern in self.allow_patterns):
+            return False
+        if resource_type in self.block_types:
+            return True
+        return any(fnmatch.fnmatchcase(url, pattern) for pattern in self.block_patterns)
+
+    async def _handle(self, route: Route, request: Request) -> None:
+        """Abort or pass on a routed request."""
+        resource_type = request.resource_type
+
+        if self.should_block(request.url, resource_type):
+            self.blocked += 1
+            self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+            try:
+                await route.abort("blockedbyclient")
+            except Exception as e:
+                logger.debug(f"Could not abort {request.url}: {e}")
+            return
+
+        self.allowed += 1
+        self.allowed_by_type[resource_type] = self.allowed_by_type.get(resource_type, 0) + 1
+        try:
+            await route.fallback()
+        except Exception as e:
+            logger.debug(f"Could not continue {request.url}: {e}")
+
+    def _on_response(self, response: Response) -> None:
+        """Record transfer sizes of allowed responses (from Content-Length)."""
+        length = response.headers.get("content-length")
+        if not length or not length.isdigit():
+            return
+
+        size = int(length)
+        self.bytes_allowed += size
+        sizes = self._observed_sizes.setdefault(response.request.resource_type, [])
+        if len(sizes) < 1000:
+            sizes.append(size)
+
+    @property
+    def bytes_saved(self) -> int:
+        """
+        Estimated bytes not downloaded because of blocked requests.
+
+        Uses the mean observed size of each resource type when available,
+        otherwise DEFAULT_RESOURCE_SIZES.
+        """
+        total = 0
+        for resource_type, count in self.blocked_by_type.items():
+            sizes = self._observed_sizes.get(resource_type)
+            if sizes:
+                average = sum(sizes) / len(sizes)
+            else:
+                average = DEFAULT_RESOURCE_SIZES.get(resource_type, DEFAULT_RESOURCE_SIZES["other"])
+            total += int(average * count)
+        return total
+
+    @property
+    def stats(self) -> Dict[str, object]:
+        """Counters of blocked vs allowed requests and estimated bytes saved."""
+        return {
+            "profile": self.profile,
+            "blocked": self.blocked,
+            "allowed": self.allowed,
+            "blocked_by_type": dict(self.blocked_by_type),
+            "allowed_by_type": dict(self.allowed_by_type),
+            "bytes_allowed": self.bytes_allowed,
+            "bytes_saved_estimate": self.bytes_saved,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset all counters."""
+        self.blocked = 0
+        self.allowed = 0
+        self.blocked_by_type.clear()
+        self.allowed_by_type.clear()
+        self.bytes_allowed = 0
+        self._observed_sizes.clear()
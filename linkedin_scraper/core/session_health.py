@@ -0,0 +1,165 @@
+"""Detect a session expiring mid-run, pause workers and hot-reload a refreshed session file."""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, Optional
+
+from .browser import BrowserManager
+
+logger = logging.getLogger(__name__)
+
+
+class SessionHealth:
+    """
+    Shared session state for a pool of workers.
+
+    When a worker sees the session expire (a SessionExpiredError from a
+    login/authwall redirect) it calls ``report_expired()``: every worker
+    then blocks in ``wait_healthy()`` before its next row, the session file
+    is polled until a refreshed copy appears (e.g. written by
+    ``create_session.py``), and that copy is hot-swapped into every context
+    with ``BrowserManager.reload_session()`` before the workers resume. The
+    row that hit the redirect should be retried rather than recorded.
+
+    If no refreshed file shows up within ``max_wait`` seconds the health
+    gives up: workers resume and expired rows fail as before.
+
+    Example:
+        health = SessionHealth(browser, "linkedin_session.json")
+        await health.wait_healthy()
+        try:
+            person = await scraper.scrape(url)
+        except SessionExpiredError:
+            if await health.report_expired():
+                ...  # put the row back
+    """
+
+    def __init__(
+        self,
+        browser: BrowserManager,
+        session_file: str,
+        poll_interval: float = 5.0,
+        max_wait: Optional[float] = 3600.0,
+    ):
+        """
+        Initialize session health.
+
+        Args:
+            browser: Browser whose contexts receive the refreshed session
+            session_file: Session file to watch for a refreshed copy
+            poll_interval: Seconds between checks of the session file
+            max_wait: Seconds to wait for a refreshed file (None waits forever)
+        """
+        self.browser = browser
+        self.session_file = session_file
+        self.poll_interval = poll_interval
+        self.max_wait = max_wait
+
+        self._healthy = asyncio.Event()
+        self._healthy.set()
+        self._watcher: Optional[asyncio.Task] = None
+        self._loaded_mtime = self._mtime()
+        self.gave_up = False
+
+        self.expiries = 0
+        self.reloads = 0
+        self.paused_seconds = 0.0
+
+    @property
+    def paused(self) -> bool:
+        """True while workers are waiting for a refreshed session."""
+        return not self._healthy.is_set()
+
+    def _mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self.session_file).st_mtime
+        except OSError:
+            return None
+
+    async def wait_healthy(self) -> None:
+        """Block while the session is being refreshed."""
+        await self._healthy.wait()
+
+    async def report_expired(self, reason: str = "", generation: Optional[int] = None) -> bool:
+        """
+        Record that the session expired and pause workers until it is refreshed.
+
+        Several workers usually notice the expiry at once; only the first
+        starts the watcher, the rest just wait for it.
+
+        Args:
+            reason: What revealed the expiry (for logging)
+            generation: ``reloads`` when the failed row started; a row that
+                started before the latest reload is simply retried
+
+        Returns:
+            True if the session was refreshed and the row should be retried,
+            False if the health gave up waiting
+        """
+        if self.gave_up:
+            return False
+        if generation is not None and generation != self.reloads:
+            return True
+
+        if self._healthy.is_set():
+            self.expiries += 1
+            self._healthy.clear()
+            logger.warning(
+                f"Session expired{': ' + reason if reason else ''}. Pausing workers until "
+                f"{self.session_file} is refreshed (e.g. run create_session.py)"
+            )
+            self._watcher = asyncio.create_task(self._watch())
+
+        await self._healthy.wait()
+        return not self.gave_up
+
+    async def _watch(self) -> None:
+        """Poll the session file until a new, parseable copy can be reloaded."""
+        start = time.monotonic()
+        try:
+            while self.max_wait is None or time.monotonic() - start < self.max_wait:
+                mtime = self._mtime()
+                if mtime is not None and mtime != self._loaded_mtime:
+                    try:
+                        # The file is parsed before anything is swapped, so a
+                        # half-written copy just fails and is retried next poll
+                        await self.browser.reload_session(self.session_file)
+                    except Exception as e:
+                        logger.debug(f"Refreshed session file not usable yet: {e}")
+                    else:
+                        self._loaded_mtime = mtime
+                        self.reloads += 1
+                        logger.warning(f"Session reloaded from {self.session_file}, resuming workers")
+                        return
+                await asyncio.sleep(self.poll_interval)
+
+            self.gave_up = True
+            logger.error(
+                f"No refreshed session within {self.max_wait:g}s; remaining rows will fail until the next run"
+            )
+        finally:
+            self.paused_seconds += time.monotonic() - start
+            self._healthy.set()
+
+    async def close(self) -> None:
+        """Stop watching the session file (releases paused workers)."""
+        if self._watcher and not self._watcher.done():
+            self._watcher.cancel()
+            await asyncio.gather(self._watcher, return_exceptions=True)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get session health counters.
+
+        Returns:
+            Dict with expiries, reloads, time spent paused and whether it gave up
+        """
+        return {
+            "expiries": self.expiries,
+            "reloads": self.reloads,
+            "paused_seconds": round(self.paused_seconds, 1),
+            "gave_up": self.gave_up,
+        }
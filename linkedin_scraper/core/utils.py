@@ -3,10 +3,13 @@
 import asyncio
 import functools
 import logging
-from typing import Any, Callable, Optional, TypeVar, cast
-from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+import time
+from typing import Any, Callable, Dict, List, Optional, TypeVar, cast
+from urllib.parse import urlsplit
+from playwright.async_api import Page, Response, TimeoutError as PlaywrightTimeoutError
 
-from .exceptions import RateLimitError, ElementNotFoundError, NetworkError
+from .exceptions import RateLimitError, ElementNotFoundError, NetworkError, ProfileNotFoundError
+from .probe import probe
 
 logger = logging.getLogger(__name__)
 
@@ -54,55 +57,225 @@ def retry_async(
     return decorator
 
 
-async def detect_rate_limit(page: Page) -> None:
+# Phrases LinkedIn's throttling pages show
+RATE_LIMIT_PHRASES = ('too many requests', 'rate limit', 'slow down', 'try again later')
+
+# HTTP statuses LinkedIn answers throttled or blocked clients with (999 is LinkedIn-specific)
+RATE_LIMIT_STATUSES = (429, 999)
+
+_CAPTCHA_SELECTOR = 'iframe[title*="captcha" i], iframe[src*="captcha" i]'
+
+# Headings of LinkedIn's "page doesn't exist" and unavailable/private profile pages
+UNAVAILABLE_PHRASES = (
+    "this page doesn't exist",
+    "this page doesn’t exist",
+    "profile is not available",
+    "profile isn't available",
+    "profile isn’t available",
+    "profile unavailable",
+)
+
+# Responses and final URLs that mean the page is gone
+NOT_FOUND_STATUSES = (404, 410)
+UNAVAILABLE_PATHS = ('/404', '/in/unavailable')
+
+# One in-page check returning only what it found: a CAPTCHA frame or a
+# throttling phrase in the title/top headings, and an "unavailable"
+# heading. The body text is only scanned for throttling (in the page,
+# never transferred) when there is no <main>, i.e. on interstitials rather
+# than real app pages.
+_PAGE_CHECK_JS = """
+([captchaSelector, phrases, unavailablePhrases]) => {
+    const headings = Array.from(document.querySelectorAll('h1, h2')).slice(0, 5).map(h => h.textContent);
+    const headingText = [document.title, ...headings].join(' ').toLowerCase();
+    const unavailable = unavailablePhrases.find(phrase => headingText.includes(phrase)) || null;
+    if (document.querySelector(captchaSelector)) return {blocked: 'captcha', unavailable};
+    let text = headingText;
+    if (!document.querySelector('main') && document.body) text += ' ' + document.body.textContent.toLowerCase();
+    return {blocked: phrases.find(phrase => text.includes(phrase)) || null, unavailable};
+}
+"""
+
+
+class RateLimitCheckStats:
+    """Counters and latency of post-navigation checks (see inspect_navigation)."""
+    
+    def __init__(self):
+        """Initialize counters."""
+        self.reset()
+    
+    def reset(self) -> None:
+        """Zero all counters."""
+        self.checks = 0
+        self.detections = 0
+        self.thorough_checks = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+    
+    def record(self, elapsed_ms: float, detected: bool, thorough: bool) -> None:
+        """Record one check."""
+        self.checks += 1
+        self.detections += int(detected)
+        self.thorough_checks += int(thorough)
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get check counters.
+        
+        Returns:
+            Dict with check/detection counts and mean/max latency in ms
+        """
+        return {
+            "checks": self.checks,
+            "detections": self.detections,
+            "thorough_checks": self.thorough_checks,
+            "mean_ms": round(self.total_ms / self.checks, 1) if self.checks else 0.0,
+            "max_ms": round(self.max_ms, 1),
+        }
+
+
+# Process-wide counters (all scrapers, all pages)
+rate_limit_stats = RateLimitCheckStats()
+
+
+def _redirect_chain(response: Response) -> List[str]:
+    """URLs a navigation went through, first to last (no protocol round trips)."""
+    urls = []
+    request = response.request
+    while request is not None:
+        urls.append(request.url)
+        request = request.redirected_from
+    return list(reversed(urls))
+
+
+def _check_navigation(url: str, response: Optional[Response]) -> None:
+    """Raise RateLimitError from the response status, redirect chain or final URL."""
+    if response is not None and response.status in RATE_LIMIT_STATUSES:
+        raise RateLimitError(
+            f"LinkedIn answered HTTP {response.status} (throttled).",
+            suggested_wait_time=1800  # 30 minutes
+        )
+    
+    urls = (_redirect_chain(response) if response is not None else []) + [url]
+    for hop in urls:
+        if 'linkedin.com/checkpoint' in hop or 'authwall' in hop:
+            raise RateLimitError(
+                "LinkedIn security checkpoint detected. "
+                "You may need to verify your identity or wait before continuing.",
+                suggested_wait_time=3600  # 1 hour
+            )
+
+
+async def _thorough_check(page: Page) -> None:
+    """The original full-page heuristics: CAPTCHA locator and a full body text scan."""
+    if await page.locator(_CAPTCHA_SELECTOR).count() > 0:
+        raise RateLimitError(
+            "CAPTCHA challenge detected. Manual intervention required.",
+            suggested_wait_time=3600
+        )
+    
+    try:
+        body_text = await page.locator('body').text_content(timeout=1000)
+    except PlaywrightTimeoutError:
+        return
+    if body_text and any(phrase in body_text.lower() for phrase in RATE_LIMIT_PHRASES):
+        raise RateLimitError(
+            "Rate limit message detected on page.",
+            suggested_wait_time=1800  # 30 minutes
+        )
+
+
+def _check_not_found(url: str, response: Optional[Response]) -> None:
+    """Raise ProfileNotFoundError from the response status or final URL."""
+    if response is not None and response.status in NOT_FOUND_STATUSES:
+        raise ProfileNotFoundError(f"Page not found (HTTP {response.status}): {url}")
+    if urlsplit(url).path.startswith(UNAVAILABLE_PATHS):
+        raise ProfileNotFoundError(f"Page unavailable (redirected to {url})")
+
+
+async def inspect_navigation(
+    page: Page,
+    response: Optional[Response] = None,
+    thorough: bool = False,
+    check_unavailable: bool = True
+) -> None:
     """
-    Detect if LinkedIn has rate limited the session.
+    Check where a navigation landed: throttled, blocked, or a dead page.
+    
+    The navigation response is checked first (HTTP 429/999 or 404/410, a
+    redirect through a checkpoint/authwall or to an unavailable page, the
+    final URL), which costs no round trip. One small in-page check then
+    looks for a CAPTCHA frame, a throttling message and an "unavailable"
+    heading. ``thorough`` adds the old heuristics (full body text scan) as
+    a slow path. Latency is recorded in ``rate_limit_stats``.
     
     Args:
         page: Playwright page object
+        response: Response returned by the navigation, if any
+        thorough: Also scan the whole body text for throttling messages
+        check_unavailable: Raise ProfileNotFoundError for dead/private pages
         
     Raises:
         RateLimitError: If rate limiting is detected
+        ProfileNotFoundError: If the page doesn't exist or is unavailable
     """
-    # Check for common rate limit indicators
-    
-    # Check URL for security challenges
-    current_url = page.url
-    if 'linkedin.com/checkpoint' in current_url or 'authwall' in current_url:
-        raise RateLimitError(
-            "LinkedIn security checkpoint detected. "
-            "You may need to verify your identity or wait before continuing.",
-            suggested_wait_time=3600  # 1 hour
-        )
-    
-    # Check for CAPTCHA
+    start = time.perf_counter()
+    detected = False
     try:
-        captcha = await page.locator('iframe[title*="captcha" i], iframe[src*="captcha" i]').count()
-        if captcha > 0:
+        _check_navigation(page.url, response)
+        if check_unavailable:
+            _check_not_found(page.url, response)
+        
+        try:
+            found = await page.evaluate(_PAGE_CHECK_JS, [
+                _CAPTCHA_SELECTOR,
+                list(RATE_LIMIT_PHRASES),
+                list(UNAVAILABLE_PHRASES) if check_unavailable else [],
+            ])
+        except Exception as e:
+            # e.g. the page is navigating again; the response checks above still ran
+            logger.debug(f"In-page navigation check failed: {e}")
+            found = {"blocked": None, "unavailable": None}
+        if found["blocked"] == 'captcha':
             raise RateLimitError(
                 "CAPTCHA challenge detected. Manual intervention required.",
                 suggested_wait_time=3600
             )
-    except Exception:
-        pass
+        if found["blocked"]:
+            raise RateLimitError(
+                f"Rate limit message detected on page ('{found['blocked']}').",
+                suggested_wait_time=1800  # 30 minutes
+            )
+        if found["unavailable"]:
+            raise ProfileNotFoundError(f"Page unavailable ('{found['unavailable']}'): {page.url}")
+        
+        if thorough:
+            await _thorough_check(page)
+    except RateLimitError:
+        detected = True
+        raise
+    finally:
+        rate_limit_stats.record((time.perf_counter() - start) * 1000, detected, thorough)
+
+
+async def detect_rate_limit(page: Page, response: Optional[Response] = None, thorough: bool = False) -> None:
+    """
+    Detect if LinkedIn has rate limited the session.
     
-    # Check for rate limit messages
-    try:
-        body_text = await page.locator('body').text_content(timeout=1000)
-        if body_text:
-            body_lower = body_text.lower()
-            if any(phrase in body_lower for phrase in [
-                'too many requests',
-                'rate limit',
-                'slow down',
-                'try again later'
-            ]):
-                raise RateLimitError(
-                    "Rate limit message detected on page.",
-                    suggested_wait_time=1800  # 30 minutes
-                )
-    except PlaywrightTimeoutError:
-        pass
+    Same checks as inspect_navigation() without the unavailable-page ones.
+    
+    Args:
+        page: Playwright page object
+        response: Response returned by the navigation, if any
+        thorough: Also scan the whole body text
+        
+    Raises:
+        RateLimitError: If rate limiting is detected
+    """
+    await inspect_navigation(page, response, thorough, check_unavailable=False)
 
 
 async def wait_for_element_smart(
@@ -155,54 +328,166 @@ async def extract_text_safe(
     page: Page,
     selector: str,
     default: str = "",
-    timeout: float = 2000
+    timeout: float = 0
 ) -> str:
     """
     Safely extract text from an element, returning default if not found.
     
+    The element is probed in one instant query, so a field that is
+    legitimately missing costs no wait; pass a timeout only for content
+    that may still be arriving.
+    
     Args:
         page: Playwright page object
         selector: CSS selector
         default: Default value if element not found
-        timeout: Timeout in milliseconds
+        timeout: Milliseconds to wait if the element is not there yet (default: 0)
         
     Returns:
         Extracted text or default value
     """
-    try:
-        element = page.locator(selector).first
-        text = await element.text_content(timeout=timeout)
-        return text.strip() if text else default
-    except PlaywrightTimeoutError:
+    result = await probe(page, selector, timeout=timeout)
+    if result is None:
         logger.debug(f"Element not found: {selector}, returning default: {default}")
         return default
+    text = result["text"]
+    return text.strip() if text else default
+
+
+# Scroll-to-load loader, run as one evaluate. It scrolls to the last item
+# (which also scrolls nested scroll containers) and the window bottom; a
+# MutationObserver scrolls again whenever the list grows. It resolves once
+# the list has not grown for idleMs, or on maxItems/maxScrolls/maxMs. With no
+# item selector, "growth" is the page height.
+_SCROLL_TO_LOAD_JS = """
+({items, idleMs, maxMs, maxItems, maxScrolls}) => new Promise(resolve => {
+    const start = performance.now();
+    const count = () => items ? document.querySelectorAll(items).length : document.body.scrollHeight;
+    const initial = count();
+    let last = initial;
+    let scrolls = 0;
+    let idleTimer = null;
+    let capTimer = null;
+    let observer = null;
+    let finished = false;
+
+    const finish = (reason) => {
+        if (finished) return;
+        finished = true;
+        if (observer) observer.disconnect();
+        clearTimeout(idleTimer);
+        clearTimeout(capTimer);
+        resolve({
+            initial_items: items ? initial : null,
+            items: items ? count() : null,
+            height: document.body.scrollHeight,
+            scrolls,
+            reason,
+            elapsed_ms: Math.round(performance.now() - start),
+        });
+    };
+    const scroll = () => {
+        if (maxScrolls !== null && scrolls >= maxScrolls) return finish('max_scrolls');
+        scrolls++;
+        if (items) {
+            const nodes = document.querySelectorAll(items);
+            if (nodes.length) nodes[nodes.length - 1].scrollIntoView({block: 'end'});
+        }
+        window.scrollTo(0, document.body.scrollHeight);
+        clearTimeout(idleTimer);
+        idleTimer = setTimeout(() => finish('idle'), idleMs);
+    };
+    const reached = (current) => items && maxItems !== null && current >= maxItems;
+
+    if (reached(initial)) return finish('max_items');
+    observer = new MutationObserver(() => {
+        const current = count();
+        if (current === last) return;
+        last = current;
+        if (reached(current)) return finish('max_items');
+        scroll();
+    });
+    observer.observe(document.body, {childList: true, subtree: true});
+    capTimer = setTimeout(() => finish('cap'), maxMs);
+    scroll();
+})
+"""
+
+
+async def scroll_to_load(
+    page: Page,
+    item_selector: Optional[str] = None,
+    idle_ms: float = 1000,
+    max_ms: float = 20000,
+    max_items: Optional[int] = None,
+    max_scrolls: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Scroll until a lazily loaded list stops growing, in a single round trip.
+    
+    The loader runs in the page: it scrolls, rescrolls as soon as new items
+    are appended and resolves once nothing was added for ``idle_ms``, so
+    long lists are loaded completely rather than cut off after a fixed
+    number of scrolls. ``max_ms`` is a hard cap for endless feeds.
+    
+    Args:
+        page: Playwright page object
+        item_selector: CSS selector of the list items (None: watch page height)
+        idle_ms: Stop after this long without growth (milliseconds)
+        max_ms: Hard cap (milliseconds)
+        max_items: Stop once this many items are loaded
+        max_scrolls: Stop after this many scrolls (default: unlimited)
+        
+    Returns:
+        Dict with initial/final item counts, page height, scrolls, elapsed_ms
+        and the stop reason (idle, cap, max_items, max_scrolls or error)
+    """
+    args = {
+        "items": item_selector,
+        "idleMs": idle_ms,
+        "maxMs": max_ms,
+        "maxItems": max_items,
+        "maxScrolls": max_scrolls,
+    }
+    try:
+        # The in-page cap resolves first; this only guards a wedged renderer
+        result = await asyncio.wait_for(page.evaluate(_SCROLL_TO_LOAD_JS, args), timeout=max_ms / 1000 + 5)
     except Exception as e:
-        logger.debug(f"Error extracting text from {selector}: {e}")
-        return default
+        logger.debug(f"Scroll-to-load interrupted: {e}")
+        return {"items": None, "scrolls": None, "reason": "error", "elapsed_ms": None}
+    
+    logger.debug(
+        f"Scroll-to-load ({item_selector or 'page height'}): {result['initial_items']} -> {result['items']} items, "
+        f"{result['scrolls']} scrolls, {result['elapsed_ms']}ms ({result['reason']})"
+    )
+    return result
 
 
-async def scroll_to_bottom(page: Page, pause_time: float = 1.0, max_scrolls: int = 10) -> None:
+async def scroll_to_bottom(
+    page: Page,
+    pause_time: float = 1.0,
+    max_scrolls: int = 10,
+    max_ms: Optional[float] = None
+) -> Dict[str, Any]:
     """
-    Scroll to the bottom of the page smoothly with pauses.
+    Scroll to the bottom of the page until no more content loads.
+    
+    Runs the in-page loader of scroll_to_load() on the page height: the
+    next scroll happens as soon as the page grows, and pause_time only caps
+    how long to wait for growth before concluding the bottom was reached.
     
     Args:
         page: Playwright page object
-        pause_time: Time to pause between scrolls (seconds)
+        pause_time: Longest wait for new content after a scroll (seconds)
         max_scrolls: Maximum number of scroll attempts
-    """
-    for i in range(max_scrolls):
-        # Get current scroll position
-        previous_height = await page.evaluate('document.body.scrollHeight')
-        
-        # Scroll down
-        await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-        await asyncio.sleep(pause_time)
+        max_ms: Hard cap (milliseconds, default: enough for every scroll to pause)
         
-        # Check if we've reached the bottom
-        new_height = await page.evaluate('document.body.scrollHeight')
-        if new_height == previous_height:
-            logger.debug(f"Reached bottom after {i + 1} scrolls")
-            break
+    Returns:
+        Result of scroll_to_load()
+    """
+    if max_ms is None:
+        max_ms = max_scrolls * pause_time * 1000 + 5000
+    return await scroll_to_load(page, idle_ms=pause_time * 1000, max_ms=max_ms, max_scrolls=max_scrolls)
 
 
 async def scroll_to_half(page: Page) -> None:
@@ -210,6 +495,125 @@ async def scroll_to_half(page: Page) -> None:
     await page.evaluate('window.scrollTo(0, document.body.scrollHeight / 2)')
 
 
+# See-more expander, run as one evaluate. Each round clicks every visible,
+# enabled button inside a content container whose text starts with a
+# see-more label (case-insensitive) and that was not clicked before, then waits until the DOM has been quiet for
+# idleMs. A clicked button has finished expanding once it is detached, has
+# aria-expanded="true" or no longer reads "see more" (e.g. "Show less").
+# Another round picks up buttons revealed by the expansion. It resolves when
+# a round finds nothing new, or on maxButtons/maxMs.
+_EXPAND_SEE_MORE_JS = """
+({pattern, container, maxButtons, idleMs, maxMs}) => new Promise(resolve => {
+    const start = performance.now();
+    const matcher = new RegExp(pattern, 'i');
+    const clicked = new Set();
+    let rounds = 0;
+    let idleTimer = null;
+    let capTimer = null;
+    let observer = null;
+    let finished = false;
+
+    const matches = (el) => matcher.test((el.innerText || el.textContent || '').trim());
+    const visible = (el) => !el.disabled && el.getClientRects().length > 0;
+    const settled = (el) => !el.isConnected || el.getAttribute('aria-expanded') === 'true' || !matches(el);
+    const pending = () => [...clicked].filter(el => !settled(el)).length;
+
+    const finish = (reason) => {
+        if (finished) return;
+        finished = true;
+        if (observer) observer.disconnect();
+        clearTimeout(idleTimer);
+        clearTimeout(capTimer);
+        resolve({
+            clicked: clicked.size,
+            pending: pending(),
+            rounds,
+            reason,
+            elapsed_ms: Math.round(performance.now() - start),
+        });
+    };
+    const expand = () => {
+        if (clicked.size >= maxButtons) return finish('max_buttons');
+        const scoped = new Set();
+        for (const root of document.querySelectorAll(container)) {
+            for (const el of root.querySelectorAll('button')) scoped.add(el);
+        }
+        const buttons = [...scoped]
+            .filter(el => !clicked.has(el) && visible(el) && matches(el))
+            .slice(0, maxButtons - clicked.size);
+        if (!buttons.length) return finish('done');
+        rounds++;
+        for (const el of buttons) {
+            clicked.add(el);
+            try { el.click(); } catch (e) {}
+        }
+        idle();
+    };
+    const idle = () => {
+        clearTimeout(idleTimer);
+        idleTimer = setTimeout(() => { if (!pending()) expand(); else idle(); }, idleMs);
+    };
+
+    observer = new MutationObserver(() => { if (idleTimer !== null) idle(); });
+    observer.observe(document.body, {childList: true, subtree: true, attributes: true, characterData: true});
+    capTimer = setTimeout(() => finish('cap'), maxMs);
+    expand();
+})
+"""
+
+# Button texts expanded by expand_see_more_buttons(): the label has to start
+# the button's text ("…see more", "Show all 12 experiences"), so buttons that
+# merely mention it elsewhere are left alone
+SEE_MORE_PATTERN = r"^[….\s]*(see more|show more|show all)\b"
+
+# Where expand_see_more_buttons() looks for buttons: the profile/company
+# section cards, not the nav bar, messaging overlay or side rail
+SEE_MORE_CONTAINER = "main section"
+
+
+async def expand_see_more_buttons(
+    page: Page,
+    max_buttons: int = 10,
+    idle_ms: float = 300,
+    max_ms: float = 5000,
+    pattern: str = SEE_MORE_PATTERN,
+    container: str = SEE_MORE_CONTAINER
+) -> Dict[str, Any]:
+    """
+    Click every 'See more' / 'Show more' button and wait until all have expanded, in one round trip.
+    
+    The expander runs in the page: it clicks all matching buttons at once,
+    waits for the DOM to settle and the buttons to report expansion, and
+    repeats for buttons the expansion revealed.
+    
+    Args:
+        page: Playwright page object
+        max_buttons: Maximum number of buttons to click
+        idle_ms: DOM quiet time after which a round is settled (milliseconds)
+        max_ms: Hard cap (milliseconds)
+        pattern: Case-insensitive regex matched against the trimmed button text
+        container: Selector of the elements whose buttons are expanded
+        
+    Returns:
+        Dict with buttons clicked, buttons still expanding at the end, rounds,
+        elapsed_ms and the stop reason (done, cap, max_buttons or error)
+    """
+    args = {"pattern": pattern, "container": container, "maxButtons": max_buttons, "idleMs": idle_ms, "maxMs": max_ms}
+    try:
+        # The in-page cap resolves first; this only guards a wedged renderer
+        result = await asyncio.wait_for(page.evaluate(_EXPAND_SEE_MORE_JS, args), timeout=max_ms / 1000 + 5)
+    except Exception as e:
+        logger.debug(f"See-more expansion interrupted: {e}")
+        return {"clicked": 0, "pending": None, "rounds": None, "reason": "error", "elapsed_ms": None}
+    
+    if result["clicked"]:
+        logger.debug(
+            f"Expanded {result['clicked']} 'see more' buttons in {result['rounds']} rounds, "
+            f"{result['elapsed_ms']}ms ({result['reason']}, {result['pending']} still pending)"
+        )
+    return result
+
+
 async def click_see_more_buttons(page: Page, max_attempts: int = 10) -> int:
     """
     Click all 'Show more' / 'See more' buttons on the page.
@@ -221,25 +625,8 @@ async def click_see_more_buttons(page: Page, max_attempts: int = 10) -> int:
     Returns:
         Number of buttons clicked
     """
-    clicked = 0
-    for _ in range(max_attempts):
-        try:
-            # Look for common "see more" button patterns
-            see_more = page.locator('button:has-text("See more"), button:has-text("Show more"), button:has-text("show all")').first
-            
-            if await see_more.is_visible(timeout=1000):
-                await see_more.click()
-                await asyncio.sleep(0.5)  # Wait for content to load
-                clicked += 1
-            else:
-                break
-        except:
-            break
-    
-    if clicked > 0:
-        logger.debug(f"Clicked {clicked} 'see more' buttons")
-    
-    return clicked
+    result = await expand_see_more_buttons(page, max_buttons=max_attempts)
+    return result["clicked"]
 
 
 async def handle_modal_close(page: Page) -> bool:
@@ -0,0 +1,210 @@
+"""Crash and hang supervision for tasks running on a page."""
+
+import asyncio
+import contextvars
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+from playwright.async_api import Page
+
+from .exceptions import PageCrashedError, TaskTimeoutError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# (attach, detach) of the watchdog run supervising the current task, if any
+_current_watch: "contextvars.ContextVar[Optional[Tuple[Callable[[Page], None], Callable[[Page], None]]]]" = (
+    contextvars.ContextVar("current_watch", default=None)
+)
+
+
+def watch_page(page: Page) -> None:
+    """
+    Supervise another page in the watchdog run the current task belongs to.
+
+    For tasks that move to a different page mid-run (e.g. a scraper
+    continuing on the spare page of a won hedge). No-op outside a run.
+
+    Args:
+        page: Page the task now works on
+    """
+    watch = _current_watch.get()
+    if watch:
+        watch[0](page)
+
+
+def unwatch_page(page: Page) -> None:
+    """
+    Stop supervising a page added with watch_page(), before handing it back.
+
+    Args:
+        page: Page the task no longer works on
+    """
+    watch = _current_watch.get()
+    if watch:
+        watch[1](page)
+
+
+class PageWatchdog:
+    """
+    Runs tasks on a page under a wall-clock ceiling and crash detection.
+
+    A task is abandoned as soon as its page emits ``crash`` or ``close``, or
+    once it has run for ``task_timeout`` seconds, instead of waiting for
+    Playwright's per-call timeouts (or forever). A task that moves to
+    another page registers it with ``watch_page()``. The caller gets
+    PageCrashedError or TaskTimeoutError; raised inside ``lease_page()`` /
+    ``lease_context()`` these make the pools replace the page (and, after a
+    crash, the context).
+
+    The watchdog also keeps time accounting across workers, so a run can
+    report how much worker time went to useful work vs stuck tasks.
+
+    Example:
+        watchdog = PageWatchdog(task_timeout=120)
+        async with browser.lease_page() as page:
+            person = await watchdog.run(page, PersonScraper(page).scrape(url))
+        print(watchdog.report(workers=3, wall_seconds=elapsed))
+    """
+
+    def __init__(self, task_timeout: float = 180.0, cancel_grace: float = 5.0):
+        """
+        Initialize watchdog.
+
+        Args:
+            task_timeout: Wall-clock ceiling per task in seconds
+            cancel_grace: Seconds to wait for an abandoned task to unwind
+        """
+        self.task_timeout = task_timeout
+        self.cancel_grace = cancel_grace
+
+        self.completed = 0
+        self.failed = 0
+        self.crashes = 0
+        self.timeouts = 0
+        self.busy_seconds = 0.0
+        self.lost_seconds = 0.0
+
+    async def run(self, page: Page, task: Awaitable[T], label: str = "") -> T:
+        """
+        Await a task that works on ``page``, abandoning it on crash or hang.
+
+        Args:
+            page: Page the task runs on
+            task: Coroutine to supervise
+            label: Name used in log messages
+
+        Returns:
+            The task's result
+
+        Raises:
+            PageCrashedError: If the page crashed or closed mid-task
+            TaskTimeoutError: If the task exceeded task_timeout
+        """
+        dead = asyncio.Event()
+        reason = {"event": ""}
+
+        def on_crash(_: Any) -> None:
+            reason["event"] = "crashed"
+            dead.set()
+
+        def on_close(_: Any) -> None:
+            reason["event"] = reason["event"] or "closed"
+            dead.set()
+
+        watched: List[Page] = []
+
+        def attach(watched_page: Page) -> None:
+            if watched_page not in watched:
+                watched_page.on("crash", on_crash)
+                watched_page.on("close", on_close)
+                watched.append(watched_page)
+
+        def detach(watched_page: Page) -> None:
+            if watched_page in watched and watched_page is not page:
+                watched_page.remove_listener("crash", on_crash)
+                watched_page.remove_listener("close", on_close)
+                watched.remove(watched_page)
+
+        attach(page)
+
+        start = time.monotonic()
+        # The task's context sees this run's attach/detach (see watch_page())
+        token = _current_watch.set((attach, detach))
+        try:
+            work = asyncio.ensure_future(task)
+        finally:
+            _current_watch.reset(token)
+        death = asyncio.ensure_future(dead.wait())
+        try:
+            done, _ = await asyncio.wait(
+                {work, death},
+                timeout=self.task_timeout,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        except asyncio.CancelledError:
+            work.cancel()
+            raise
+        finally:
+            death.cancel()
+            for watched_page in watched:
+                watched_page.remove_listener("crash", on_crash)
+                watched_page.remove_listener("close", on_close)
+
+        elapsed = time.monotonic() - start
+        prefix = f"[{label}] " if label else ""
+
+        if work in done:
+            error = work.exception()
+            if error is None:
+                self.busy_seconds += elapsed
+                self.completed += 1
+                return work.result()
+            if dead.is_set() or any(watched_page.is_closed() for watched_page in watched):
+                # The task failed because the page went away before the event was handled
+                event = reason["event"] or "closed"
+                self.crashes += 1
+                self.lost_seconds += elapsed
+                logger.warning(f"{prefix}Page {event} after {elapsed:.1f}s, task failed with: {error}")
+                raise PageCrashedError(f"Page {event} during task") from error
+            self.busy_seconds += elapsed
+            self.failed += 1
+            return work.result()
+
+        # Crashed or hung: stop the task and let the pools replace the page
+        work.cancel()
+        await asyncio.wait({work}, timeout=self.cancel_grace)
+        self.lost_seconds += elapsed
+
+        if dead.is_set():
+            self.crashes += 1
+            logger.warning(f"{prefix}Page {reason['event']} after {elapsed:.1f}s, abandoning task")
+            raise PageCrashedError(f"Page {reason['event']} during task")
+
+        self.timeouts += 1
+        logger.warning(f"{prefix}Task exceeded {self.task_timeout:g}s, abandoning it")
+        raise TaskTimeoutError(f"Task exceeded {self.task_timeout:g}s wall-clock limit")
+
+    def report(self, workers: int, wall_seconds: float) -> Dict[str, Any]:
+        """
+        Summarize how worker time was spent.
+
+        Args:
+            workers: Number of concurrent workers in the run
+            wall_seconds: Wall-clock duration of the run
+
+        Returns:
+            Dict with task counters, busy/lost seconds and utilization ratios
+        """
+        capacity = workers * wall_seconds
+        return {
+            "completed": self.completed,
+            "failed": self.failed,
+            "crashes": self.crashes,
+            "timeouts": self.timeouts,
+            "busy_seconds": round(self.busy_seconds, 1),
+            "lost_seconds": round(self.lost_seconds, 1),
+            "utilization": round(self.busy_seconds / capacity, 3) if capacity else 0.0,
+            "lost_ratio": round(self.lost_seconds / capacity, 3) if capacity else 0.0,
+        }
@@ -55,6 +55,8 @@ class Person(BaseModel):
     interests: List[str] = Field(default_factory=list)
     accomplishments: List[Accomplishment] = Field(default_factory=list)
     contacts: List[Contact] = Field(default_factory=list)
+    # True if the scrape's time budget ran out and some sections are missing
+    incomplete: bool = False
     
     @field_validator('linkedin_url')
     @classmethod
@@ -1,15 +1,40 @@
-"""Scraper modules for LinkedIn."""
-
-from .base import BaseScraper
-from .person import PersonScraper
-from .company import CompanyScraper
-from .job import JobScraper
-from .job_search import JobSearchScraper
-
-__all__ = [
-    'BaseScraper',
-    'PersonScraper',
-    'CompanyScraper',
-    'JobScraper',
-    'JobSearchScraper',
-]
+"""Scraper modules for LinkedIn.
+
+Scrapers are loaded on first access (PEP 562).
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .base import BaseScraper
+    from .person import PersonScraper
+    from .company import CompanyScraper
+    from .job import JobScraper
+    from .job_search import JobSearchScraper
+
+# Public name -> submodule that defines it
+_LAZY_ATTRIBUTES = {
+    'BaseScraper': '.base',
+    'PersonScraper': '.person',
+    'CompanyScraper': '.company',
+    'JobScraper': '.job',
+    'JobSearchScraper': '.job_search',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining ``name`` on first access and cache the value."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
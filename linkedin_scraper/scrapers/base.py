@@ -2,59 +2,129 @@
 
 import asyncio
 import logging
-from typing import Optional
-from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+import time
+from typing import Optional, Set, Tuple
+from playwright.async_api import Page, Response, TimeoutError as PlaywrightTimeoutError
 
 from ..callbacks import ProgressCallback, SilentCallback
 from ..core import (
     is_logged_in,
     detect_rate_limit,
+    inspect_navigation,
     scroll_to_bottom,
     scroll_to_half,
-    click_see_more_buttons,
+    scroll_to_load,
+    expand_see_more_buttons,
     handle_modal_close,
     extract_text_safe,
     retry_async,
 )
-from ..core.exceptions import AuthenticationError, ScrapingError
+from ..core.auth import get_auth_state, is_login_redirect
+from ..core.deadline import Deadline
+from ..core.exceptions import AuthenticationError, ScrapingError, SessionExpiredError
+from ..core.hedging import HedgePolicy
+from ..core.latency import latency_tracker
+from ..core.navigation import soft_navigate
+from ..core.probe import probe
+from ..core.readiness import get_readiness_preset, wait_until_ready
+from ..core.watchdog import unwatch_page, watch_page
 
 logger = logging.getLogger(__name__)
 
+# Timeouts used until the latency tracker has enough samples for a page type
+NAVIGATION_TIMEOUT = 60000
+CONTENT_TIMEOUT = 10000
+# Playwright's timeout for calls without an explicit one
+DEFAULT_ACTION_TIMEOUT = 30000
+# Wait for an in-app route to render before falling back to a page load
+SOFT_NAVIGATION_TIMEOUT = 5000
+
 
 class BaseScraper:
     """Base class with common scraping functionality."""
     
-    def __init__(self, page: Page, callback: Optional[ProgressCallback] = None):
+    def __init__(
+        self,
+        page: Page,
+        callback: Optional[ProgressCallback] = None,
+        soft_navigation: bool = False,
+        hedge: Optional[HedgePolicy] = None
+    ):
         """
         Initialize base scraper.
         
         Args:
             page: Playwright page object
             callback: Progress callback (defaults to SilentCallback)
+            soft_navigation: Once the page has the app loaded, move between
+                pages with in-app (client-side) navigation instead of a full
+                page load, falling back to goto when that fails
+            hedge: Hedge full page loads that run past their p95 on a spare
+                page (see HedgePolicy); the scraper may then continue on that
+                page until the next navigation
         """
         self.page = page
         self.callback = callback or SilentCallback()
+        self.soft_navigation = soft_navigation
+        self.hedge = hedge
+        # Page the scraper was given; self.page is a spare page after a won hedge
+        self._primary_page = page
+        # Time budget of the current scrape; every wait is clamped to it
+        self.deadline = Deadline()
+        # Pages whose default timeout bound_default_timeout() clamped
+        self._bounded_pages: Set[Page] = set()
+        # Navigation started by prefetch(): (url, task)
+        self._prefetch: Optional[Tuple[str, asyncio.Task]] = None
+        # Opt-in slow path: also scan the whole body text after each navigation
+        self.thorough_rate_limit_checks = False
     
     async def ensure_logged_in(self) -> None:
         """
         Verify user is authenticated.
         
+        The result is cached per browser context (see AuthState): the page
+        is only checked again after a navigation was redirected to a login,
+        authwall or checkpoint page, or once the cached check has expired.
+        
         Raises:
             AuthenticationError: If not logged in
         """
+        state = get_auth_state(self.page.context)
+        if state.is_fresh:
+            state.skipped += 1
+            return
+        
+        state.checks += 1
         if not await is_logged_in(self.page):
             raise AuthenticationError(
                 "Not logged in. Please authenticate before scraping."
             )
+        state.mark_verified()
     
-    async def check_rate_limit(self) -> None:
+    async def check_rate_limit(self, response: Optional[Response] = None) -> None:
         """
         Check for rate limiting.
         
+        Args:
+            response: Response of the navigation that was just made, if any
+            
+        Raises:
+            RateLimitError: If rate limiting is detected
+        """
+        await detect_rate_limit(self.page, response, self.thorough_rate_limit_checks)
+    
+    async def check_navigation(self, response: Optional[Response] = None) -> None:
+        """
+        Check a navigation's outcome: rate limiting, or a dead/unavailable page.
+        
+        Args:
+            response: Response of the navigation that was just made, if any
+            
         Raises:
             RateLimitError: If rate limiting is detected
+            ProfileNotFoundError: If the page doesn't exist or is unavailable
         """
-        await detect_rate_limit(self.page)
+        await inspect_navigation(self.page, response, self.thorough_rate_limit_checks)
     
     async def scroll_page_to_bottom(self, pause_time: float = 1.0, max_scrolls: int = 10) -> None:
         """
@@ -64,7 +134,42 @@ class BaseScraper:
             pause_time: Time to pause between scrolls
             max_scrolls: Maximum number of scroll attempts
         """
-        await scroll_to_bottom(self.page, pause_time, max_scrolls)
+        requested = max_scrolls * pause_time * 1000 + 5000
+        max_ms = self.deadline.clamp(requested)
+        if max_ms <= 0:
+            self.deadline.mark_cut_short("scrolling to the bottom")
+            return
+        result = await scroll_to_bottom(self.page, pause_time, max_scrolls, max_ms)
+        if result["reason"] == "cap":
+            self._note_clamped(requested, max_ms, "scrolling to the bottom")
+    
+    async def load_all_items(
+        self,
+        item_selector: str,
+        idle_ms: float = 1000,
+        max_ms: float = 20000,
+        max_items: Optional[int] = None
+    ) -> Optional[int]:
+        """
+        Scroll until a lazily loaded list stops growing (one round trip).
+        
+        Args:
+            item_selector: CSS selector of the list items
+            idle_ms: Stop after this long without new items (milliseconds)
+            max_ms: Hard cap (milliseconds)
+            max_items: Stop once this many items are loaded
+            
+        Returns:
+            Number of items loaded, or None if the loader could not run
+        """
+        requested, max_ms = max_ms, self.deadline.clamp(max_ms)
+        if max_ms <= 0:
+            self.deadline.mark_cut_short(f"loading {item_selector}")
+            return None
+        result = await scroll_to_load(self.page, item_selector, idle_ms, max_ms, max_items)
+        if result["reason"] == "cap":
+            self._note_clamped(requested, max_ms, f"loading {item_selector}")
+        return result["items"]
     
     async def scroll_page_to_half(self) -> None:
         """Scroll to middle of page."""
@@ -85,7 +190,7 @@ class BaseScraper:
     
     async def click_all_see_more_buttons(self, max_attempts: int = 10) -> int:
         """
-        Click all 'Show more' / 'See more' buttons.
+        Click all 'Show more' / 'See more' buttons and wait until they have expanded (one round trip).
         
         Args:
             max_attempts: Maximum number of buttons to click
@@ -93,7 +198,14 @@ class BaseScraper:
         Returns:
             Number of buttons clicked
         """
-        return await click_see_more_buttons(self.page, max_attempts)
+        max_ms = self.deadline.clamp(5000)
+        if max_ms <= 0:
+            self.deadline.mark_cut_short("expanding 'see more' buttons")
+            return 0
+        result = await expand_see_more_buttons(self.page, max_buttons=max_attempts, max_ms=max_ms)
+        if result["reason"] == "cap":
+            self._note_clamped(5000, max_ms, "expanding 'see more' buttons")
+        return result["clicked"]
     
     async def close_modals(self) -> bool:
         """
@@ -104,19 +216,49 @@ class BaseScraper:
         """
         return await handle_modal_close(self.page)
     
-    async def safe_extract_text(self, selector: str, default: str = "", timeout: float = 2000) -> str:
+    async def safe_extract_text(self, selector: str, default: str = "", timeout: float = 0) -> str:
         """
         Safely extract text from element.
         
         Args:
             selector: CSS selector
             default: Default value if not found
-            timeout: Timeout in milliseconds
+            timeout: Milliseconds to wait if the element is not there yet (default: 0)
             
         Returns:
             Extracted text or default
         """
-        return await extract_text_safe(self.page, selector, default, timeout)
+        wait = self.deadline.clamp(timeout)
+        text = await extract_text_safe(self.page, selector, None, wait)
+        if text is None:
+            self._note_clamped(timeout, wait, f"waiting for {selector}")
+            return default
+        return text
+    
+    async def probe(
+        self,
+        selector: str,
+        attribute: Optional[str] = None,
+        timeout: float = 0,
+        inner: bool = False
+    ) -> Optional[dict]:
+        """
+        Look up whether an element exists and what it contains, in one query.
+        
+        Args:
+            selector: CSS selector (first match is used)
+            attribute: Attribute to read as well
+            timeout: Milliseconds to wait if the element is not there yet (default: 0)
+            inner: Return rendered innerText instead of textContent
+            
+        Returns:
+            Dict with "text" and "attribute", or None if the element is absent
+        """
+        wait = self.deadline.clamp(timeout)
+        result = await probe(self.page, selector, attribute, wait, inner)
+        if result is None:
+            self._note_clamped(timeout, wait, f"waiting for {selector}")
+        return result
     
     @retry_async(max_attempts=3, backoff=2.0, exceptions=(PlaywrightTimeoutError,))
     async def safe_click(self, selector: str, timeout: float = 5000) -> bool:
@@ -132,9 +274,10 @@ class BaseScraper:
         """
         try:
             element = self.page.locator(selector).first
-            await element.click(timeout=timeout)
+            await element.click(timeout=self._clamp_wait(timeout))
             return True
         except PlaywrightTimeoutError:
+            self._note_clamped(timeout, self._clamp_wait(timeout), f"clicking {selector}")
             logger.debug(f"Could not click element: {selector}")
             return False
         except Exception as e:
@@ -149,23 +292,215 @@ class BaseScraper:
             timeout: Timeout in milliseconds
         """
         try:
-            await self.page.wait_for_load_state('networkidle', timeout=timeout)
+            await self.page.wait_for_load_state('networkidle', timeout=self._clamp_wait(timeout))
         except PlaywrightTimeoutError:
+            self._note_clamped(timeout, self._clamp_wait(timeout), "waiting for the network to go idle")
             logger.warning("Navigation did not complete within timeout")
     
-    async def navigate_and_wait(self, url: str, wait_until: str = 'domcontentloaded', timeout: int = 60000) -> None:
+    async def navigate_and_wait(
+        self,
+        url: str,
+        wait_until: str = 'domcontentloaded',
+        timeout: Optional[float] = None,
+        page_type: Optional[str] = None
+    ) -> None:
         """
         Navigate to URL and wait for page load.
         
+        In soft-navigation mode the app's router is tried first, so bundles
+        already on the page are not downloaded and executed again. A soft
+        navigation has no HTTP response, so only the page checks run after it
+        (login redirect, block and unavailable markers), not the status-based
+        ones (404/410, 429/999). A page whose router ignored a route once gets
+        full page loads from then on (see soft_navigate).
+        
+        Full page loads are timed per page type, and without an explicit
+        timeout the page type's observed latency decides it (see
+        LatencyTracker), falling back to 60s until enough loads are recorded.
+        With a hedge policy a load past its p95 is raced on a spare page.
+        All timeouts are clamped to the scrape's remaining time budget.
+        A navigation to the URL started by prefetch() is adopted instead.
+        
         Args:
             url: URL to navigate to
             wait_until: Wait condition (domcontentloaded, networkidle, load)
-            timeout: Timeout in milliseconds (default: 60000 = 60s)
+            timeout: Timeout in milliseconds (default: adaptive, 60s before warm-up)
+            page_type: Page type the latency is recorded under (e.g. "profile")
+            
+        Raises:
+            DeadlineExceededError: If the scrape's time budget is spent
+            SessionExpiredError: If LinkedIn redirected to login or the authwall
+            RateLimitError: If rate limiting is detected
+            ProfileNotFoundError: If the page doesn't exist or is unavailable
+        """
+        self.deadline.check(f"navigating to {url}")
+        if self._prefetch and self._prefetch[0] == url:
+            # Already loading (or loaded) in the background: adopt it
+            task = self._prefetch[1]
+            self._prefetch = None
+            remaining = self.deadline.remaining_ms()
+            try:
+                await asyncio.wait_for(task, None if remaining is None else remaining / 1000)
+            except asyncio.TimeoutError:
+                raise self.deadline.exceeded(f"Time budget ran out while loading {url}")
+            self.bound_default_timeout()
+            return
+        self.cancel_prefetch()
+        await self._navigate(url, wait_until, timeout, page_type)
+        self.bound_default_timeout()
+    
+    def prefetch(self, url: str, page_type: Optional[str] = None) -> None:
+        """
+        Start navigating to a URL in the background.
+        
+        Lets a page load while the caller is still busy elsewhere (e.g.
+        extracting the previous profile on another page). The next
+        navigate_and_wait() to the same URL waits for this navigation
+        instead of starting its own, and raises whatever it raised.
+        
+        Args:
+            url: URL to navigate to
+            page_type: Page type the latency is recorded under (e.g. "profile")
+        """
+        self.cancel_prefetch()
+        self._prefetch = (url, asyncio.ensure_future(self._navigate(url, page_type=page_type)))
+    
+    def cancel_prefetch(self) -> None:
+        """Cancel a prefetch that no navigation adopted."""
+        if self._prefetch is None:
+            return
+        task = self._prefetch[1]
+        self._prefetch = None
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled():
+            task.exception()  # retrieved, so asyncio doesn't log it
+    
+    async def _navigate(
+        self,
+        url: str,
+        wait_until: str = 'domcontentloaded',
+        timeout: Optional[float] = None,
+        page_type: Optional[str] = None
+    ) -> None:
+        """Navigate (see navigate_and_wait), without looking at prefetches."""
+        key = page_type or "page"
+        await self.release_hedge_page()
+        response = None
+        if self.soft_navigation and await soft_navigate(self.page, url, self._clamp_wait(SOFT_NAVIGATION_TIMEOUT)):
+            logger.info(f"Soft-navigated to: {url}")
+        else:
+            logger.info(f"Navigating to: {url}")
+            if timeout is None:
+                timeout = latency_tracker.timeout_ms(key, NAVIGATION_TIMEOUT)
+            requested, timeout = timeout, self._clamp_wait(timeout)
+            start = time.monotonic()
+            try:
+                if self.hedge:
+                    # Records the latency itself (but not a timeout the budget shortened)
+                    self.page, response = await self.hedge.goto(
+                        self.page, url, key, wait_until, timeout, record_timeout=timeout >= requested
+                    )
+                    if self.page is not self._primary_page:
+                        # Continuing on the spare page: have the watchdog supervise it too
+                        watch_page(self.page)
+                else:
+                    # Use type: ignore to bypass strict typing
+                    response = await self.page.goto(url, wait_until=wait_until, timeout=timeout)  # type: ignore
+            except PlaywrightTimeoutError:
+                if timeout < requested:
+                    raise self.deadline.exceeded(f"Time budget ran out while loading {url}")
+                if not self.hedge:
+                    latency_tracker.record_timeout(key)
+                raise
+            if not self.hedge:
+                latency_tracker.record(key, (time.monotonic() - start) * 1000)
+        if not get_auth_state(self.page.context).observe_url(self.page.url) and is_login_redirect(self.page.url):
+            raise SessionExpiredError(f"Session expired: redirected to {self.page.url}")
+        await self.check_navigation(response)
+    
+    def _clamp_wait(self, timeout: float) -> float:
+        """
+        Clamp a Playwright timeout to the scrape's remaining budget.
+        
+        Never returns 0, which Playwright reads as "no timeout".
+        """
+        return max(1, self.deadline.clamp(timeout))
+    
+    def _note_clamped(self, requested: float, granted: float, what: str) -> None:
+        """Record a wait that ran out after the budget had shortened it."""
+        if granted < requested:
+            self.deadline.mark_cut_short(what)
+    
+    def bound_default_timeout(self) -> bool:
+        """
+        Clamp Playwright's default timeout to the remaining budget.
+        
+        Bounds the calls without an explicit timeout (e.g. locator reads in
+        the parse helpers). Runs after every navigation; parse loops call it
+        again before each item. reset_default_timeout() undoes it.
+        
+        Returns:
+            False if the budget is spent (the caller should stop)
+        """
+        if self.deadline.expires_at is None:
+            return True
+        if self.deadline.expired:
+            self.deadline.mark_cut_short("parsing")
+            return False
+        self.page.set_default_timeout(self._clamp_wait(DEFAULT_ACTION_TIMEOUT))
+        self._bounded_pages.add(self.page)
+        return True
+    
+    def reset_default_timeout(self) -> None:
+        """Give the pages bound_default_timeout() touched Playwright's default timeout back."""
+        for page in self._bounded_pages:
+            page.set_default_timeout(DEFAULT_ACTION_TIMEOUT)
+        self._bounded_pages.clear()
+    
+    async def release_hedge_page(self) -> None:
         """
-        logger.info(f"Navigating to: {url}")
-        # Use type: ignore to bypass strict typing
-        await self.page.goto(url, wait_until=wait_until, timeout=timeout)  # type: ignore
-        await self.check_rate_limit()
+        Move back to the scraper's own page after a won hedge.
+        
+        Returns the spare page to the hedge policy; scrapers call this when
+        a scrape ends, and it runs before every navigation.
+        """
+        if self.page is not self._primary_page:
+            spare, self.page = self.page, self._primary_page
+            unwatch_page(spare)
+            if self.hedge:
+                await self.hedge.release(spare)
+    
+    async def wait_for_content(self, selector: str, key: str, timeout: Optional[float] = None) -> None:
+        """
+        Wait for an element, with a timeout adapted to its observed latency.
+        
+        The wait is recorded under ``key`` and, without an explicit timeout,
+        that key's observed latency decides it (10s until enough waits are
+        recorded).
+        
+        Args:
+            selector: CSS selector of the content
+            key: Latency key (e.g. "profile.content", "experience.list")
+            timeout: Timeout in milliseconds (default: adaptive)
+            
+        Raises:
+            DeadlineExceededError: If the scrape's time budget is spent
+            PlaywrightTimeoutError: If the content doesn't appear in time
+        """
+        if timeout is None:
+            timeout = latency_tracker.timeout_ms(key, CONTENT_TIMEOUT)
+        self.deadline.check(f"waiting for {selector}")
+        requested, timeout = timeout, self._clamp_wait(timeout)
+        start = time.monotonic()
+        try:
+            await self.page.wait_for_selector(selector, timeout=timeout)
+        except PlaywrightTimeoutError:
+            if timeout < requested:
+                raise self.deadline.exceeded(f"Time budget ran out while waiting for {selector}")
+            latency_tracker.record_timeout(key)
+            raise
+        latency_tracker.record(key, (time.monotonic() - start) * 1000)
     
     async def extract_list_items(
         self,
@@ -186,10 +521,11 @@ class BaseScraper:
         """
         try:
             container = self.page.locator(container_selector).first
-            await container.wait_for(timeout=timeout)
+            await container.wait_for(timeout=self._clamp_wait(timeout))
             items = container.locator(item_selector).all()
             return await items
         except PlaywrightTimeoutError:
+            self._note_clamped(timeout, self._clamp_wait(timeout), f"waiting for {container_selector}")
             logger.warning(f"Container not found: {container_selector}")
             return []
         except Exception as e:
@@ -201,7 +537,7 @@ class BaseScraper:
         selector: str,
         attribute: str,
         default: str = "",
-        timeout: float = 2000
+        timeout: float = 0
     ) -> str:
         """
         Safely get element attribute.
@@ -210,17 +546,39 @@ class BaseScraper:
             selector: CSS selector
             attribute: Attribute name
             default: Default value if not found
-            timeout: Timeout in milliseconds
+            timeout: Milliseconds to wait if the element is not there yet (default: 0)
             
         Returns:
             Attribute value or default
         """
-        try:
-            element = self.page.locator(selector).first
-            value = await element.get_attribute(attribute, timeout=timeout)
-            return value if value else default
-        except:
-            return default
+        result = await self.probe(selector, attribute, timeout)
+        value = result["attribute"] if result else None
+        return value if value else default
+    
+    async def wait_until_ready(self, preset: str, cap_ms: Optional[float] = None, **overrides) -> bool:
+        """
+        Wait until the page's content is present and settled (see READINESS_PRESETS).
+        
+        Returns as soon as the preset's signals hold instead of sleeping for
+        a fixed time, and gives up (without raising) after the cap.
+        
+        Args:
+            preset: Page type, e.g. "profile" or "details"
+            cap_ms: Hard cap in milliseconds (defaults to the preset's)
+            **overrides: Replace preset fields (selector, items, responses, root, quiet_ms)
+            
+        Returns:
+            True if the page got ready before the cap
+        """
+        requested = cap_ms if cap_ms is not None else get_readiness_preset(preset)["cap_ms"]
+        cap_ms = self.deadline.clamp(requested)
+        if cap_ms <= 0:
+            self.deadline.mark_cut_short(f"waiting for the {preset} page to get ready")
+            return False
+        result = await wait_until_ready(self.page, preset, cap_ms, **overrides)
+        if not result["ready"]:
+            self._note_clamped(requested, cap_ms, f"waiting for the {preset} page to get ready")
+        return result["ready"]
     
     async def wait_and_focus(self, duration: float = 1.0) -> None:
         """
@@ -251,19 +609,15 @@ class BaseScraper:
         except:
             return 0
     
-    async def element_exists(self, selector: str, timeout: float = 1000) -> bool:
+    async def element_exists(self, selector: str, timeout: float = 0) -> bool:
         """
         Check if element exists.
         
         Args:
             selector: CSS selector
-            timeout: Timeout in milliseconds
+            timeout: Milliseconds to wait if the element is not there yet (default: 0)
             
         Returns:
             True if element exists
         """
-        try:
-            await self.page.wait_for_selector(selector, timeout=timeout, state='attached')
-            return True
-        except:
-            return False
+        return await self.probe(selector, timeout=timeout) is not None
@@ -11,6 +11,7 @@ from ..models.company import Company
 from ..core.exceptions import ProfileNotFoundError
 from ..callbacks import ProgressCallback, SilentCallback
 from .base import BaseScraper
+from ..core.hedging import HedgePolicy
 
 logger = logging.getLogger(__name__)
 
@@ -26,15 +27,23 @@ class CompanyScraper(BaseScraper):
             print(company.to_json())
     """
     
-    def __init__(self, page: Page, callback: Optional[ProgressCallback] = None):
+    def __init__(
+        self,
+        page: Page,
+        callback: Optional[ProgressCallback] = None,
+        soft_navigation: bool = False,
+        hedge: Optional[HedgePolicy] = None
+    ):
         """
         Initialize company scraper.
         
         Args:
             page: Playwright page object
             callback: Optional progress callback
+            soft_navigation: Use in-app navigation between pages (see BaseScraper)
+            hedge: Hedge slow page loads on a spare page (see BaseScraper)
         """
-        super().__init__(page, callback or SilentCallback())
+        super().__init__(page, callback or SilentCallback(), soft_navigation, hedge)
     
     async def scrape(self, linkedin_url: str) -> Company:
         """
@@ -52,48 +61,48 @@ class CompanyScraper(BaseScraper):
         logger.info(f"Starting company scraping: {linkedin_url}")
         await self.callback.on_start("company", linkedin_url)
         
-        # Navigate to company page
-        await self.navigate_and_wait(linkedin_url)
-        await self.callback.on_progress("Navigated to company page", 10)
-        
-        # Check if page exists
-        await self.check_rate_limit()
-        
-        # Extract basic info
-        name = await self._get_name()
-        await self.callback.on_progress(f"Got company name: {name}", 20)
-        
-        about_us = await self._get_about()
-        await self.callback.on_progress("Got about section", 30)
-        
-        # Extract overview details
-        overview = await self._get_overview()
-        await self.callback.on_progress("Got overview details", 50)
-        
-        # Create company object
-        company = Company(
-            linkedin_url=linkedin_url,
-            name=name,
-            about_us=about_us,
-            **overview
-        )
-        
-        await self.callback.on_progress("Scraping complete", 100)
-        await self.callback.on_complete("company", company)
-        
-        logger.info(f"Successfully scraped company: {name}")
-        return company
+        try:
+            # Navigate to company page
+            await self.navigate_and_wait(linkedin_url, page_type="company")
+            await self.callback.on_progress("Navigated to company page", 10)
+            await self.wait_until_ready("company")
+            
+            # Extract basic info
+            name = await self._get_name()
+            await self.callback.on_progress(f"Got company name: {name}", 20)
+            
+            about_us = await self._get_about()
+            await self.callback.on_progress("Got about section", 30)
+            
+            # Extract overview details
+            overview = await self._get_overview()
+            await self.callback.on_progress("Got overview details", 50)
+            
+            # Create company object
+            company = Company(
+                linkedin_url=linkedin_url,
+                name=name,
+                about_us=about_us,
+                **overview
+            )
+            
+            await self.callback.on_progress("Scraping complete", 100)
+            await self.callback.on_complete("company", company)
+            
+            logger.info(f"Successfully scraped company: {name}")
+            return company
+        finally:
+            # Hand back a spare page from a won hedge
+            await self.release_hedge_page()
     
     async def _get_name(self) -> str:
         """Extract company name."""
-        try:
-            # Try main heading
-            name_elem = self.page.locator('h1').first
-            name = await name_elem.inner_text()
-            return name.strip()
-        except Exception as e:
-            logger.warning(f"Error getting company name: {e}")
+        # Try main heading
+        heading = await self.probe('h1', inner=True)
+        if not heading or not heading["text"]:
+            logger.warning("Company name heading not found")
             return "Unknown Company"
+        return heading["text"].strip()
     
     async def _get_about(self) -> Optional[str]:
         """Extract about/description section."""
@@ -11,6 +11,7 @@ from ..models.job import Job
 from ..core.exceptions import ProfileNotFoundError
 from ..callbacks import ProgressCallback, SilentCallback
 from .base import BaseScraper
+from ..core.hedging import HedgePolicy
 
 logger = logging.getLogger(__name__)
 
@@ -26,15 +27,23 @@ class JobScraper(BaseScraper):
             print(job.to_json())
     """
     
-    def __init__(self, page: Page, callback: Optional[ProgressCallback] = None):
+    def __init__(
+        self,
+        page: Page,
+        callback: Optional[ProgressCallback] = None,
+        soft_navigation: bool = False,
+        hedge: Optional[HedgePolicy] = None
+    ):
         """
         Initialize job scraper.
         
         Args:
             page: Playwright page object
             callback: Optional progress callback
+            soft_navigation: Use in-app navigation between pages (see BaseScraper)
+            hedge: Hedge slow page loads on a spare page (see BaseScraper)
         """
-        super().__init__(page, callback or SilentCallback())
+        super().__init__(page, callback or SilentCallback(), soft_navigation, hedge)
     
     async def scrape(self, linkedin_url: str) -> Job:
         """
@@ -52,83 +61,80 @@ class JobScraper(BaseScraper):
         logger.info(f"Starting job scraping: {linkedin_url}")
         await self.callback.on_start("Job", linkedin_url)
         
-        # Navigate to job page
-        await self.navigate_and_wait(linkedin_url)
-        await self.callback.on_progress("Navigated to job page", 10)
-        
-        # Check if page exists
-        await self.check_rate_limit()
-        
-        # Extract job details
-        job_title = await self._get_job_title()
-        await self.callback.on_progress(f"Got job title: {job_title}", 20)
-        
-        company = await self._get_company()
-        await self.callback.on_progress("Got company name", 30)
-        
-        location = await self._get_location()
-        await self.callback.on_progress("Got location", 40)
-        
-        posted_date = await self._get_posted_date()
-        await self.callback.on_progress("Got posted date", 50)
-        
-        applicant_count = await self._get_applicant_count()
-        await self.callback.on_progress("Got applicant count", 60)
-        
-        job_description = await self._get_description()
-        await self.callback.on_progress("Got job description", 80)
-        
-        company_url = await self._get_company_url()
-        await self.callback.on_progress("Got company URL", 90)
-        
-        # Create job object
-        job = Job(
-            linkedin_url=linkedin_url,
-            job_title=job_title,
-            company=company,
-            company_linkedin_url=company_url,
-            location=location,
-            posted_date=posted_date,
-            applicant_count=applicant_count,
-            job_description=job_description
-        )
-        
-        await self.callback.on_progress("Scraping complete", 100)
-        await self.callback.on_complete("Job", job)
-        
-        logger.info(f"Successfully scraped job: {job_title}")
-        return job
+        try:
+            # Navigate to job page
+            await self.navigate_and_wait(linkedin_url, page_type="job")
+            await self.callback.on_progress("Navigated to job page", 10)
+            await self.wait_until_ready("job")
+            
+            # Extract job details
+            job_title = await self._get_job_title()
+            await self.callback.on_progress(f"Got job title: {job_title}", 20)
+            
+            company = await self._get_company()
+            await self.callback.on_progress("Got company name", 30)
+            
+            location = await self._get_location()
+            await self.callback.on_progress("Got location", 40)
+            
+            posted_date = await self._get_posted_date()
+            await self.callback.on_progress("Got posted date", 50)
+            
+            applicant_count = await self._get_applicant_count()
+            await self.callback.on_progress("Got applicant count", 60)
+            
+            job_description = await self._get_description()
+            await self.callback.on_progress("Got job description", 80)
+            
+            company_url = await self._get_company_url()
+            await self.callback.on_progress("Got company URL", 90)
+            
+            # Create job object
+            job = Job(
+                linkedin_url=linkedin_url,
+                job_title=job_title,
+                company=company,
+                company_linkedin_url=company_url,
+                location=location,
+                posted_date=posted_date,
+                applicant_count=applicant_count,
+                job_description=job_description
+            )
+            
+            await self.callback.on_progress("Scraping complete", 100)
+            await self.callback.on_complete("Job", job)
+            
+            logger.info(f"Successfully scraped job: {job_title}")
+            return job
+        finally:
+            # Hand back a spare page from a won hedge
+            await self.release_hedge_page()
     
     async def _get_job_title(self) -> Optional[str]:
         """Extract job title."""
-        try:
-            # Try h1 heading
-            title_elem = self.page.locator('h1').first
-            title = await title_elem.inner_text()
-            return title.strip()
-        except:
-            return None
+        # Try h1 heading
+        heading = await self.probe('h1', inner=True)
+        return heading["text"].strip() if heading and heading["text"] else None
     
     async def _get_company(self) -> Optional[str]:
         """Extract company name."""
+        # Look for company name link or text
+        company = await self.probe('.job-details-jobs-unified-top-card__company-name', inner=True)
+        if company and company["text"]:
+            return company["text"].strip()
+        
+        # Fallback: look for any link with "company" in it
         try:
-            # Look for company name link or text
-            company_elem = self.page.locator('.job-details-jobs-unified-top-card__company-name').first
-            company = await company_elem.inner_text()
-            return company.strip()
+            links = await self.page.locator('a').all()
+            for link in links:
+                href = await link.get_attribute('href')
+                if href and '/company/' in href:
+                    text = await link.inner_text()
+                    if text and len(text.strip()) > 0:
+                        return text.strip()
         except:
-            # Fallback: look for any link with "company" in it
-            try:
-                links = await self.page.locator('a').all()
-                for link in links:
-                    href = await link.get_attribute('href')
-                    if href and '/company/' in href:
-                        text = await link.inner_text()
-                        if text and len(text.strip()) > 0:
-                            return text.strip()
-            except:
-                pass
-            return None
+            pass
+        return None
     
     async def _get_company_url(self) -> Optional[str]:
         """Extract company LinkedIn URL."""
@@ -147,12 +153,8 @@ class JobScraper(BaseScraper):
     
     async def _get_location(self) -> Optional[str]:
         """Extract job location."""
-        try:
-            location_elem = self.page.locator('.job-details-jobs-unified-top-card__bullet').first
-            location = await location_elem.inner_text()
-            return location.strip()
-        except:
-            return None
+        location = await self.probe('.job-details-jobs-unified-top-card__bullet', inner=True)
+        return location["text"].strip() if location and location["text"] else None
     
     async def _get_posted_date(self) -> Optional[str]:
         """Extract posted date."""
@@ -182,17 +184,9 @@ class JobScraper(BaseScraper):
     
     async def _get_description(self) -> Optional[str]:
         """Extract job description."""
-        try:
-            # Look for the description section
-            desc_elem = self.page.locator('.jobs-description__content').first
-            description = await desc_elem.inner_text()
-            return description.strip()
-        except:
-            # Fallback: try to find article or main content
-            try:
-                article = self.page.locator('article').first
-                description = await article.inner_text()
-                return description.strip()
-            except:
-                pass
-            return None
+        # Look for the description section, then fall back to article content
+        for selector in ('.jobs-description__content', 'article'):
+            description = await self.probe(selector, inner=True)
+            if description and description["text"]:
+                return description["text"].strip()
+        return None
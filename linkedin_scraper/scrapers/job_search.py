@@ -10,6 +10,7 @@ from playwright.async_api import Page
 
 from ..callbacks import ProgressCallback, SilentCallback
 from .base import BaseScraper
+from ..core.hedging import HedgePolicy
 
 logger = logging.getLogger(__name__)
 
@@ -28,15 +29,23 @@ class JobSearchScraper(BaseScraper):
             )
     """
     
-    def __init__(self, page: Page, callback: Optional[ProgressCallback] = None):
+    def __init__(
+        self,
+        page: Page,
+        callback: Optional[ProgressCallback] = None,
+        soft_navigation: bool = False,
+        hedge: Optional[HedgePolicy] = None
+    ):
         """
         Initialize job search scraper.
         
         Args:
             page: Playwright page object
             callback: Optional progress callback
+            soft_navigation: Use in-app navigation between pages (see BaseScraper)
+            hedge: Hedge slow page loads on a spare page (see BaseScraper)
         """
-        super().__init__(page, callback or SilentCallback())
+        super().__init__(page, callback or SilentCallback(), soft_navigation, hedge)
     
     async def search(
         self,
@@ -61,27 +70,31 @@ class JobSearchScraper(BaseScraper):
         search_url = self._build_search_url(keywords, location)
         await self.callback.on_start("JobSearch", search_url)
         
-        # Navigate to search results
-        await self.navigate_and_wait(search_url)
-        await self.callback.on_progress("Navigated to search results", 20)
-        
-        # Wait for job listings to load
-        await self.page.wait_for_selector('.jobs-search__results-list', timeout=10000)
-        await self.wait_and_focus(1)
-        
-        # Scroll to load more results
-        await self.scroll_page_to_bottom(pause_time=1, max_scrolls=3)
-        await self.callback.on_progress("Loaded job listings", 50)
-        
-        # Extract job URLs
-        job_urls = await self._extract_job_urls(limit)
-        await self.callback.on_progress(f"Found {len(job_urls)} job URLs", 90)
-        
-        await self.callback.on_progress("Search complete", 100)
-        await self.callback.on_complete("JobSearch", job_urls)
-        
-        logger.info(f"Job search complete: found {len(job_urls)} jobs")
-        return job_urls
+        try:
+            # Navigate to search results
+            await self.navigate_and_wait(search_url, page_type="job_search")
+            await self.callback.on_progress("Navigated to search results", 20)
+            
+            # Wait for job listings to load
+            await self.wait_for_content('.jobs-search__results-list', "job_search.content")
+            await self.wait_until_ready("job_search")
+            
+            # Scroll until enough results are loaded or the list stops growing
+            await self.load_all_items('.jobs-search__results-list > li', max_items=limit)
+            await self.callback.on_progress("Loaded job listings", 50)
+            
+            # Extract job URLs
+            job_urls = await self._extract_job_urls(limit)
+            await self.callback.on_progress(f"Found {len(job_urls)} job URLs", 90)
+            
+            await self.callback.on_progress("Search complete", 100)
+            await self.callback.on_complete("JobSearch", job_urls)
+            
+            logger.info(f"Job search complete: found {len(job_urls)} jobs")
+            return job_urls
+        finally:
+            # Hand back a spare page from a won hedge
+            await self.release_hedge_page()
     
     def _build_search_url(
         self,
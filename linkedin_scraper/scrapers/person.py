@@ -6,9 +6,11 @@ from urllib.parse import urljoin
 from playwright.async_api import Page
 
 from .base import BaseScraper
+from ..core.hedging import HedgePolicy
 from ..models import Person, Experience, Education, Accomplishment
 from ..callbacks import ProgressCallback, SilentCallback
-from ..core.exceptions import ScrapingError
+from ..core.deadline import Deadline
+from ..core.exceptions import DeadlineExceededError, ProfileNotFoundError, RateLimitError, ScrapingError, SessionExpiredError
 
 logger = logging.getLogger(__name__)
 
@@ -16,43 +18,64 @@ logger = logging.getLogger(__name__)
 class PersonScraper(BaseScraper):
     """Async scraper for LinkedIn person profiles."""
     
-    def __init__(self, page: Page, callback: Optional[ProgressCallback] = None):
+    def __init__(
+        self,
+        page: Page,
+        callback: Optional[ProgressCallback] = None,
+        soft_navigation: bool = False,
+        hedge: Optional[HedgePolicy] = None
+    ):
         """
         Initialize person scraper.
         
         Args:
             page: Playwright page object
             callback: Progress callback
+            soft_navigation: Use in-app navigation between pages (see BaseScraper)
+            hedge: Hedge slow page loads on a spare page (see BaseScraper)
         """
-        super().__init__(page, callback)
+        super().__init__(page, callback, soft_navigation, hedge)
     
-    async def scrape(self, linkedin_url: str) -> Person:
+    async def scrape(self, linkedin_url: str, deadline: Optional[Deadline] = None) -> Person:
         """
         Scrape a LinkedIn person profile.
         
+        With a deadline, every navigation, wait and probe is clamped to the
+        remaining budget. When it runs out, the sections scraped so far are
+        returned with ``incomplete=True`` instead of an error.
+        
         Args:
             linkedin_url: LinkedIn profile URL
+            deadline: Time budget for the whole scrape (default: none)
             
         Returns:
             Person object with all scraped data
             
         Raises:
             AuthenticationError: If not logged in
+            SessionExpiredError: If the session expired (redirected to login)
+            RateLimitError: If LinkedIn throttled the session
+            ProfileNotFoundError: If the profile doesn't exist or is unavailable
             ScrapingError: If scraping fails
         """
         await self.callback.on_start("person", linkedin_url)
+        self.deadline = deadline or Deadline()
+        
+        # Filled in as sections are scraped, so a spent budget can return them
+        name, location, about, open_to_work = None, None, None, False
+        experiences, educations = [], []
         
         try:
             # Navigate to profile first (this loads the page with our session)
-            await self.navigate_and_wait(linkedin_url)
+            await self.navigate_and_wait(linkedin_url, page_type="profile")
             await self.callback.on_progress("Navigated to profile", 10)
             
             # Now check if logged in
             await self.ensure_logged_in()
             
             # Wait for main content
-            await self.page.wait_for_selector('main', timeout=10000)
-            await self.wait_and_focus(1)
+            await self.wait_for_content('main', "profile.content")
+            await self.wait_until_ready("profile")
             
             # Get name and location
             name, location = await self._get_name_and_location()
@@ -77,7 +100,7 @@ class PersonScraper(BaseScraper):
             educations = await self._get_educations(linkedin_url)
             await self.callback.on_progress(f"Got {len(educations)} educations", 80)
             
-            # Build Person model
+            # Build Person model (incomplete if the budget cut a section short)
             person = Person(
                 linkedin_url=linkedin_url,
                 name=name,
@@ -86,6 +109,7 @@ class PersonScraper(BaseScraper):
                 open_to_work=open_to_work,
                 experiences=experiences,
                 educations=educations,
+                incomplete=self.deadline.cut_short,
             )
             
             await self.callback.on_progress("Scraping complete", 100)
@@ -93,9 +117,37 @@ class PersonScraper(BaseScraper):
             
             return person
             
+        except DeadlineExceededError as e:
+            # Out of time: return what was scraped so far
+            logger.warning(f"{e}; returning partial profile for {linkedin_url}")
+            person = Person(
+                linkedin_url=linkedin_url,
+                name=name,
+                location=location,
+                about=about,
+                open_to_work=open_to_work,
+                experiences=experiences,
+                educations=educations,
+                incomplete=True,
+            )
+            await self.callback.on_complete("person", person)
+            return person
+        except (SessionExpiredError, RateLimitError) as e:
+            # Not a problem with this profile: the caller can refresh the session (or wait) and retry
+            await self.callback.on_error(e)
+            raise
+        except ProfileNotFoundError as e:
+            # Dead, private or unavailable profile: nothing to retry
+            await self.callback.on_error(e)
+            raise
         except Exception as e:
             await self.callback.on_error(e)
             raise ScrapingError(f"Failed to scrape person profile: {e}")
+        finally:
+            self.cancel_prefetch()
+            self.reset_default_timeout()
+            # Hand back a spare page from a won hedge
+            await self.release_hedge_page()
     
     async def _get_name_and_location(self) -> tuple[str, Optional[str]]:
         """Extract name and location from profile."""
@@ -153,24 +205,25 @@ class PersonScraper(BaseScraper):
         try:
             # Navigate to experience detail page
             exp_url = urljoin(base_url, "details/experience")
-            await self.navigate_and_wait(exp_url)
+            await self.navigate_and_wait(exp_url, page_type="experience")
             
             # Wait for content
-            await self.page.wait_for_selector('main', timeout=10000)
-            await self.wait_and_focus(1)
+            await self.wait_for_content('main', "experience.content")
+            await self.wait_until_ready("details")
             
-            # Scroll to load all content
-            await self.scroll_page_to_half()
-            await self.scroll_page_to_bottom(pause_time=0.5, max_scrolls=5)
+            # Scroll until the list stops growing
+            await self.load_all_items('main .pvs-list__paged-list-item', idle_ms=500)
             
             # Find the main list
+            await self.wait_for_content('.pvs-list__container', "experience.list")
             main_list = self.page.locator('.pvs-list__container').first
-            await main_list.wait_for(timeout=10000)
             
             # Get all experience items
             items = await main_list.locator('.pvs-list__paged-list-item').all()
             
             for item in items:
+                if not self.bound_default_timeout():
+                    break
                 try:
                     # _parse_experience_item can return a single Experience or a list
                     result = await self._parse_experience_item(item)
@@ -183,6 +236,9 @@ class PersonScraper(BaseScraper):
                     logger.debug(f"Error parsing experience item: {e}")
                     continue
             
+        except (SessionExpiredError, RateLimitError):
+            # Not a missing section: the whole row has to be retried
+            raise
         except Exception as e:
             logger.warning(f"Error getting experiences: {e}. The experience section may not be available or the page structure has changed.")
         
@@ -316,6 +372,8 @@ class PersonScraper(BaseScraper):
             nested_items = await nested_container.locator('.pvs-list__paged-list-item').all()
             
             for nested_item in nested_items:
+                if not self.bound_default_timeout():
+                    break
                 try:
                     # Each nested item has a link with position details
                     link = nested_item.locator('a').first
@@ -423,24 +481,25 @@ class PersonScraper(BaseScraper):
         try:
             # Navigate to education detail page
             edu_url = urljoin(base_url, "details/education")
-            await self.navigate_and_wait(edu_url)
+            await self.navigate_and_wait(edu_url, page_type="education")
             
             # Wait for content
-            await self.page.wait_for_selector('main', timeout=10000)
-            await self.wait_and_focus(1)
+            await self.wait_for_content('main', "education.content")
+            await self.wait_until_ready("details")
             
-            # Scroll to load all content
-            await self.scroll_page_to_half()
-            await self.scroll_page_to_bottom(pause_time=0.5, max_scrolls=5)
+            # Scroll until the list stops growing
+            await self.load_all_items('main .pvs-list__paged-list-item', idle_ms=500)
             
             # Find the main list
+            await self.wait_for_content('.pvs-list__container', "education.list")
             main_list = self.page.locator('.pvs-list__container').first
-            await main_list.wait_for(timeout=10000)
             
             # Get all education items
             items = await main_list.locator('.pvs-list__paged-list-item').all()
             
             for item in items:
+                if not self.bound_default_timeout():
+                    break
                 try:
                     edu = await self._parse_education_item(item)
                     if edu:
@@ -449,6 +508,9 @@ class PersonScraper(BaseScraper):
                     logger.debug(f"Error parsing education item: {e}")
                     continue
             
+        except (SessionExpiredError, RateLimitError):
+            # Not a missing section: the whole row has to be retried
+            raise
         except Exception as e:
             logger.warning(f"Error getting educations: {e}. The education section may not be publicly visible or the page structure has changed.")
         
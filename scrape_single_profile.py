@@ -5,8 +5,9 @@ Example: Scrape a single LinkedIn profile
 This example shows how to use the PersonScraper to scrape a LinkedIn profile.
 """
 import asyncio
+import os
 from linkedin_scraper.scrapers.person import PersonScraper
-from linkedin_scraper.core.browser import BrowserManager
+from linkedin_scraper.core.browser import BrowserManager, BROWSER_ENDPOINT_ENV
 
 
 async def main():
@@ -14,7 +15,8 @@ async def main():
     profile_url = "https://www.linkedin.com/in/williamhgates/"
     
     # Initialize and start browser using context manager
-    async with BrowserManager(headless=False) as browser:
+    # (attaches to browser_server.py instead if LINKEDIN_BROWSER_ENDPOINT is set)
+    async with BrowserManager(headless=False, endpoint=os.environ.get(BROWSER_ENDPOINT_ENV)) as browser:
         # Load existing session (must be created first - see README for setup)
         await browser.load_session("linkedin_session.json")
         print("✓ Session loaded")
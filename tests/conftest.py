@@ -0,0 +1,44 @@
+"""Shared fixtures: the offline LinkedIn stand-in and a Chromium availability check."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent.parent / "benchmarks"
+
+
+def _chromium_available() -> bool:
+    from playwright.async_api import async_playwright
+
+    async def launch() -> None:
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch()
+            await browser.close()
+
+    try:
+        asyncio.run(launch())
+    except Exception:
+        return False
+    return True
+
+
+@pytest.fixture(scope="session")
+def chromium():
+    """Skip the test unless Chromium can be launched (``playwright install chromium``)."""
+    if not _chromium_available():
+        pytest.skip("Chromium is not installed")
+
+
+@pytest.fixture
+def standin():
+    """Offline LinkedIn stand-in server (see benchmarks/standin.py)."""
+    sys.path.insert(0, str(BENCHMARKS_DIR))
+    try:
+        from standin import StandinServer
+    finally:
+        sys.path.remove(str(BENCHMARKS_DIR))
+
+    with StandinServer() as server:
+        yield server
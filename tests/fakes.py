@@ -0,0 +1,109 @@
+"""Minimal stand-ins for Playwright pages and contexts, for tests that don't need a browser."""
+
+import asyncio
+from typing import Any, Callable, Dict, List, Optional
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+
+class FakeContext:
+    """Browser context that hands out FakePages and records cookie changes."""
+
+    def __init__(self, storage_state: Optional[Dict[str, Any]] = None):
+        self.storage_state = storage_state
+        self.pages: List["FakePage"] = []
+        self.cookies: List[Dict[str, Any]] = []
+        self.closed = False
+        self._listeners: Dict[str, List[Callable[[Any], None]]] = {}
+
+    async def new_page(self) -> "FakePage":
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    async def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            for handler in list(self._listeners.get("close", [])):
+                handler(self)
+
+    def on(self, event: str, handler: Callable[[Any], None]) -> None:
+        self._listeners.setdefault(event, []).append(handler)
+
+    async def clear_cookies(self) -> None:
+        self.cookies = []
+
+    async def add_cookies(self, cookies: List[Dict[str, Any]]) -> None:
+        self.cookies.extend(cookies)
+
+
+class FakePage:
+    """
+    Page with scriptable navigation and element lookups.
+
+    ``load_ms`` maps a URL to how long goto() takes on this page; a load
+    longer than its timeout raises PlaywrightTimeoutError like Playwright.
+    ``redirects`` maps a URL to where its navigation ends up.
+    ``elements`` maps a selector to the dict an in-page probe returns.
+    """
+
+    def __init__(self, context: Optional[FakeContext] = None, url: str = "about:blank"):
+        self.context = context or FakeContext()
+        self.url = url
+        self.closed = False
+        self.load_ms: Dict[str, float] = {}
+        self.redirects: Dict[str, str] = {}
+        self.gotos: List[str] = []
+        self.elements: Dict[str, Dict[str, Optional[str]]] = {}
+        self.evaluate_handler: Optional[Callable[..., Any]] = None
+        self.evaluations = 0
+        self.selector_waits = 0
+        self.default_timeout: Optional[float] = None
+        self._listeners: Dict[str, List[Callable[[Any], None]]] = {}
+
+    async def goto(self, url: str, wait_until: Optional[str] = None, timeout: Optional[float] = None) -> None:
+        self.gotos.append(url)
+        delay = self.load_ms.get(url, 0)
+        if timeout and delay > timeout:
+            await asyncio.sleep(timeout / 1000)
+            raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded loading {url}")
+        await asyncio.sleep(delay / 1000)
+        self.url = self.redirects.get(url, url)
+        return None
+
+    async def evaluate(self, expression: str, arg: Any = None) -> Any:
+        self.evaluations += 1
+        if self.evaluate_handler:
+            return self.evaluate_handler(expression, arg)
+        selector = arg[0]
+        return self.elements.get(selector)
+
+    async def wait_for_selector(self, selector: str, timeout: float = 30000, state: str = "visible") -> None:
+        self.selector_waits += 1
+        if selector not in self.elements:
+            await asyncio.sleep(timeout / 1000)
+            raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded waiting for {selector}")
+
+    def set_default_timeout(self, timeout: float) -> None:
+        self.default_timeout = timeout
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self.emit("close")
+
+    def on(self, event: str, handler: Callable[[Any], None]) -> None:
+        self._listeners.setdefault(event, []).append(handler)
+
+    def remove_listener(self, event: str, handler: Callable[[Any], None]) -> None:
+        self._listeners[event].remove(handler)
+
+    def listener_count(self) -> int:
+        return sum(len(handlers) for handlers in self._listeners.values())
+
+    def emit(self, event: str, payload: Any = None) -> None:
+        for handler in list(self._listeners.get(event, [])):
+            handler(payload)
@@ -0,0 +1,219 @@
+"""Tests for AssetCache."""
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from linkedin_scraper.core.asset_cache import AssetCache, _FileLock
+
+BUNDLE_URL = "https://static.licdn.com/aero-v1/sc/h/3k9wl0xyz1abcdef"
+
+
+class FakeRequest:
+    def __init__(self, url: str, resource_type: str = "script", method: str = "GET"):
+        self.url = url
+        self.resource_type = resource_type
+        self.method = method
+
+
+class FakeResponse:
+    def __init__(self, body: bytes, status: int = 200):
+        self.status = status
+        self.headers = {"content-type": "text/javascript", "set-cookie": "x=1"}
+        self._body = body
+
+    async def body(self) -> bytes:
+        return self._body
+
+
+class FakeRoute:
+    def __init__(self, body: bytes = b"console.log(1)", fail: str = None):
+        self.body = body
+        self.fail = fail
+        self.fetches = 0
+        self.outcome = None
+        self.fulfilled = None
+
+    async def fetch(self) -> FakeResponse:
+        self.fetches += 1
+        if self.fail == "fetch":
+            raise RuntimeError("net::ERR_CONNECTION_RESET")
+        return FakeResponse(self.body)
+
+    async def fulfill(self, **kwargs) -> None:
+        if self.fail == "fulfill":
+            raise RuntimeError("Route is already handled")
+        self.outcome = "fulfilled"
+        self.fulfilled = kwargs
+
+    async def fallback(self) -> None:
+        self.outcome = "fallback"
+
+
+@pytest.mark.parametrize("url", [
+    "https://static.licdn.com/aero-v1/sc/h/3k9wl0xyz1abcdef",
+    "https://example.com/assets/app.8c1f2e7a.js",
+    "https://example.com/assets/main-3f9a0c1b2d.css?v=2",
+    "https://example.com/fonts/inter_0a1b2c3d4e.woff2",
+])
+def test_hashed_urls_are_cacheable(url):
+    assert AssetCache.is_cacheable_url(url)
+
+
+@pytest.mark.parametrize("url", [
+    "https://example.com/assets/app.js",
+    "https://www.linkedin.com/in/someone/",
+    "https://example.com/voyager/api/me",
+    "https://example.com/assets/app.8c1f.js",
+])
+def test_unhashed_urls_are_not_cacheable(url):
+    assert not AssetCache.is_cacheable_url(url)
+
+
+def test_put_then_get_round_trips_body_and_headers(tmp_path):
+    cache = AssetCache(str(tmp_path))
+    cache.put(BUNDLE_URL, b"body", {"content-type": "text/css"})
+    assert cache.get(BUNDLE_URL) == (b"body", {"content-type": "text/css"})
+    assert cache.get(BUNDLE_URL + "0") is None
+
+
+def test_identical_bodies_are_stored_once(tmp_path):
+    cache = AssetCache(str(tmp_path))
+    cache.put("https://a.example.com/app.8c1f2e7a.js", b"same", {})
+    cache.put("https://b.example.com/app.8c1f2e7a.js", b"same", {})
+    assert len(list((tmp_path / "index").glob("*.json"))) == 2
+    assert len(list((tmp_path / "objects").glob("*/*"))) == 1
+    assert cache.stats["size_bytes"] == 4
+
+
+def test_index_survives_a_new_instance(tmp_path):
+    AssetCache(str(tmp_path)).put(BUNDLE_URL, b"0123456789", {})
+    reopened = AssetCache(str(tmp_path))
+    assert reopened.stats["size_bytes"] == 10
+    assert reopened.get(BUNDLE_URL)[0] == b"0123456789"
+
+
+def test_index_entry_pointing_at_an_evicted_object_is_a_miss(tmp_path):
+    cache = AssetCache(str(tmp_path))
+    cache.put(BUNDLE_URL, b"body", {})
+    for path in (tmp_path / "objects").glob("*/*"):
+        path.unlink()
+    assert cache.get(BUNDLE_URL) is None
+
+
+def test_eviction_removes_least_recently_used_first(tmp_path):
+    cache = AssetCache(str(tmp_path), max_bytes=250)
+    urls = [f"https://example.com/app.{i:08x}.js" for i in range(3)]
+    for age, url in enumerate(urls):
+        cache.put(url, url.encode() * 2, {})
+        # Spread mtimes so LRU order doesn't depend on filesystem resolution
+        for path in (tmp_path / "objects").glob("*/*"):
+            if path.read_bytes() == url.encode() * 2:
+                os.utime(path, (1000 + age, 1000 + age))
+
+    # Reading the oldest entry makes it the most recently used
+    assert cache.get(urls[0]) is not None
+    cache.put("https://example.com/app.ffffffff.js", b"x" * 150, {})
+
+    assert cache.evicted == 2
+    assert cache.get(urls[0]) is not None
+    assert cache.get(urls[1]) is None
+    assert cache.get(urls[2]) is None
+    assert cache.stats["size_bytes"] <= 250 * 0.9
+    # The evicted URLs leave no index entries behind
+    assert len(list((tmp_path / "index").glob("*.json"))) == 2
+
+
+def test_evict_waits_for_the_lock(tmp_path):
+    cache = AssetCache(str(tmp_path), max_bytes=1)
+    cache._objects.joinpath("ab").mkdir()
+    cache._objects.joinpath("ab", "ab12").write_bytes(b"data")
+
+    acquired = threading.Event()
+    release = threading.Event()
+
+    def hold_lock():
+        with _FileLock(cache._lock_path):
+            acquired.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    acquired.wait(5)
+
+    evictor = threading.Thread(target=cache.evict)
+    evictor.start()
+    time.sleep(0.1)
+    assert evictor.is_alive()
+    assert cache._objects.joinpath("ab", "ab12").exists()
+
+    release.set()
+    evictor.join(5)
+    holder.join(5)
+    assert not cache._objects.joinpath("ab", "ab12").exists()
+
+
+def test_concurrent_puts_of_the_same_asset_leave_one_readable_object(tmp_path):
+    body = os.urandom(64 * 1024)
+    caches = [AssetCache(str(tmp_path)) for _ in range(8)]
+    threads = [threading.Thread(target=cache.put, args=(BUNDLE_URL, body, {})) for cache in caches]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(list((tmp_path / "objects").glob("*/*"))) == 1
+    assert not list(tmp_path.rglob(".tmp-*"))
+    assert AssetCache(str(tmp_path)).get(BUNDLE_URL)[0] == body
+
+
+def test_handler_fetches_once_then_serves_from_disk(tmp_path):
+    cache = AssetCache(str(tmp_path))
+
+    async def scenario():
+        miss, hit = FakeRoute(), FakeRoute()
+        await cache._handle(miss, FakeRequest(BUNDLE_URL))
+        await cache._handle(hit, FakeRequest(BUNDLE_URL))
+        return miss, hit
+
+    miss, hit = asyncio.run(scenario())
+    assert miss.fetches == 1 and miss.outcome == "fulfilled"
+    assert hit.fetches == 0
+    assert hit.fulfilled["body"] == b"console.log(1)"
+    # Only the replayable headers are stored
+    assert hit.fulfilled["headers"] == {"content-type": "text/javascript"}
+    assert cache.stats["hits"] == 1 and cache.stats["misses"] == 1
+    assert cache.hit_rate == 0.5
+
+
+@pytest.mark.parametrize("request_", [
+    FakeRequest("https://example.com/app.js"),
+    FakeRequest(BUNDLE_URL, resource_type="image"),
+    FakeRequest(BUNDLE_URL, method="POST"),
+])
+def test_handler_falls_back_for_uncacheable_requests(tmp_path, request_):
+    cache = AssetCache(str(tmp_path))
+    route = FakeRoute()
+    asyncio.run(cache._handle(route, request_))
+    assert route.outcome == "fallback"
+    assert route.fetches == 0
+
+
+@pytest.mark.parametrize("fail", ["fetch", "fulfill"])
+def test_handler_falls_back_when_the_miss_path_fails(tmp_path, fail):
+    cache = AssetCache(str(tmp_path))
+    route = FakeRoute(fail=fail)
+    asyncio.run(cache._handle(route, FakeRequest(BUNDLE_URL)))
+    assert route.outcome == "fallback"
+
+
+def test_handler_falls_back_when_serving_a_hit_fails(tmp_path):
+    cache = AssetCache(str(tmp_path))
+    cache.put(BUNDLE_URL, b"body", {})
+    route = FakeRoute(fail="fulfill")
+    asyncio.run(cache._handle(route, FakeRequest(BUNDLE_URL)))
+    assert route.outcome == "fallback"
+    assert cache.stats["hits"] == 0
@@ -0,0 +1,109 @@
+"""Tests for the per-context authentication state cache."""
+
+import asyncio
+
+import pytest
+
+from linkedin_scraper.core import auth
+from linkedin_scraper.core.auth import AuthState, get_auth_state, is_auth_redirect, is_login_redirect
+from linkedin_scraper.core.exceptions import AuthenticationError
+from linkedin_scraper.scrapers.base import BaseScraper
+
+from tests.fakes import FakeContext, FakePage
+
+
+class NavPage(FakePage):
+    """FakePage whose logged-in nav bar can be shown or hidden."""
+
+    def __init__(self, context: FakeContext, logged_in: bool = True):
+        super().__init__(context, url="https://www.linkedin.com/in/someone/")
+        self.logged_in = logged_in
+        self.nav_checks = 0
+
+    def locator(self, selector: str) -> "NavPage":
+        return self
+
+    async def count(self) -> int:
+        self.nav_checks += 1
+        return 1 if self.logged_in else 0
+
+
+@pytest.mark.parametrize("url, auth_redirect, login_redirect", [
+    ("https://www.linkedin.com/login?session_redirect=x", True, True),
+    ("https://www.linkedin.com/authwall?trk=1", True, True),
+    ("https://www.linkedin.com/checkpoint/challenge/abc", True, False),
+    ("https://www.linkedin.com/in/someone/", False, False),
+    ("https://www.linkedin.com/in/login-expert/", False, False),
+    ("https://example.com/login", False, False),
+])
+def test_redirect_classification(url, auth_redirect, login_redirect):
+    assert is_auth_redirect(url) is auth_redirect
+    assert is_login_redirect(url) is login_redirect
+
+
+def test_state_is_fresh_until_the_ttl_passes(monkeypatch):
+    now = {"t": 1000.0}
+    monkeypatch.setattr(auth.time, "monotonic", lambda: now["t"])
+
+    state = AuthState(ttl=60)
+    assert not state.is_fresh
+    state.mark_verified()
+    now["t"] += 59
+    assert state.is_fresh
+    now["t"] += 1
+    assert not state.is_fresh
+
+
+def test_auth_redirect_invalidates_the_state():
+    state = AuthState()
+    state.mark_verified()
+    assert state.observe_url("https://www.linkedin.com/in/someone/")
+    assert state.is_fresh
+
+    assert not state.observe_url("https://www.linkedin.com/checkpoint/challenge/abc")
+    assert not state.is_fresh
+    assert state.invalidations == 1
+
+    # Invalidating an unverified state is not counted again
+    state.invalidate("again")
+    assert state.invalidations == 1
+
+
+def test_state_is_shared_per_context():
+    first, second = FakeContext(), FakeContext()
+    assert get_auth_state(first) is get_auth_state(first)
+    assert get_auth_state(first) is not get_auth_state(second)
+
+    assert get_auth_state(first, ttl=5).ttl == 5
+    assert get_auth_state(first).ttl == 5
+
+
+def test_ensure_logged_in_checks_the_page_once_per_context():
+    context = FakeContext()
+    pages = [NavPage(context), NavPage(context)]
+
+    async def scenario():
+        for page in pages:
+            await BaseScraper(page).ensure_logged_in()
+            await BaseScraper(page).ensure_logged_in()
+
+    asyncio.run(scenario())
+    state = get_auth_state(context)
+    assert sum(page.nav_checks for page in pages) == 1
+    assert state.checks == 1
+    assert state.skipped == 3
+
+
+def test_ensure_logged_in_rechecks_after_invalidation():
+    context = FakeContext()
+    page = NavPage(context)
+
+    async def scenario():
+        await BaseScraper(page).ensure_logged_in()
+        get_auth_state(context).observe_url("https://www.linkedin.com/authwall")
+        page.logged_in = False
+        await BaseScraper(page).ensure_logged_in()
+
+    with pytest.raises(AuthenticationError):
+        asyncio.run(scenario())
+    assert page.nav_checks == 2
@@ -0,0 +1,115 @@
+"""Tests for Deadline and its use in BaseScraper."""
+
+import asyncio
+
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from linkedin_scraper.core.deadline import Deadline
+from linkedin_scraper.core.exceptions import DeadlineExceededError
+from linkedin_scraper.core.latency import LatencyTracker
+from linkedin_scraper.scrapers import base
+from linkedin_scraper.scrapers.base import DEFAULT_ACTION_TIMEOUT, BaseScraper
+
+from tests.fakes import FakePage
+
+URL = "https://www.linkedin.com/in/someone/"
+
+
+@pytest.fixture(autouse=True)
+def fresh_latency_tracker(monkeypatch):
+    monkeypatch.setattr(base, "latency_tracker", LatencyTracker())
+
+
+def _scraper(budget, load_ms: float = 0) -> BaseScraper:
+    page = FakePage()
+    page.load_ms = {URL: load_ms}
+    # Nothing blocked or unavailable on the page after the load
+    page.evaluate_handler = lambda expression, arg: {"blocked": None, "unavailable": None}
+    scraper = BaseScraper(page)
+    scraper.deadline = Deadline(budget)
+    return scraper
+
+
+def test_deadline_without_budget_never_expires():
+    deadline = Deadline()
+    assert deadline.remaining_ms() is None
+    assert not deadline.expired
+    assert deadline.clamp(60000) == 60000
+    deadline.check()
+
+
+def test_clamp_limits_timeouts_to_the_time_left():
+    deadline = Deadline(2)
+    assert deadline.clamp(500) == 500
+    assert 1900 < deadline.clamp(60000) <= 2000
+
+
+def test_check_raises_once_the_budget_is_spent():
+    deadline = Deadline(0)
+    assert deadline.expired
+    assert deadline.clamp(60000) == 0
+    with pytest.raises(DeadlineExceededError, match="before experience"):
+        deadline.check("experience")
+    assert deadline.cut_short
+
+
+def test_expiring_is_not_the_same_as_cutting_short():
+    deadline = Deadline(0)
+    assert deadline.expired
+    assert not deadline.cut_short
+    deadline.mark_cut_short("scrolling")
+    assert deadline.cut_short
+
+
+def test_navigation_cut_by_the_budget_raises_deadline_exceeded():
+    scraper = _scraper(0.05, load_ms=5000)
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(scraper.navigate_and_wait(URL, page_type="profile"))
+    assert scraper.deadline.cut_short
+    # A load the budget cut short is not a timeout of the page type
+    assert base.latency_tracker._timeouts == {}
+
+
+def test_own_timeout_inside_the_budget_stays_a_timeout():
+    scraper = _scraper(60, load_ms=200)
+    with pytest.raises(PlaywrightTimeoutError) as error:
+        asyncio.run(scraper.navigate_and_wait(URL, timeout=20, page_type="profile"))
+    assert not isinstance(error.value, DeadlineExceededError)
+    assert not scraper.deadline.cut_short
+
+
+def test_navigation_bounds_the_default_timeout_until_reset():
+    scraper = _scraper(5)
+    asyncio.run(scraper.navigate_and_wait(URL, page_type="profile"))
+    assert scraper.page.default_timeout <= 5000
+
+    scraper.reset_default_timeout()
+    assert scraper.page.default_timeout == DEFAULT_ACTION_TIMEOUT
+
+
+def test_bound_default_timeout_stops_parse_loops_after_the_deadline():
+    scraper = _scraper(0)
+    assert not scraper.bound_default_timeout()
+    assert scraper.deadline.cut_short
+    assert _scraper(None).bound_default_timeout()
+
+
+def test_content_wait_shortened_by_the_budget_raises_deadline_exceeded():
+    scraper = _scraper(0.05)
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(scraper.wait_for_content("main h1", "profile.content", timeout=5000))
+    assert scraper.deadline.cut_short
+
+
+def test_probe_shortened_by_the_budget_marks_the_scrape_cut_short():
+    scraper = BaseScraper(FakePage())
+    scraper.deadline = Deadline(0.05)
+    assert asyncio.run(scraper.probe(".pv-about", timeout=5000)) is None
+    assert scraper.deadline.cut_short
+
+    # An instant probe for an absent element cuts nothing short
+    scraper = BaseScraper(FakePage())
+    scraper.deadline = Deadline(60)
+    assert asyncio.run(scraper.probe(".pv-about")) is None
+    assert not scraper.deadline.cut_short
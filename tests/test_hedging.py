@@ -0,0 +1,155 @@
+"""Tests for HedgePolicy."""
+
+import asyncio
+
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from linkedin_scraper.core.hedging import HedgePolicy
+from linkedin_scraper.core.latency import LatencyTracker
+
+from tests.fakes import FakeContext, FakePage
+
+URL = "https://www.linkedin.com/in/someone/"
+
+
+def _policy(**kwargs) -> HedgePolicy:
+    """Policy whose p95 for "profile" is 50ms, with spares that load instantly."""
+    tracker = LatencyTracker(min_samples=5)
+    for _ in range(100):
+        tracker.record("profile", 50)
+    return HedgePolicy(tracker=tracker, min_delay_ms=10, **kwargs)
+
+
+def _slow_page(context: FakeContext, load_ms: float = 300) -> FakePage:
+    page = FakePage(context)
+    page.load_ms = {URL: load_ms}
+    return page
+
+
+def test_no_hedging_until_the_page_type_has_samples():
+    policy = HedgePolicy(tracker=LatencyTracker(min_samples=5), budget=1.0)
+    page = _slow_page(FakeContext(), 50)
+
+    result_page, _ = asyncio.run(policy.goto(page, URL, "profile"))
+    assert result_page is page
+    assert policy.delay_ms("profile") is None
+    assert policy.stats["hedges"] == 0
+
+
+def test_fast_load_is_not_hedged():
+    policy = _policy(budget=1.0)
+    page = FakePage(FakeContext())
+
+    result_page, _ = asyncio.run(policy.goto(page, URL, "profile"))
+    assert result_page is page
+    assert policy.stats["hedges"] == 0
+    assert policy.tracker.percentiles("profile")["count"] == 101
+
+
+def test_hedge_wins_on_a_stalled_load():
+    policy = _policy(budget=1.0)
+    context = FakeContext()
+    page = _slow_page(context, 5000)
+
+    async def scenario():
+        result_page, _ = await policy.goto(page, URL, "profile", timeout=10000)
+        loaded_url = result_page.url
+        await policy.release(result_page)
+        return result_page, loaded_url
+
+    result_page, loaded_url = asyncio.run(scenario())
+    assert result_page is not page
+    assert loaded_url == URL
+    # The losing load was stopped
+    assert page.gotos[-1] == "about:blank"
+    assert policy.stats["wins"] == 1
+    assert policy.stats["hedges"] == 1
+
+
+def test_won_hedge_records_its_own_load_time():
+    policy = _policy(budget=1.0)
+    context = FakeContext()
+    page = _slow_page(context, 5000)
+
+    async def scenario():
+        result_page, _ = await policy.goto(page, URL, "profile", timeout=10000)
+        await policy.release(result_page)
+
+    asyncio.run(scenario())
+    # The spare loads instantly; the abandoned load's ~50ms is not recorded
+    assert policy.tracker._samples["profile"][-1] < 20
+
+
+def test_hedges_stay_within_the_budget():
+    policy = _policy(budget=0.5)
+    context = FakeContext()
+
+    async def scenario():
+        for _ in range(4):
+            result_page, _ = await policy.goto(_slow_page(context), URL, "profile")
+            await policy.release(result_page)
+
+    asyncio.run(scenario())
+    stats = policy.stats
+    assert stats["hedges"] == 2
+    assert stats["over_budget"] == 2
+    assert stats["hedge_ratio"] == 0.5
+
+
+def test_no_hedge_while_every_spare_is_busy():
+    policy = _policy(budget=1.0, spare_pages=1)
+    context = FakeContext()
+
+    async def scenario():
+        # The winning spare is kept, so there is none left for the next hedge
+        first, _ = await policy.goto(_slow_page(context), URL, "profile")
+        page = _slow_page(context)
+        second, _ = await policy.goto(page, URL, "profile")
+        return page, second
+
+    page, second = asyncio.run(scenario())
+    assert second is page
+    assert policy.stats["no_spare"] == 1
+    assert policy.stats["hedges"] == 1
+
+
+@pytest.mark.parametrize("record_timeout, expected", [(True, 1), (False, 0)])
+def test_timeouts_are_counted_only_when_asked(record_timeout, expected):
+    policy = HedgePolicy(tracker=LatencyTracker(), budget=1.0)
+    page = _slow_page(FakeContext(), 500)
+
+    with pytest.raises(PlaywrightTimeoutError):
+        asyncio.run(policy.goto(page, URL, "profile", timeout=20, record_timeout=record_timeout))
+    assert policy.tracker._timeouts.get("profile", 0) == expected
+    assert policy.tracker.percentiles("profile") is None
+
+
+def test_close_closes_the_spare_pages():
+    policy = _policy(budget=1.0)
+    context = FakeContext()
+
+    async def scenario():
+        result_page, _ = await policy.goto(_slow_page(context), URL, "profile")
+        await policy.release(result_page)
+        await policy.close()
+        return result_page
+
+    spare = asyncio.run(scenario())
+    assert spare.closed
+    assert policy._spares.get(context) is None
+
+
+def test_closed_context_drops_its_spare_pages():
+    policy = _policy(budget=1.0)
+    context = FakeContext()
+
+    async def scenario():
+        result_page, _ = await policy.goto(_slow_page(context), URL, "profile")
+        # e.g. BrowserManager.recycle() closing the browser while the spare is leased
+        await context.close()
+        await policy.release(result_page)
+
+    asyncio.run(scenario())
+    assert policy._spares.get(context) is None
+    assert len(policy._leased) == 0
@@ -0,0 +1,117 @@
+"""Tests for LatencyTracker."""
+
+import asyncio
+import json
+import multiprocessing
+
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from linkedin_scraper.core.latency import LatencyTracker
+from linkedin_scraper.scrapers import base
+from linkedin_scraper.scrapers.base import BaseScraper
+
+from tests.fakes import FakePage
+
+
+def _tracker_with(samples, **kwargs) -> LatencyTracker:
+    tracker = LatencyTracker(**kwargs)
+    for sample in samples:
+        tracker.record("profile", sample)
+    return tracker
+
+
+def test_percentiles():
+    tracker = _tracker_with(range(1, 101))
+    assert tracker.percentiles("profile") == {"count": 100, "p50": 51, "p95": 96, "p99": 100}
+    assert tracker.percentiles("company") is None
+
+
+def test_window_keeps_only_recent_samples():
+    tracker = _tracker_with([10000] * 10 + [100] * 5, window=5)
+    assert tracker.percentiles("profile")["p99"] == 100
+
+
+def test_default_until_enough_samples():
+    tracker = _tracker_with([1000] * 19, min_samples=20)
+    assert tracker.timeout_ms("profile", default_ms=60000) == 60000
+    tracker.record("profile", 1000)
+    assert tracker.timeout_ms("profile", default_ms=60000) == 5000
+
+
+def test_derived_timeout_is_p99_with_headroom_between_floor_and_default():
+    tracker = _tracker_with([4000] * 50, headroom=2.0, floor_ms=5000)
+    assert tracker.timeout_ms("profile", default_ms=60000) == 8000
+    # Never above the caller's default, never below the floor
+    assert tracker.timeout_ms("profile", default_ms=6000) == 6000
+    assert tracker.timeout_ms("profile", default_ms=60000, floor_ms=10000) == 10000
+
+
+def test_timeouts_do_not_ratchet_the_timeout_up():
+    tracker = _tracker_with([2000] * 100)
+    before = tracker.timeout_ms("profile", default_ms=60000)
+    for _ in range(50):
+        tracker.record_timeout("profile")
+    assert tracker.timeout_ms("profile", default_ms=60000) == before
+    assert tracker.stats["profile"]["timeouts"] == 50
+
+
+def test_expected_remaining_ms():
+    tracker = _tracker_with([1000, 2000, 3000, 9000])
+    assert tracker.expected_remaining_ms("profile", 2500) == 6000 - 2500
+    assert tracker.expected_remaining_ms("profile", 10000) == 0
+
+
+def _save_repeatedly(path: str, value: int, saves: int) -> None:
+    """One shard: record and save ``saves`` samples of ``value``."""
+    tracker = LatencyTracker()
+    tracker.load(path)
+    for _ in range(saves):
+        tracker.record("profile", value)
+        tracker.save(path)
+
+
+def test_concurrent_saves_from_several_processes_keep_every_sample(tmp_path):
+    path = str(tmp_path / "latency.json")
+    context = multiprocessing.get_context("spawn")
+    shards = [context.Process(target=_save_repeatedly, args=(path, value, 20)) for value in range(6)]
+    for shard in shards:
+        shard.start()
+    for shard in shards:
+        shard.join(60)
+        assert shard.exitcode == 0
+
+    saved = json.loads((tmp_path / "latency.json").read_text())["samples"]["profile"]
+    assert sorted(saved) == sorted(value for value in range(6) for _ in range(20))
+
+    reloaded = LatencyTracker()
+    assert reloaded.load(path)
+    assert reloaded.percentiles("profile")["count"] == 120
+
+
+def test_load_ignores_missing_or_corrupt_state(tmp_path):
+    tracker = LatencyTracker()
+    assert not tracker.load(str(tmp_path / "missing.json"))
+    (tmp_path / "bad.json").write_text("{not json")
+    assert not tracker.load(str(tmp_path / "bad.json"))
+
+
+def test_scraper_records_loads_and_counts_timeouts_separately(monkeypatch):
+    tracker = LatencyTracker(min_samples=1)
+    monkeypatch.setattr(base, "latency_tracker", tracker)
+    page = FakePage()
+    page.load_ms = {"https://www.linkedin.com/in/slow/": 200}
+    # Nothing blocked or unavailable on the page after the load
+    page.evaluate_handler = lambda expression, arg: {"blocked": None, "unavailable": None}
+    scraper = BaseScraper(page)
+
+    async def scenario():
+        await scraper.navigate_and_wait("https://www.linkedin.com/in/fast/", page_type="profile")
+        with pytest.raises(PlaywrightTimeoutError):
+            await scraper.navigate_and_wait("https://www.linkedin.com/in/slow/", timeout=50, page_type="profile")
+
+    asyncio.run(scenario())
+    stats = tracker.stats["profile"]
+    assert stats["count"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["p99"] < 50
@@ -0,0 +1,109 @@
+"""Tests for BrowserManager's deferred (lazy) launch."""
+
+import asyncio
+
+import pytest
+
+from linkedin_scraper.core import browser as browser_module
+from linkedin_scraper.core.browser import BrowserManager
+from linkedin_scraper.core.exceptions import NetworkError
+
+from tests.fakes import FakeContext
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    async def new_context(self, **options) -> FakeContext:
+        context = FakeContext(options.get("storage_state"))
+        self.contexts.append(context)
+        return context
+
+    async def close(self) -> None:
+        for context in self.contexts:
+            await context.close()
+
+
+class FakePlaywright:
+    """Stands in for async_playwright(): counts starts and Chromium launches."""
+
+    def __init__(self, fail_launches: int = 0):
+        self.starts = 0
+        self.launches = 0
+        self.fail_launches = fail_launches
+        self.chromium = self
+
+    def __call__(self) -> "FakePlaywright":
+        return self
+
+    async def start(self) -> "FakePlaywright":
+        self.starts += 1
+        return self
+
+    async def stop(self) -> None:
+        pass
+
+    async def launch(self, **options) -> FakeBrowser:
+        self.launches += 1
+        # Launching takes a moment, so concurrent leases overlap
+        await asyncio.sleep(0.01)
+        if self.launches <= self.fail_launches:
+            raise RuntimeError("Executable doesn't exist")
+        return FakeBrowser()
+
+
+@pytest.fixture
+def playwright(monkeypatch):
+    fake = FakePlaywright()
+    monkeypatch.setattr(browser_module, "async_playwright", fake)
+    return fake
+
+
+def test_lazy_start_defers_the_launch_to_the_first_lease(playwright):
+    async def scenario():
+        async with BrowserManager(lazy=True) as browser:
+            assert not browser.is_launched
+            assert playwright.starts == 0
+
+            async def lease():
+                async with browser.lease_page() as page:
+                    return page
+
+            return await asyncio.gather(*(lease() for _ in range(3)))
+
+    pages = asyncio.run(scenario())
+    # Concurrent first leases share one launch
+    assert playwright.starts == 1
+    assert playwright.launches == 1
+    assert all(page is not None for page in pages)
+
+
+def test_closing_an_unused_lazy_browser_never_launches(playwright):
+    async def scenario():
+        async with BrowserManager(lazy=True):
+            pass
+
+    asyncio.run(scenario())
+    assert playwright.starts == 0
+    assert playwright.launches == 0
+
+
+def test_failed_launch_raises_and_is_retried_on_the_next_lease(playwright):
+    playwright.fail_launches = 1
+
+    async def scenario():
+        async with BrowserManager(lazy=True) as browser:
+            with pytest.raises(NetworkError):
+                await browser.ensure_launched()
+            assert not browser.is_launched
+            await browser.ensure_launched()
+            return browser.is_launched
+
+    assert asyncio.run(scenario())
+    assert playwright.launches == 2
+
+
+def test_ensure_launched_requires_start(playwright):
+    with pytest.raises(RuntimeError, match="not started"):
+        asyncio.run(BrowserManager(lazy=True).ensure_launched())
@@ -0,0 +1,111 @@
+"""Tests for soft navigation."""
+
+import asyncio
+from typing import Any, List, Optional
+
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from linkedin_scraper.core.navigation import can_soft_navigate, soft_navigate
+
+from tests.fakes import FakePage
+
+APP_URL = "https://www.linkedin.com/in/first/"
+NEXT_URL = "https://www.linkedin.com/in/second/"
+
+
+class RouterPage(FakePage):
+    """FakePage whose app shell and client-side router can be switched on and off."""
+
+    def __init__(self, url: str = APP_URL, has_shell: bool = True, renders: bool = True):
+        super().__init__(url=url)
+        self.has_shell = has_shell
+        self.renders = renders
+        self.pushed: List[str] = []
+        self.evaluate_handler = self._evaluate
+
+    def _evaluate(self, expression: str, arg: Any) -> Any:
+        if "pushState" in expression:
+            self.pushed.append(arg[0])
+            return None
+        return self.has_shell
+
+    async def wait_for_function(self, expression: str, arg: Any = None, timeout: Optional[float] = None) -> None:
+        if not self.renders:
+            raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded")
+        self.url = arg[0]
+
+
+@pytest.mark.parametrize("current, target", [
+    ("about:blank", NEXT_URL),
+    (APP_URL, APP_URL),
+    (APP_URL, "https://example.com/in/second/"),
+    ("http://www.linkedin.com/in/first/", NEXT_URL),
+])
+def test_cannot_soft_navigate_off_a_loaded_same_origin_page(current, target):
+    page = RouterPage(url=current)
+    assert not asyncio.run(can_soft_navigate(page, target))
+    assert page.evaluations == 0
+
+
+def test_app_shell_is_required():
+    assert asyncio.run(can_soft_navigate(RouterPage(), NEXT_URL))
+    assert not asyncio.run(can_soft_navigate(RouterPage(has_shell=False), NEXT_URL))
+
+
+def test_soft_navigate_pushes_the_route():
+    page = RouterPage()
+    assert asyncio.run(soft_navigate(page, NEXT_URL))
+    assert page.pushed == [NEXT_URL]
+    assert page.url == NEXT_URL
+    assert page.gotos == []
+
+
+def test_soft_navigate_waits_for_the_ready_selector():
+    page = RouterPage()
+    page.elements = {"main h1": {}}
+    assert asyncio.run(soft_navigate(page, NEXT_URL, ready_selector="main h1"))
+    assert page.selector_waits == 1
+    assert not asyncio.run(soft_navigate(RouterPage(), NEXT_URL, timeout=10, ready_selector="main h1"))
+
+
+def test_soft_navigate_reports_failure_instead_of_raising():
+    assert not asyncio.run(soft_navigate(RouterPage(renders=False), NEXT_URL))
+    assert not asyncio.run(soft_navigate(RouterPage(has_shell=False), NEXT_URL))
+
+    # The router did a full page load and the evaluate context went away
+    page = RouterPage()
+
+    def navigated_away(expression, arg):
+        if "pushState" in expression:
+            raise RuntimeError("Execution context was destroyed")
+        return True
+
+    page.evaluate_handler = navigated_away
+    assert not asyncio.run(soft_navigate(page, NEXT_URL))
+
+
+def test_page_that_missed_a_route_is_not_soft_navigated_again():
+    page = RouterPage(renders=False)
+    assert not asyncio.run(soft_navigate(page, NEXT_URL, timeout=10))
+    page.renders = True
+    assert not asyncio.run(soft_navigate(page, NEXT_URL))
+    assert page.pushed == [NEXT_URL]
+
+    # Other pages still try it
+    assert asyncio.run(soft_navigate(RouterPage(), NEXT_URL))
+
+
+def test_soft_navigate_on_the_standin(chromium, standin):
+    from linkedin_scraper import BrowserManager
+
+    async def scenario():
+        async with BrowserManager(headless=True) as browser:
+            async with browser.lease_page() as page:
+                await page.goto(standin.profile_url("first-person"), wait_until="load")
+                moved = await soft_navigate(page, standin.profile_url("second-person"), ready_selector="main h1")
+                return moved, await page.inner_text("main h1")
+
+    moved, heading = asyncio.run(scenario())
+    assert moved
+    assert heading == "Second Person"
@@ -0,0 +1,126 @@
+"""Tests for the post-navigation checks (rate limits, dead pages) and skipping dead rows."""
+
+import asyncio
+from typing import Optional
+
+import pandas as pd
+import pytest
+
+from bulk_scrape import UNAVAILABLE_PREFIX, pending_rows
+from linkedin_scraper.core.exceptions import ProfileNotFoundError, RateLimitError
+from linkedin_scraper.core.utils import detect_rate_limit, inspect_navigation, rate_limit_stats
+
+from tests.fakes import FakePage
+
+PROFILE_URL = "https://www.linkedin.com/in/someone/"
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limit_stats():
+    rate_limit_stats.reset()
+    yield
+    rate_limit_stats.reset()
+
+
+class FakeRequest:
+    def __init__(self, url: str, redirected_from: Optional["FakeRequest"] = None):
+        self.url = url
+        self.redirected_from = redirected_from
+
+
+class FakeResponse:
+    """Navigation response that went through ``redirects`` before ``url``."""
+
+    def __init__(self, url: str, status: int = 200, redirects=()):
+        request = None
+        for hop in redirects:
+            request = FakeRequest(hop, request)
+        self.request = FakeRequest(url, request)
+        self.status = status
+
+
+def _page(url: str = PROFILE_URL, blocked=None, unavailable=None) -> FakePage:
+    page = FakePage(url=url)
+    page.evaluate_handler = lambda expression, arg: {"blocked": blocked, "unavailable": unavailable}
+    return page
+
+
+def test_clean_navigation_passes_in_one_page_check():
+    page = _page()
+    asyncio.run(inspect_navigation(page, FakeResponse(PROFILE_URL)))
+    assert page.evaluations == 1
+    assert rate_limit_stats.stats["checks"] == 1
+    assert rate_limit_stats.stats["detections"] == 0
+
+
+@pytest.mark.parametrize("status", [429, 999])
+def test_throttling_status_raises_rate_limit_without_a_page_check(status):
+    page = _page()
+    with pytest.raises(RateLimitError, match=f"HTTP {status}"):
+        asyncio.run(inspect_navigation(page, FakeResponse(PROFILE_URL, status)))
+    assert page.evaluations == 0
+    assert rate_limit_stats.stats["detections"] == 1
+
+
+def test_redirect_through_a_checkpoint_raises_rate_limit():
+    response = FakeResponse(PROFILE_URL, redirects=[PROFILE_URL, "https://www.linkedin.com/checkpoint/challenge/x"])
+    with pytest.raises(RateLimitError, match="checkpoint"):
+        asyncio.run(detect_rate_limit(_page(), response))
+
+
+def test_landing_on_a_checkpoint_raises_rate_limit():
+    page = _page(url="https://www.linkedin.com/checkpoint/challenge/x")
+    with pytest.raises(RateLimitError):
+        asyncio.run(detect_rate_limit(page))
+
+
+@pytest.mark.parametrize("blocked, message", [("captcha", "CAPTCHA"), ("slow down", "slow down")])
+def test_page_check_findings_raise_rate_limit(blocked, message):
+    with pytest.raises(RateLimitError, match=message):
+        asyncio.run(detect_rate_limit(_page(blocked=blocked), FakeResponse(PROFILE_URL)))
+
+
+def test_failed_page_check_still_runs_the_response_checks():
+    page = FakePage(url=PROFILE_URL)
+
+    def navigating_again(expression, arg):
+        raise RuntimeError("Execution context was destroyed")
+
+    page.evaluate_handler = navigating_again
+    asyncio.run(detect_rate_limit(page, FakeResponse(PROFILE_URL)))
+    with pytest.raises(RateLimitError):
+        asyncio.run(detect_rate_limit(page, FakeResponse(PROFILE_URL, 999)))
+
+
+@pytest.mark.parametrize("status", [404, 410])
+def test_not_found_status_raises_profile_not_found(status):
+    page = _page()
+    with pytest.raises(ProfileNotFoundError, match=f"HTTP {status}"):
+        asyncio.run(inspect_navigation(page, FakeResponse(PROFILE_URL, status)))
+    assert page.evaluations == 0
+
+
+@pytest.mark.parametrize("url", ["https://www.linkedin.com/in/unavailable/", "https://www.linkedin.com/404/"])
+def test_redirect_to_an_unavailable_page_raises_profile_not_found(url):
+    with pytest.raises(ProfileNotFoundError):
+        asyncio.run(inspect_navigation(_page(url=url), FakeResponse(url, redirects=[PROFILE_URL])))
+
+
+def test_unavailable_heading_raises_profile_not_found():
+    page = _page(unavailable="this page doesn't exist")
+    with pytest.raises(ProfileNotFoundError, match="doesn't exist"):
+        asyncio.run(inspect_navigation(page, FakeResponse(PROFILE_URL)))
+
+
+def test_rate_limit_check_alone_ignores_dead_pages():
+    page = _page(url="https://www.linkedin.com/in/unavailable/")
+    asyncio.run(detect_rate_limit(page, FakeResponse(page.url, 404)))
+    assert rate_limit_stats.stats["detections"] == 0
+
+
+def test_unavailable_rows_are_not_retried():
+    df = pd.DataFrame({
+        "URL": ["https://a", "https://b", "https://c", "https://d", None],
+        "Name": [None, "Jane Doe", "Error: timed out", f"{UNAVAILABLE_PREFIX} Page not found (HTTP 404)", None],
+    })
+    assert list(pending_rows(df, "URL")["URL"]) == ["https://a", "https://c"]
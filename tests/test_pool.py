@@ -0,0 +1,166 @@
+"""Tests for PagePool and ContextPool."""
+
+import asyncio
+
+import pytest
+
+from linkedin_scraper.core.exceptions import PageCrashedError, TaskTimeoutError
+from linkedin_scraper.core.pool import ContextPool, PagePool
+
+from tests.fakes import FakeContext
+
+
+def test_page_pool_reuses_released_pages():
+    async def scenario():
+        context = FakeContext()
+        pool = PagePool(context.new_page, size=2)
+        async with pool.lease() as first:
+            await first.goto("https://example.com/a")
+        async with pool.lease() as second:
+            pass
+        return pool, first, second
+
+    pool, first, second = asyncio.run(scenario())
+    assert second is first
+    # Reset to a blank document before it was handed out again
+    assert first.gotos[-1] == "about:blank"
+    assert pool.stats["pages_created"] == 1
+    assert pool.stats["leases"] == 2
+
+
+def test_page_pool_blocks_beyond_size_and_try_acquire_does_not():
+    async def scenario():
+        pool = PagePool(FakeContext().new_page, size=1)
+        page = await pool.acquire()
+        assert await pool.try_acquire() is None
+
+        waiter = asyncio.ensure_future(pool.acquire())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        await pool.release(page)
+        return page, await asyncio.wait_for(waiter, 1)
+
+    page, next_page = asyncio.run(scenario())
+    assert next_page is page
+
+
+def test_page_pool_recycles_after_max_uses():
+    async def scenario():
+        pool = PagePool(FakeContext().new_page, size=1, max_uses=2)
+        pages = []
+        for _ in range(3):
+            async with pool.lease() as page:
+                pages.append(page)
+        return pool, pages
+
+    pool, pages = asyncio.run(scenario())
+    assert pages[0] is pages[1]
+    assert pages[0].closed
+    assert pages[2] is not pages[0]
+    assert pool.stats["pages_recycled"] == 1
+
+
+@pytest.mark.parametrize("error", [PageCrashedError, TaskTimeoutError])
+def test_page_pool_discards_page_after_crash_or_hang(error):
+    async def scenario():
+        pool = PagePool(FakeContext().new_page, size=1)
+        with pytest.raises(error):
+            async with pool.lease() as page:
+                raise error("boom")
+        async with pool.lease() as replacement:
+            pass
+        return page, replacement
+
+    page, replacement = asyncio.run(scenario())
+    assert page.closed
+    assert replacement is not page
+
+
+def test_page_pool_skips_idle_pages_that_were_closed():
+    async def scenario():
+        pool = PagePool(FakeContext().new_page, size=1)
+        await pool.warm()
+        idle = pool._idle.get_nowait()
+        idle.closed = True
+        pool._idle.put_nowait(idle)
+        async with pool.lease() as page:
+            return idle, page
+
+    idle, page = asyncio.run(scenario())
+    assert page is not idle
+
+
+def test_page_pool_rejects_leases_after_close():
+    async def scenario():
+        pool = PagePool(FakeContext().new_page, size=1)
+        async with pool.lease() as page:
+            pass
+        await pool.close()
+        with pytest.raises(RuntimeError):
+            await pool.acquire()
+        return page
+
+    assert asyncio.run(scenario()).closed
+
+
+def _context_factory(created):
+    async def factory(storage_state):
+        context = FakeContext(storage_state)
+        created.append(context)
+        return context
+    return factory
+
+
+def test_context_pool_builds_contexts_from_the_in_memory_state():
+    state = {"cookies": [{"name": "li_at", "value": "1"}], "origins": []}
+    created = []
+
+    async def scenario():
+        pool = ContextPool(_context_factory(created), size=2, storage_state=state)
+        async with pool.lease() as first:
+            async with pool.lease() as second:
+                pass
+        async with pool.lease() as third:
+            pass
+        return first, second, third
+
+    first, second, third = asyncio.run(scenario())
+    assert len(created) == 2
+    assert first is not second
+    assert third in (first, second)
+    assert all(context.storage_state is state for context in created)
+
+
+def test_context_pool_discards_context_after_crash():
+    created = []
+
+    async def scenario():
+        pool = ContextPool(_context_factory(created), size=1)
+        with pytest.raises(PageCrashedError):
+            async with pool.lease():
+                raise PageCrashedError("renderer gone")
+        async with pool.lease() as replacement:
+            pass
+        return pool, replacement
+
+    pool, replacement = asyncio.run(scenario())
+    assert created[0].closed
+    assert replacement is created[1]
+    assert pool.stats["contexts_discarded"] == 1
+
+
+def test_context_pool_swaps_storage_state_into_live_contexts():
+    created = []
+    new_state = {"cookies": [{"name": "li_at", "value": "fresh"}], "origins": []}
+
+    async def scenario():
+        pool = ContextPool(_context_factory(created), size=2, storage_state={"cookies": [], "origins": []})
+        await pool.warm()
+        await pool.update_storage_state(new_state)
+        return pool
+
+    pool = asyncio.run(scenario())
+    assert pool.storage_state is new_state
+    assert [context.cookies for context in created] == [new_state["cookies"]] * 2
+    assert pool.stats["state_swaps"] == 1
@@ -0,0 +1,102 @@
+"""Tests for navigation prefetch in BaseScraper."""
+
+import asyncio
+
+import pytest
+
+from linkedin_scraper.core.deadline import Deadline
+from linkedin_scraper.core.exceptions import DeadlineExceededError, SessionExpiredError
+from linkedin_scraper.core.latency import LatencyTracker
+from linkedin_scraper.scrapers import base
+from linkedin_scraper.scrapers.base import BaseScraper
+
+from tests.fakes import FakePage
+
+URL = "https://www.linkedin.com/in/someone/"
+OTHER_URL = "https://www.linkedin.com/in/someone-else/"
+
+
+@pytest.fixture(autouse=True)
+def fresh_latency_tracker(monkeypatch):
+    monkeypatch.setattr(base, "latency_tracker", LatencyTracker())
+
+
+def _scraper(load_ms: float = 0) -> BaseScraper:
+    page = FakePage()
+    page.load_ms = {URL: load_ms}
+    # Nothing blocked or unavailable on the page after the load
+    page.evaluate_handler = lambda expression, arg: {"blocked": None, "unavailable": None}
+    return BaseScraper(page)
+
+
+def test_navigation_adopts_the_prefetch_of_the_same_url():
+    scraper = _scraper(load_ms=50)
+
+    async def scenario():
+        scraper.prefetch(URL, page_type="profile")
+        await asyncio.sleep(0.01)
+        await scraper.navigate_and_wait(URL, page_type="profile")
+
+    asyncio.run(scenario())
+    assert scraper.page.gotos == [URL]
+    assert scraper.page.url == URL
+    assert scraper._prefetch is None
+    assert base.latency_tracker.percentiles("profile")["count"] == 1
+
+
+def test_adopted_prefetch_raises_what_the_navigation_raised():
+    scraper = _scraper()
+    scraper.page.redirects = {URL: "https://www.linkedin.com/login?session_redirect=x"}
+
+    async def scenario():
+        scraper.prefetch(URL)
+        await scraper.navigate_and_wait(URL)
+
+    with pytest.raises(SessionExpiredError):
+        asyncio.run(scenario())
+
+
+def test_navigation_elsewhere_cancels_the_prefetch():
+    scraper = _scraper(load_ms=5000)
+
+    async def scenario():
+        scraper.prefetch(URL)
+        task = scraper._prefetch[1]
+        await asyncio.sleep(0.01)
+        await scraper.navigate_and_wait(OTHER_URL)
+        await asyncio.sleep(0)
+        return task
+
+    task = asyncio.run(scenario())
+    assert task.cancelled()
+    assert scraper.page.gotos == [URL, OTHER_URL]
+    assert scraper.page.url == OTHER_URL
+
+
+def test_cancel_prefetch_stops_an_unadopted_load():
+    scraper = _scraper(load_ms=5000)
+
+    async def scenario():
+        scraper.prefetch(URL)
+        task = scraper._prefetch[1]
+        await asyncio.sleep(0.01)
+        scraper.cancel_prefetch()
+        await asyncio.sleep(0)
+        return task
+
+    assert asyncio.run(scenario()).cancelled()
+    assert scraper._prefetch is None
+    scraper.cancel_prefetch()
+
+
+def test_adopting_a_prefetch_is_bounded_by_the_budget():
+    scraper = _scraper(load_ms=5000)
+    scraper.deadline = Deadline(0.05)
+
+    async def scenario():
+        scraper.prefetch(URL)
+        await scraper.navigate_and_wait(URL)
+
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(scenario())
+    assert scraper.deadline.cut_short
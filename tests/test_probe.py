@@ -0,0 +1,113 @@
+"""Tests for instant element probes."""
+
+import asyncio
+import time
+
+import pytest
+
+from linkedin_scraper.core.probe import probe, probe_stats
+from linkedin_scraper.core.utils import extract_text_safe
+from linkedin_scraper.scrapers.base import BaseScraper
+
+from tests.fakes import FakePage
+
+
+@pytest.fixture(autouse=True)
+def reset_probe_stats():
+    probe_stats.reset()
+    yield
+    probe_stats.reset()
+
+
+class LocatorPage(FakePage):
+    """FakePage whose querySelector rejects Playwright-only selectors, like the browser does."""
+
+    def __init__(self, texts):
+        super().__init__()
+        self.texts = texts
+        self.evaluate_handler = self._evaluate
+
+    def _evaluate(self, expression, arg):
+        raise RuntimeError(f"'{arg[0]}' is not a valid selector")
+
+    def locator(self, selector):
+        return FakeLocator(self.texts.get(selector))
+
+
+class FakeLocator:
+    def __init__(self, text):
+        self.text = text
+
+    @property
+    def first(self):
+        return self
+
+    async def count(self):
+        return 0 if self.text is None else 1
+
+    async def text_content(self):
+        return self.text
+
+    async def inner_text(self):
+        return self.text
+
+    async def get_attribute(self, name):
+        return None
+
+
+def test_present_element_is_read_in_one_query():
+    page = FakePage()
+    page.elements = {"h1": {"text": "Jane Doe", "attribute": None}}
+    assert asyncio.run(probe(page, "h1")) == {"text": "Jane Doe", "attribute": None}
+    assert page.evaluations == 1
+    assert page.selector_waits == 0
+    assert probe_stats.stats["hits"] == 1
+
+
+def test_absent_element_returns_at_once():
+    page = FakePage()
+    start = time.monotonic()
+    assert asyncio.run(probe(page, ".pv-about")) is None
+    assert time.monotonic() - start < 0.5
+    assert page.selector_waits == 0
+    assert probe_stats.stats["misses"] == 1
+    assert probe_stats.stats["absent_wait_ms"] == 0
+
+
+def test_explicit_timeout_waits_and_counts_the_time_lost():
+    page = FakePage()
+    assert asyncio.run(probe(page, ".pv-about", timeout=50)) is None
+    assert page.selector_waits == 1
+    stats = probe_stats.stats
+    assert stats["waits"] == 1
+    assert stats["absent_wait_ms"] >= 50
+
+
+def test_playwright_selectors_fall_back_to_a_locator():
+    page = LocatorPage({"text=About": "About"})
+    assert asyncio.run(probe(page, "text=About")) == {"text": "About", "attribute": None}
+    assert asyncio.run(probe(page, "text=Missing")) is None
+    assert probe_stats.stats["hits"] == 1
+    assert probe_stats.stats["misses"] == 1
+
+
+def test_extract_text_safe_strips_and_defaults():
+    page = FakePage()
+    page.elements = {"h1": {"text": "  Jane Doe \n", "attribute": None}, "h2": {"text": "", "attribute": None}}
+    assert asyncio.run(extract_text_safe(page, "h1")) == "Jane Doe"
+    assert asyncio.run(extract_text_safe(page, "h2", default="n/a")) == "n/a"
+    assert asyncio.run(extract_text_safe(page, "h3", default="n/a")) == "n/a"
+
+
+def test_scraper_helpers_do_not_wait_for_absent_elements():
+    page = FakePage()
+    scraper = BaseScraper(page)
+
+    async def scenario():
+        return (
+            await scraper.element_exists(".pv-about"),
+            await scraper.safe_extract_text(".pv-about", default="-"),
+        )
+
+    assert asyncio.run(scenario()) == (False, "-")
+    assert page.selector_waits == 0
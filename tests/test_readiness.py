@@ -0,0 +1,113 @@
+"""Tests for the readiness waits."""
+
+import asyncio
+
+import pytest
+
+from linkedin_scraper.core.deadline import Deadline
+from linkedin_scraper.core.readiness import READINESS_PRESETS, get_readiness_preset, wait_until_ready
+from linkedin_scraper.scrapers.base import BaseScraper
+
+from tests.fakes import FakePage
+
+
+def _ready_page(ready: bool = True) -> FakePage:
+    """FakePage whose readiness script resolves at once and records its arguments."""
+    page = FakePage()
+    page.calls = []
+
+    def handler(expression, arg):
+        page.calls.append(arg)
+        return {"ready": ready, "elapsed_ms": 10 if ready else arg["capMs"]}
+
+    page.evaluate_handler = handler
+    return page
+
+
+def test_unknown_preset_is_rejected():
+    assert get_readiness_preset("details") is READINESS_PRESETS["details"]
+    with pytest.raises(ValueError, match="Available"):
+        get_readiness_preset("feed")
+
+
+def test_preset_is_passed_to_the_page_in_one_evaluate():
+    page = _ready_page()
+    result = asyncio.run(wait_until_ready(page, "details"))
+
+    assert result["ready"]
+    assert page.evaluations == 1
+    preset = READINESS_PRESETS["details"]
+    assert page.calls[0] == {
+        "selector": preset["selector"],
+        "items": preset["items"],
+        "responses": [],
+        "root": preset["root"],
+        "quietMs": preset["quiet_ms"],
+        "capMs": preset["cap_ms"],
+    }
+
+
+def test_cap_and_overrides_replace_preset_fields():
+    page = _ready_page()
+    asyncio.run(wait_until_ready(page, "profile", cap_ms=500, selector="main h2", responses=("/voyager/",)))
+
+    args = page.calls[0]
+    assert args["capMs"] == 500
+    assert args["selector"] == "main h2"
+    assert args["responses"] == ["/voyager/"]
+    # The preset itself is left alone
+    assert READINESS_PRESETS["profile"]["selector"] == "main h1"
+
+
+def test_interrupted_wait_returns_not_ready_instead_of_raising():
+    page = FakePage()
+
+    def navigated_away(expression, arg):
+        raise RuntimeError("Execution context was destroyed")
+
+    page.evaluate_handler = navigated_away
+    result = asyncio.run(wait_until_ready(page, "profile"))
+    assert result["ready"] is False
+    assert result["elapsed_ms"] is None
+    assert "destroyed" in result["error"]
+
+
+def test_scraper_clamps_the_cap_to_its_deadline():
+    page = _ready_page(ready=False)
+    scraper = BaseScraper(page)
+    scraper.deadline = Deadline(1)
+
+    assert not asyncio.run(scraper.wait_until_ready("details"))
+    assert page.calls[0]["capMs"] <= 1000
+    assert scraper.deadline.cut_short
+
+
+def test_scraper_skips_the_wait_once_the_deadline_passed():
+    page = _ready_page()
+    scraper = BaseScraper(page)
+    scraper.deadline = Deadline(0)
+
+    assert not asyncio.run(scraper.wait_until_ready("profile"))
+    assert page.evaluations == 0
+    assert scraper.deadline.cut_short
+
+
+def test_ready_page_does_not_cut_the_scrape_short():
+    scraper = BaseScraper(_ready_page())
+    scraper.deadline = Deadline(60)
+    assert asyncio.run(scraper.wait_until_ready("profile"))
+    assert not scraper.deadline.cut_short
+
+
+def test_profile_preset_on_the_standin(chromium, standin):
+    from linkedin_scraper import BrowserManager
+
+    async def scenario():
+        async with BrowserManager(headless=True) as browser:
+            async with browser.lease_page() as page:
+                await page.goto(standin.profile_url("ready-person"), wait_until="domcontentloaded")
+                return await wait_until_ready(page, "profile")
+
+    result = asyncio.run(scenario())
+    assert result["ready"]
+    assert result["elapsed_ms"] < READINESS_PRESETS["profile"]["cap_ms"]
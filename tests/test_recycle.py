@@ -0,0 +1,72 @@
+"""Tests for RecycleBudget."""
+
+import os
+
+import pytest
+
+from linkedin_scraper.core import recycle
+from linkedin_scraper.core.recycle import RecycleBudget
+
+
+@pytest.fixture
+def rss(monkeypatch):
+    """Replace the /proc walk with a settable RSS value and count samples."""
+    state = {"bytes": 0, "samples": 0}
+
+    def fake_chromium_rss(root_pid=None):
+        state["samples"] += 1
+        return state["bytes"]
+
+    monkeypatch.setattr(recycle, "chromium_rss", fake_chromium_rss)
+    return state
+
+
+def test_no_limits_means_disabled_and_never_exceeded(rss):
+    budget = RecycleBudget()
+    assert not budget.enabled
+    assert budget.exceeded(10_000) is None
+    assert rss["samples"] == 0
+
+
+def test_page_budget(rss):
+    budget = RecycleBudget(max_pages=50)
+    assert budget.enabled
+    assert budget.exceeded(49) is None
+    assert "50/50 pages" in budget.exceeded(50)
+
+
+def test_memory_budget(rss):
+    budget = RecycleBudget(max_rss_mb=100, check_interval=0)
+    rss["bytes"] = 90 * 1024 * 1024
+    assert budget.exceeded(0) is None
+    rss["bytes"] = 120 * 1024 * 1024
+    assert "120/100 MB" in budget.exceeded(0)
+    assert budget.last_rss == rss["bytes"]
+
+
+def test_rss_is_sampled_at_most_once_per_interval(rss):
+    budget = RecycleBudget(max_rss_mb=100, check_interval=3600)
+    budget.exceeded(0)
+    budget.exceeded(0)
+    assert rss["samples"] == 1
+
+    # A relaunch restarts the interval instead of sampling right away
+    budget.reset()
+    budget.exceeded(0)
+    assert rss["samples"] == 1
+    assert budget.last_rss is None
+
+
+def test_missing_proc_never_exceeds_the_memory_budget(monkeypatch):
+    monkeypatch.setattr(recycle, "chromium_rss", lambda root_pid=None: None)
+    budget = RecycleBudget(max_rss_mb=1, check_interval=0)
+    assert budget.exceeded(0) is None
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc"), reason="needs /proc")
+def test_proc_helpers_read_this_process():
+    ppid, name = recycle._read_ppid_and_name(os.getpid())
+    assert ppid == os.getppid()
+    assert name
+    assert recycle._read_rss(os.getpid()) > 0
+    assert recycle.chromium_rss() >= 0
@@ -0,0 +1,136 @@
+"""Tests for RequestRouter."""
+
+import asyncio
+
+import pytest
+
+from linkedin_scraper.core.routing import DEFAULT_RESOURCE_SIZES, ROUTING_PROFILES, RequestRouter
+
+
+class FakeRequest:
+    def __init__(self, url: str, resource_type: str):
+        self.url = url
+        self.resource_type = resource_type
+
+
+class FakeRoute:
+    def __init__(self):
+        self.outcome = None
+
+    async def abort(self, error_code: str = "failed") -> None:
+        self.outcome = "aborted"
+
+    async def fallback(self) -> None:
+        self.outcome = "fallback"
+
+
+class FakeResponse:
+    def __init__(self, resource_type: str, length: str):
+        self.request = FakeRequest("https://static.licdn.com/x", resource_type)
+        self.headers = {"content-length": length}
+
+
+def handle(router: RequestRouter, url: str, resource_type: str) -> str:
+    route = FakeRoute()
+    asyncio.run(router._handle(route, FakeRequest(url, resource_type)))
+    return route.outcome
+
+
+@pytest.mark.parametrize("resource_type", ["image", "media", "font", "stylesheet"])
+def test_text_only_blocks_heavy_resource_types(resource_type):
+    router = RequestRouter.from_profile("text-only")
+    assert router.should_block("https://media.licdn.com/x", resource_type)
+
+
+@pytest.mark.parametrize("resource_type", ["document", "script", "xhr", "fetch"])
+def test_text_only_keeps_what_the_scrapers_read(resource_type):
+    router = RequestRouter.from_profile("text-only")
+    assert not router.should_block("https://www.linkedin.com/in/someone/", resource_type)
+
+
+def test_no_media_keeps_stylesheets():
+    router = RequestRouter.from_profile("no-media")
+    assert router.should_block("https://media.licdn.com/a.jpg", "image")
+    assert not router.should_block("https://static.licdn.com/a.css", "stylesheet")
+
+
+def test_trackers_are_blocked_whatever_their_type():
+    router = RequestRouter.from_profile("no-media")
+    assert router.should_block("https://www.google-analytics.com/collect?v=1", "script")
+    assert router.should_block("https://px.ads.linkedin.com/collect", "xhr")
+
+
+def test_allow_patterns_win_over_block_rules():
+    router = RequestRouter.from_profile("text-only", allow_patterns=["*/needed-logo.png"])
+    assert not router.should_block("https://media.licdn.com/needed-logo.png", "image")
+    assert router.should_block("https://media.licdn.com/other.png", "image")
+
+
+def test_extra_rules_extend_the_profile():
+    router = RequestRouter.from_profile("full", block_types=["image"], block_patterns=["*/beacon*"])
+    assert router.should_block("https://example.com/a.png", "image")
+    assert router.should_block("https://example.com/beacon?x=1", "xhr")
+    assert not ROUTING_PROFILES["full"]["block_types"]
+
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError):
+        RequestRouter.from_profile("nothing")
+
+
+def test_full_profile_is_passthrough():
+    assert RequestRouter.from_profile("full").is_passthrough
+    assert not RequestRouter.from_profile("text-only").is_passthrough
+
+
+def test_handler_counts_blocked_and_allowed_requests():
+    router = RequestRouter.from_profile("text-only")
+    assert handle(router, "https://media.licdn.com/a.jpg", "image") == "aborted"
+    assert handle(router, "https://media.licdn.com/b.jpg", "image") == "aborted"
+    assert handle(router, "https://www.linkedin.com/in/x/", "document") == "fallback"
+
+    stats = router.stats
+    assert stats["blocked"] == 2
+    assert stats["allowed"] == 1
+    assert stats["blocked_by_type"] == {"image": 2}
+    assert stats["allowed_by_type"] == {"document": 1}
+
+
+def test_bytes_saved_prefers_observed_sizes():
+    router = RequestRouter.from_profile("text-only")
+    handle(router, "https://media.licdn.com/a.jpg", "image")
+    handle(router, "https://static.licdn.com/f.woff2", "font")
+    assert router.bytes_saved == DEFAULT_RESOURCE_SIZES["image"] + DEFAULT_RESOURCE_SIZES["font"]
+
+    router._on_response(FakeResponse("image", "1000"))
+    router._on_response(FakeResponse("image", "3000"))
+    router._on_response(FakeResponse("image", "unknown"))
+    assert router.bytes_allowed == 4000
+    assert router.bytes_saved == 2000 + DEFAULT_RESOURCE_SIZES["font"]
+
+
+def test_reset_stats():
+    router = RequestRouter.from_profile("text-only")
+    handle(router, "https://media.licdn.com/a.jpg", "image")
+    router.reset_stats()
+    assert router.stats["blocked"] == 0
+    assert router.stats["blocked_by_type"] == {}
+
+
+def test_text_only_profile_against_the_standin(chromium, standin):
+    from linkedin_scraper import BrowserManager
+
+    async def load(profile: str) -> dict:
+        async with BrowserManager(headless=True, routing_profile=profile) as browser:
+            async with browser.lease_page() as page:
+                await page.goto(standin.profile_url("router-test"), wait_until="load")
+                assert await page.locator("main h1").count() == 1
+            return browser.router.stats
+
+    full = asyncio.run(load("full"))
+    text_only = asyncio.run(load("text-only"))
+
+    assert full["blocked"] == 0
+    assert text_only["blocked_by_type"].get("image", 0) > 0
+    assert text_only["blocked_by_type"].get("stylesheet", 0) > 0
+    assert "document" in text_only["allowed_by_type"]
@@ -0,0 +1,105 @@
+"""Tests for the in-page scroll-to-load loader."""
+
+import asyncio
+
+from linkedin_scraper.core.deadline import Deadline
+from linkedin_scraper.core.utils import scroll_to_bottom, scroll_to_load
+from linkedin_scraper.scrapers.base import BaseScraper
+
+from tests.fakes import FakePage
+
+# A list that appends five items per scroll until it holds 30
+LAZY_LIST_HTML = """
+<ul id="list"></ul>
+<div style="height: 2000px"></div>
+<script>
+const list = document.getElementById('list');
+const add = () => {
+    for (let i = 0; i < 5 && list.children.length < 30; i++) {
+        const item = document.createElement('li');
+        item.className = 'item';
+        item.style.height = '200px';
+        list.appendChild(item);
+    }
+};
+add();
+window.addEventListener('scroll', () => setTimeout(add, 50));
+</script>
+"""
+
+
+def _loader_page(reason: str = "idle", items: int = 12) -> FakePage:
+    """FakePage whose loader script resolves at once and records its arguments."""
+    page = FakePage()
+    page.calls = []
+
+    def handler(expression, arg):
+        page.calls.append(arg)
+        return {"initial_items": 3, "items": items, "scrolls": 4, "elapsed_ms": 900, "reason": reason}
+
+    page.evaluate_handler = handler
+    return page
+
+
+def test_loader_runs_in_one_evaluate_with_its_limits():
+    page = _loader_page()
+    result = asyncio.run(scroll_to_load(page, "li.item", idle_ms=500, max_ms=8000, max_items=50))
+
+    assert result["items"] == 12
+    assert page.evaluations == 1
+    assert page.calls[0] == {"items": "li.item", "idleMs": 500, "maxMs": 8000, "maxItems": 50, "maxScrolls": None}
+
+
+def test_interrupted_loader_reports_an_error_result():
+    page = FakePage()
+
+    def navigated_away(expression, arg):
+        raise RuntimeError("Execution context was destroyed")
+
+    page.evaluate_handler = navigated_away
+    result = asyncio.run(scroll_to_load(page, "li.item"))
+    assert result["reason"] == "error"
+    assert result["items"] is None
+
+
+def test_scroll_to_bottom_watches_page_height_with_a_derived_cap():
+    page = _loader_page()
+    asyncio.run(scroll_to_bottom(page, pause_time=0.5, max_scrolls=4))
+    assert page.calls[0] == {"items": None, "idleMs": 500, "maxMs": 7000, "maxItems": None, "maxScrolls": 4}
+
+
+def test_load_all_items_clamps_the_cap_to_the_deadline():
+    page = _loader_page(reason="cap")
+    scraper = BaseScraper(page)
+    scraper.deadline = Deadline(2)
+
+    assert asyncio.run(scraper.load_all_items("li.item", max_ms=20000)) == 12
+    assert page.calls[0]["maxMs"] <= 2000
+    assert scraper.deadline.cut_short
+
+
+def test_load_all_items_skips_the_loader_once_the_deadline_passed():
+    page = _loader_page()
+    scraper = BaseScraper(page)
+    scraper.deadline = Deadline(0)
+
+    assert asyncio.run(scraper.load_all_items("li.item")) is None
+    assert page.evaluations == 0
+
+
+def test_loader_loads_a_lazy_list_in_chromium(chromium):
+    from playwright.async_api import async_playwright
+
+    async def scenario():
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch()
+            page = await browser.new_page()
+            await page.set_content(LAZY_LIST_HTML)
+            result = await scroll_to_load(page, "li.item", idle_ms=500, max_ms=10000)
+            await browser.close()
+            return result
+
+    result = asyncio.run(scenario())
+    assert result["initial_items"] == 5
+    assert result["items"] == 30
+    assert result["reason"] == "idle"
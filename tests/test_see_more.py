@@ -0,0 +1,111 @@
+"""Tests for the in-page 'See more' expansion."""
+
+import asyncio
+import re
+
+import pytest
+
+from linkedin_scraper.core.deadline import Deadline
+from linkedin_scraper.core.utils import SEE_MORE_CONTAINER, SEE_MORE_PATTERN, click_see_more_buttons, expand_see_more_buttons
+from linkedin_scraper.scrapers.base import BaseScraper
+
+from tests.fakes import FakePage
+
+
+def _expander_page(clicked: int = 3, reason: str = "done") -> FakePage:
+    """FakePage whose expander reports ``clicked`` buttons and records its arguments."""
+    page = FakePage()
+    page.calls = []
+
+    def expand(expression, arg):
+        page.calls.append(arg)
+        return {"clicked": clicked, "pending": 0, "rounds": 1, "reason": reason, "elapsed_ms": 12}
+
+    page.evaluate_handler = expand
+    return page
+
+
+def test_expansion_runs_in_a_single_evaluate():
+    page = _expander_page()
+    result = asyncio.run(expand_see_more_buttons(page, max_buttons=4, idle_ms=100, max_ms=2000))
+    assert result["clicked"] == 3
+    assert result["reason"] == "done"
+    assert page.evaluations == 1
+    assert page.calls == [{
+        "pattern": SEE_MORE_PATTERN, "container": SEE_MORE_CONTAINER, "maxButtons": 4, "idleMs": 100, "maxMs": 2000,
+    }]
+
+
+@pytest.mark.parametrize("text", ["See more", "…see more", "  Show all 12 experiences", "Show more results"])
+def test_see_more_labels_match(text):
+    assert re.search(SEE_MORE_PATTERN, text, re.IGNORECASE)
+
+
+@pytest.mark.parametrize("text", ["Follow to see more posts", "Show less", "Showcase", "Messaging"])
+def test_buttons_that_only_mention_the_label_do_not_match(text):
+    assert not re.search(SEE_MORE_PATTERN, text, re.IGNORECASE)
+
+
+def test_failed_expansion_reports_an_error_instead_of_raising():
+    page = FakePage()
+
+    def navigated_away(expression, arg):
+        raise RuntimeError("Execution context was destroyed")
+
+    page.evaluate_handler = navigated_away
+    result = asyncio.run(expand_see_more_buttons(page))
+    assert result["reason"] == "error"
+    assert result["clicked"] == 0
+
+
+def test_click_see_more_buttons_returns_the_clicked_count():
+    page = _expander_page(clicked=2)
+    assert asyncio.run(click_see_more_buttons(page, max_attempts=5)) == 2
+    assert page.calls[0]["maxButtons"] == 5
+
+
+def test_scraper_expansion_is_clamped_to_the_budget():
+    scraper = BaseScraper(_expander_page(reason="cap"))
+    scraper.deadline = Deadline(1)
+    assert asyncio.run(scraper.click_all_see_more_buttons()) == 3
+    assert scraper.page.calls[0]["maxMs"] <= 1000
+    assert scraper.deadline.cut_short
+
+
+def test_scraper_skips_expansion_once_the_budget_is_spent():
+    scraper = BaseScraper(_expander_page())
+    scraper.deadline = Deadline(0)
+    assert asyncio.run(scraper.click_all_see_more_buttons()) == 0
+    assert scraper.page.evaluations == 0
+    assert scraper.deadline.cut_short
+
+
+EXPANDABLE_PAGE = """
+<nav><button onclick="this.dataset.clicked = 1">Show more</button></nav>
+<main>
+  <section>
+    <p id="about">Short</p>
+    <button onclick="document.getElementById('about').textContent = 'Long'; this.textContent = 'Show less'">…see more</button>
+    <button onclick="this.dataset.clicked = 1">Follow to see more posts</button>
+  </section>
+</main>
+<aside><button onclick="this.dataset.clicked = 1">Show all</button></aside>
+"""
+
+
+def test_only_section_see_more_buttons_are_expanded(chromium):
+    from linkedin_scraper import BrowserManager
+
+    async def scenario():
+        async with BrowserManager(headless=True) as browser:
+            async with browser.lease_page() as page:
+                await page.set_content(EXPANDABLE_PAGE)
+                result = await expand_see_more_buttons(page, idle_ms=50)
+                others = await page.evaluate("document.querySelectorAll('[data-clicked]').length")
+                return result, await page.inner_text("#about"), others
+
+    result, about, others = asyncio.run(scenario())
+    assert result["clicked"] == 1
+    assert result["pending"] == 0
+    assert about == "Long"
+    assert others == 0
@@ -0,0 +1,148 @@
+"""Tests for SessionHealth."""
+
+import asyncio
+import json
+import os
+
+import pytest
+
+from linkedin_scraper.core.exceptions import RateLimitError, SessionExpiredError
+from linkedin_scraper.core.session_health import SessionHealth
+from linkedin_scraper.scrapers.person import PersonScraper
+
+from tests.fakes import FakePage
+
+
+class FakeBrowser:
+    """Browser whose reload_session() parses the file like BrowserManager does."""
+
+    def __init__(self):
+        self.reloads = []
+
+    async def reload_session(self, session_file: str) -> None:
+        with open(session_file) as f:
+            self.reloads.append(json.load(f))
+
+
+def _write_session(path, value: str, mtime: float) -> None:
+    path.write_text(json.dumps({"cookies": [{"name": "li_at", "value": value}], "origins": []}))
+    os.utime(path, (mtime, mtime))
+
+
+def test_workers_pause_until_the_session_file_is_refreshed(tmp_path):
+    session_file = tmp_path / "session.json"
+    _write_session(session_file, "old", 1000)
+    browser = FakeBrowser()
+
+    async def scenario():
+        health = SessionHealth(browser, str(session_file), poll_interval=0.01, max_wait=5)
+        # Three workers hit the login redirect at about the same time
+        reports = [asyncio.ensure_future(health.report_expired("authwall")) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        assert health.paused
+        assert not any(report.done() for report in reports)
+
+        waiter = asyncio.ensure_future(health.wait_healthy())
+        _write_session(session_file, "new", 2000)
+        results = await asyncio.wait_for(asyncio.gather(*reports), 1)
+        await asyncio.wait_for(waiter, 1)
+        return health, results
+
+    health, results = asyncio.run(scenario())
+    assert results == [True, True, True]
+    assert not health.paused
+    assert [state["cookies"][0]["value"] for state in browser.reloads] == ["new"]
+    assert health.stats["expiries"] == 1
+    assert health.stats["reloads"] == 1
+    assert health.stats["paused_seconds"] > 0
+
+
+def test_half_written_file_is_retried_on_the_next_poll(tmp_path):
+    session_file = tmp_path / "session.json"
+    _write_session(session_file, "old", 1000)
+    browser = FakeBrowser()
+
+    async def scenario():
+        health = SessionHealth(browser, str(session_file), poll_interval=0.01, max_wait=5)
+        report = asyncio.ensure_future(health.report_expired())
+        session_file.write_text('{"cookies": [')
+        os.utime(session_file, (1500, 1500))
+        await asyncio.sleep(0.05)
+        assert not report.done()
+
+        _write_session(session_file, "new", 2000)
+        return await asyncio.wait_for(report, 1)
+
+    assert asyncio.run(scenario())
+    assert len(browser.reloads) == 1
+
+
+def test_row_started_before_the_last_reload_is_just_retried(tmp_path):
+    session_file = tmp_path / "session.json"
+    _write_session(session_file, "old", 1000)
+
+    async def scenario():
+        health = SessionHealth(FakeBrowser(), str(session_file))
+        health.reloads = 1
+        return health, await health.report_expired(generation=0)
+
+    health, retry = asyncio.run(scenario())
+    assert retry
+    assert health.expiries == 0
+    assert not health.paused
+
+
+def test_gives_up_when_no_refreshed_file_appears(tmp_path):
+    session_file = tmp_path / "session.json"
+    _write_session(session_file, "old", 1000)
+
+    async def scenario():
+        health = SessionHealth(FakeBrowser(), str(session_file), poll_interval=0.01, max_wait=0.05)
+        first = await health.report_expired()
+        second = await health.report_expired()
+        return health, first, second
+
+    health, first, second = asyncio.run(scenario())
+    assert (first, second) == (False, False)
+    assert health.gave_up
+    assert not health.paused
+    assert health.expiries == 1
+
+
+def test_close_releases_paused_workers(tmp_path):
+    async def scenario():
+        health = SessionHealth(FakeBrowser(), str(tmp_path / "missing.json"), poll_interval=0.01, max_wait=None)
+        report = asyncio.ensure_future(health.report_expired())
+        await asyncio.sleep(0.03)
+        await health.close()
+        return await asyncio.wait_for(report, 1), health
+
+    retry, health = asyncio.run(scenario())
+    assert retry
+    assert not health.paused
+
+
+PROFILE_URL = "https://www.linkedin.com/in/someone/"
+
+
+def _details_scraper(redirect_to: str, blocked=None) -> PersonScraper:
+    """PersonScraper whose details pages redirect to ``redirect_to``."""
+    page = FakePage()
+    for section in ("experience", "education"):
+        page.redirects[f"{PROFILE_URL}details/{section}"] = redirect_to
+    page.evaluate_handler = lambda expression, arg: {"blocked": blocked, "unavailable": None}
+    return PersonScraper(page)
+
+
+@pytest.mark.parametrize("section", ["_get_experiences", "_get_educations"])
+def test_session_expiring_on_a_details_page_fails_the_row(section):
+    scraper = _details_scraper("https://www.linkedin.com/login?session_redirect=x")
+    with pytest.raises(SessionExpiredError):
+        asyncio.run(getattr(scraper, section)(PROFILE_URL))
+
+
+@pytest.mark.parametrize("section", ["_get_experiences", "_get_educations"])
+def test_rate_limit_on_a_details_page_fails_the_row(section):
+    scraper = _details_scraper(f"{PROFILE_URL}details/x", blocked="too many requests")
+    with pytest.raises(RateLimitError):
+        asyncio.run(getattr(scraper, section)(PROFILE_URL))
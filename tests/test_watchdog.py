@@ -0,0 +1,147 @@
+"""Tests for PageWatchdog."""
+
+import asyncio
+
+import pytest
+
+from linkedin_scraper.core.exceptions import PageCrashedError, TaskTimeoutError
+from linkedin_scraper.core.watchdog import PageWatchdog, unwatch_page, watch_page
+
+from tests.fakes import FakePage
+
+
+async def _emit_later(page: FakePage, event: str, delay: float = 0.02) -> None:
+    await asyncio.sleep(delay)
+    page.emit(event)
+
+
+def test_completed_task_returns_its_result_and_detaches():
+    page = FakePage()
+    watchdog = PageWatchdog(task_timeout=1)
+
+    async def task():
+        await asyncio.sleep(0.01)
+        return "done"
+
+    assert asyncio.run(watchdog.run(page, task())) == "done"
+    assert page.listener_count() == 0
+    assert watchdog.completed == 1
+    assert watchdog.busy_seconds > 0
+
+
+def test_task_errors_propagate_and_count_as_failed():
+    watchdog = PageWatchdog(task_timeout=1)
+
+    async def task():
+        raise ValueError("parse failed")
+
+    with pytest.raises(ValueError):
+        asyncio.run(watchdog.run(FakePage(), task()))
+    assert watchdog.failed == 1
+    assert watchdog.completed == 0
+
+
+def test_task_failing_on_a_closed_page_raises_page_crashed():
+    page = FakePage()
+    watchdog = PageWatchdog(task_timeout=1)
+
+    async def task():
+        # Playwright's call fails before the close event reaches the watchdog
+        page.closed = True
+        raise RuntimeError("Target page, context or browser has been closed")
+
+    with pytest.raises(PageCrashedError):
+        asyncio.run(watchdog.run(page, task()))
+    assert watchdog.crashes == 1
+    assert watchdog.failed == 0
+
+
+def test_task_failing_after_a_crash_event_raises_page_crashed():
+    page = FakePage()
+    watchdog = PageWatchdog(task_timeout=1)
+
+    async def task():
+        page.emit("crash")
+        raise RuntimeError("Target crashed")
+
+    with pytest.raises(PageCrashedError, match="crashed"):
+        asyncio.run(watchdog.run(page, task()))
+    assert watchdog.crashes == 1
+
+
+@pytest.mark.parametrize("event", ["crash", "close"])
+def test_crash_or_close_abandons_the_task(event):
+    page = FakePage()
+    watchdog = PageWatchdog(task_timeout=5, cancel_grace=0.1)
+    cancelled = []
+
+    async def task():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def scenario():
+        emitter = asyncio.ensure_future(_emit_later(page, event))
+        try:
+            await watchdog.run(page, task())
+        finally:
+            await emitter
+
+    with pytest.raises(PageCrashedError):
+        asyncio.run(scenario())
+    assert cancelled == [True]
+    assert watchdog.crashes == 1
+    assert page.listener_count() == 0
+
+
+def test_hung_task_times_out():
+    watchdog = PageWatchdog(task_timeout=0.05, cancel_grace=0.1)
+
+    with pytest.raises(TaskTimeoutError):
+        asyncio.run(watchdog.run(FakePage(), asyncio.sleep(10)))
+    assert watchdog.timeouts == 1
+    assert watchdog.lost_seconds >= 0.05
+
+
+def test_watched_spare_page_is_supervised_until_unwatched():
+    page, spare = FakePage(), FakePage()
+    watchdog = PageWatchdog(task_timeout=5, cancel_grace=0.1)
+
+    async def moves_to_spare_and_back():
+        watch_page(spare)
+        await asyncio.sleep(0.01)
+        unwatch_page(spare)
+        spare.emit("close")
+        return "ok"
+
+    async def moves_to_spare_that_dies():
+        watch_page(spare)
+        asyncio.ensure_future(_emit_later(spare, "crash"))
+        await asyncio.sleep(10)
+
+    assert asyncio.run(watchdog.run(page, moves_to_spare_and_back())) == "ok"
+    assert spare.listener_count() == 0
+
+    with pytest.raises(PageCrashedError):
+        asyncio.run(watchdog.run(page, moves_to_spare_that_dies()))
+    assert spare.listener_count() == 0
+    assert page.listener_count() == 0
+
+
+def test_watch_page_outside_a_run_is_a_no_op():
+    page = FakePage()
+    watch_page(page)
+    unwatch_page(page)
+    assert page.listener_count() == 0
+
+
+def test_report_splits_worker_time():
+    watchdog = PageWatchdog()
+    watchdog.busy_seconds = 30.0
+    watchdog.lost_seconds = 10.0
+    report = watchdog.report(workers=2, wall_seconds=50)
+    assert report["utilization"] == 0.3
+    assert report["lost_ratio"] == 0.1
+    assert watchdog.report(workers=0, wall_seconds=0)["utilization"] == 0.0